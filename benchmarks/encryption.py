@@ -0,0 +1,71 @@
+"""Compares loading a stream of plain and of encrypted events.
+
+Run with `poetry run python -m benchmarks.encryption` (requires `cryptography`).
+"""
+
+from timeit import timeit
+from typing import Annotated
+
+from event_sourcery import Event, EventStore, StreamId
+from event_sourcery.backend import InMemoryBackend, InMemoryKeyStorage
+from event_sourcery.encryption import (
+    AesGcmEncryptionStrategy,
+    DataSubject,
+    Encrypted,
+)
+
+EVENTS = 1_000
+ROUNDS = 20
+
+
+class CustomerRegistered(Event):
+    customer_id: str
+    email: str
+    name: str
+    phone: str
+    birth_year: int
+    tags: list[str]
+
+
+class PrivateCustomerRegistered(Event):
+    customer_id: Annotated[str, DataSubject]
+    email: Annotated[str, Encrypted(mask_value="")]
+    name: Annotated[str, Encrypted(mask_value="")]
+    phone: Annotated[str, Encrypted(mask_value="")]
+    birth_year: Annotated[int, Encrypted(mask_value=0)]
+    tags: Annotated[list[str], Encrypted(mask_value=[])]
+
+
+def seconds_per_load(
+    store: EventStore,
+    event_type: type[CustomerRegistered] | type[PrivateCustomerRegistered],
+) -> float:
+    stream_id = StreamId()
+    store.append(
+        *(
+            event_type(
+                customer_id=f"customer-{i % 10}",
+                email=f"customer-{i}@example.com",
+                name=f"Customer {i}",
+                phone="+48 123 456 789",
+                birth_year=1990,
+                tags=["vip", "newsletter"],
+            )
+            for i in range(EVENTS)
+        ),
+        stream_id=stream_id,
+    )
+    return timeit(lambda: store.load_stream(stream_id), number=ROUNDS) / ROUNDS
+
+
+if __name__ == "__main__":
+    strategy = AesGcmEncryptionStrategy()
+    key_storage = InMemoryKeyStorage()
+    for i in range(10):
+        key_storage.store(f"customer-{i}", strategy.generate_key())
+    backend = InMemoryBackend().with_encryption(strategy, key_storage)
+    plain = seconds_per_load(backend.event_store, CustomerRegistered)
+    encrypted = seconds_per_load(backend.event_store, PrivateCustomerRegistered)
+    print(f"plain:     {plain * 1000:.2f} ms per {EVENTS} events")
+    print(f"encrypted: {encrypted * 1000:.2f} ms per {EVENTS} events")
+    print(f"overhead:  {encrypted / plain:.2f}x")
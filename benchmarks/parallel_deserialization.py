@@ -0,0 +1,78 @@
+"""Compares loading a stream with sequential and parallel deserialization.
+
+Run with `poetry run python -m benchmarks.parallel_deserialization`.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from timeit import timeit
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from event_sourcery import Event, EventStore, StreamId
+from event_sourcery.backend import InMemoryBackend
+
+EVENTS = 10_000
+ROUNDS = 5
+
+
+class Line(BaseModel):
+    sku: str
+    quantity: int
+    price: Decimal
+
+
+class OrderShipped(Event):
+    order_id: str
+    shipment_id: str
+    carrier_reference: str
+    shipped_at: datetime
+    expected_at: datetime
+    lines: list[Line]
+    total: Decimal
+
+
+def fill(store: EventStore) -> StreamId:
+    stream_id = StreamId()
+    now = datetime(2025, 1, 1)
+    store.append(
+        *(
+            OrderShipped(
+                order_id=str(uuid4()),
+                shipment_id=str(uuid4()),
+                carrier_reference=f"carrier-{i}",
+                shipped_at=now + timedelta(minutes=i),
+                expected_at=now + timedelta(days=2, minutes=i),
+                lines=[
+                    Line(sku=f"SKU-{n}", quantity=n, price=Decimal("9.99"))
+                    for n in range(5)
+                ],
+                total=Decimal("49.95"),
+            )
+            for i in range(EVENTS)
+        ),
+        stream_id=stream_id,
+    )
+    return stream_id
+
+
+def seconds_per_load(backend: InMemoryBackend, stream_id: StreamId) -> float:
+    store = backend.event_store
+    return timeit(lambda: store.load_stream(stream_id), number=ROUNDS) / ROUNDS
+
+
+if __name__ == "__main__":
+    backend = InMemoryBackend()
+    stream_id = fill(backend.event_store)
+    sequential = seconds_per_load(backend, stream_id)
+    workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        backend.with_parallel_deserialization(pool)
+        backend.event_store.load_stream(stream_id)  # start workers
+        parallel = seconds_per_load(backend, stream_id)
+    print(f"sequential: {sequential * 1000:.2f} ms per {EVENTS} events")
+    print(f"parallel:   {parallel * 1000:.2f} ms with {workers} workers")
+    print(f"speedup:    {sequential / parallel:.2f}x")
@@ -0,0 +1,63 @@
+"""Compares loading a stream with and without trusted reads.
+
+Run with `poetry run python -m benchmarks.trusted_reads`.
+"""
+
+from timeit import timeit
+
+from event_sourcery import Event, EventStore, StreamId
+from event_sourcery.backend import InMemoryBackend
+from event_sourcery.event import EventRegistry
+
+EVENTS = 1_000
+ROUNDS = 20
+
+
+class OrderPlaced(Event):
+    order_id: str
+    customer_id: str
+    currency: str
+    total: float
+    discount: float | None
+    lines: list[dict[str, str | int | float]]
+    tags: list[str]
+    attributes: dict[str, str]
+    notes: str | None
+    express: bool
+
+
+def event_store(registry: EventRegistry) -> EventStore:
+    backend = InMemoryBackend()
+    backend[EventRegistry] = registry
+    return backend.event_store
+
+
+def seconds_per_load(store: EventStore) -> float:
+    stream_id = StreamId()
+    store.append(
+        *(
+            OrderPlaced(
+                order_id=f"order-{i}",
+                customer_id="customer",
+                currency="EUR",
+                total=i * 1.5,
+                discount=None,
+                lines=[{"sku": "SKU-1", "quantity": 2, "price": 1.5}] * 3,
+                tags=["a", "b"],
+                attributes={"channel": "web"},
+                notes=None,
+                express=i % 2 == 0,
+            )
+            for i in range(EVENTS)
+        ),
+        stream_id=stream_id,
+    )
+    return timeit(lambda: store.load_stream(stream_id), number=ROUNDS) / ROUNDS
+
+
+if __name__ == "__main__":
+    validated = seconds_per_load(event_store(EventRegistry()))
+    trusted = seconds_per_load(event_store(EventRegistry(trusted_reads=True)))
+    print(f"validated: {validated * 1000:.2f} ms per {EVENTS} events")
+    print(f"trusted:   {trusted * 1000:.2f} ms per {EVENTS} events")
+    print(f"speedup:   {validated / trusted:.2f}x")
@@ -1,21 +1,30 @@
 __all__ = [
     "DEFAULT_TENANT",
     "NO_VERSIONING",
+    "AppendResult",
+    "AsyncEventStore",
+    "AsyncOutbox",
     "Backend",
     "Event",
     "EventStore",
+    "GroupCommitEventStore",
     "Outbox",
     "StreamCategory",
     "StreamId",
+    "StreamInfo",
     "StreamUUID",
     "TenantId",
     "TransactionalBackend",
 ]
 
+from event_sourcery._event_store.append_result import AppendResult
+from event_sourcery._event_store.async_event_store import AsyncEventStore
 from event_sourcery._event_store.backend import Backend, TransactionalBackend
 from event_sourcery._event_store.event.dto import Event
 from event_sourcery._event_store.event_store import EventStore
-from event_sourcery._event_store.outbox import Outbox
+from event_sourcery._event_store.group_commit import GroupCommitEventStore
+from event_sourcery._event_store.outbox import AsyncOutbox, Outbox
 from event_sourcery._event_store.stream_id import StreamCategory, StreamId, StreamUUID
+from event_sourcery._event_store.stream_info import StreamInfo
 from event_sourcery._event_store.tenant_id import DEFAULT_TENANT, TenantId
 from event_sourcery._event_store.versioning import NO_VERSIONING
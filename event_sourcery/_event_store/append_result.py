@@ -0,0 +1,42 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from typing_extensions import Self
+
+from event_sourcery._event_store.event.dto import Position, RecordedRaw
+from event_sourcery._event_store.stream_id import StreamId
+
+
+@dataclass(frozen=True)
+class AppendResult:
+    """
+    Outcome of appending events to a stream.
+
+    Attributes:
+        version (int | None): Version of the stream after the append
+            (None if versionless).
+        position (Position | None): Position of the last appended event in the event
+            store, e.g. to wait for projections to catch up with it.
+    """
+
+    version: int | None
+    position: Position | None
+
+    @classmethod
+    def per_stream(cls, records: Iterable[RecordedRaw]) -> dict[StreamId, Self]:
+        """
+        Builds results of an append from the records it stored.
+
+        Args:
+            records (Iterable[RecordedRaw]): Stored records, in order of positions.
+
+        Returns:
+            dict[StreamId, Self]: Result of the last record of each stream.
+        """
+        return {
+            record.entry.stream_id: cls(
+                version=record.entry.version,
+                position=record.position,
+            )
+            for record in records
+        }
@@ -0,0 +1,494 @@
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+
+from typing_extensions import Self
+
+from event_sourcery._event_store.append_result import AppendResult
+from event_sourcery._event_store.event.dto import (
+    Event,
+    Position,
+    RawEvent,
+    Recorded,
+    RecordedRaw,
+    WrappedEvent,
+)
+from event_sourcery._event_store.event.serde import Serde
+from event_sourcery._event_store.event_store import (
+    StorageStrategy,
+    serialize_batch,
+    versioning_for,
+    wrap_events,
+)
+from event_sourcery._event_store.stream_id import StreamCategory, StreamId
+from event_sourcery._event_store.stream_info import StreamInfo
+from event_sourcery._event_store.tenant_id import TenantId
+from event_sourcery._event_store.versioning import Versioning
+
+
+class AsyncStorageStrategy:
+    """
+    Interface for asyncio event store backends.
+
+    Counterpart of `StorageStrategy` with coroutine methods, so backends can keep
+    many reads and writes in flight on a single event loop.
+    """
+
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        """
+        Fetches events from a stream in the given range.
+
+        Args:
+            stream_id (StreamId): The stream identifier to fetch events from.
+            start (int | None): From version (inclusive), or None for the beginning.
+            stop (int | None): Stop before version (exclusive), or None for the end.
+
+        Returns:
+            list[RawEvent]: List of raw events in the specified range.
+        """
+        raise NotImplementedError()
+
+    def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[RawEvent]:
+        """
+        Lazily iterates over events from a stream in the given range.
+
+        Args:
+            stream_id (StreamId): The stream identifier to iterate events from.
+            start (int | None): From version (inclusive), or None for the beginning.
+            stop (int | None): Stop before version (exclusive), or None for the end.
+            page_size (int): Number of events fetched from the storage at once.
+
+        Returns:
+            AsyncIterator[RawEvent]: Raw events in the specified range.
+        """
+        raise NotImplementedError()
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> AsyncIterator[RecordedRaw]:
+        """
+        Lazily iterates over events of all streams in a category in position order.
+
+        Args:
+            category (StreamCategory): The category of streams to scan.
+            after_position (Position): Position to scan after (exclusive).
+            page_size (int): Number of events fetched from the storage at once.
+            tenant_id (TenantId | None): Tenant to scan events of, or None for all.
+
+        Returns:
+            AsyncIterator[RecordedRaw]: Raw events with their positions and tenant ids.
+        """
+        raise NotImplementedError()
+
+    async def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        """
+        Fetches events of many streams at once, each from its newest snapshot.
+
+        Args:
+            stream_ids (Sequence[StreamId]): The stream identifiers to fetch events from.
+
+        Returns:
+            dict[StreamId, list[RawEvent]]: Raw events of every requested stream.
+                Streams that don't exist are mapped to an empty list.
+        """
+        raise NotImplementedError()
+
+    async def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        """
+        Fetches metadata of a stream without fetching its events.
+
+        Args:
+            stream_id (StreamId): The stream identifier to describe.
+
+        Returns:
+            StreamInfo | None: Metadata of the stream or None if it doesn't exist.
+        """
+        raise NotImplementedError()
+
+    async def insert_events(
+        self,
+        stream_id: StreamId,
+        versioning: Versioning,
+        events: list[RawEvent],
+    ) -> AppendResult:
+        """
+        Inserts events into a stream with using versioning strategy.
+
+        Args:
+            stream_id (StreamId): The stream identifier to insert events into.
+            versioning (Versioning): Versioning strategy for optimistic locking.
+            events (list[RawEvent]): List of raw events to insert.
+
+        Returns:
+            AppendResult: New version of the stream and position of the last event.
+        """
+        raise NotImplementedError()
+
+    async def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        """
+        Inserts events into many streams at once, all or nothing.
+
+        Args:
+            streams (Mapping[StreamId, tuple[list[RawEvent], Versioning]]):
+                Raw events and versioning strategy for each stream to insert into.
+
+        Returns:
+            dict[StreamId, AppendResult]: Result of the insert into each stream.
+        """
+        raise NotImplementedError()
+
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        """
+        Saves a snapshot of the stream. Stream will be fetched from newest snapshot.
+
+        Args:
+            snapshot (RawEvent): The snapshot event to save.
+        """
+        raise NotImplementedError()
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        """
+        Deletes a stream and all its events.
+
+        Args:
+            stream_id (StreamId): The stream identifier to delete.
+        """
+        raise NotImplementedError()
+
+    async def current_position(self) -> Position | None:
+        """
+        Returns the current position (offset) in the event store, if supported.
+        """
+        raise NotImplementedError()
+
+    def scoped_for_tenant(self, tenant_id: str) -> Self:
+        """
+        Returns a backend instance scoped for the given tenant.
+
+        Args:
+            tenant_id (str): The tenant identifier.
+
+        Returns:
+            Self: The backend instance for the tenant.
+        """
+        raise NotImplementedError()
+
+
+class SyncStorageStrategyAdapter(AsyncStorageStrategy):
+    """
+    Exposes a non-blocking `StorageStrategy` (e.g. in-memory) as `AsyncStorageStrategy`.
+
+    Calls are made directly on the event loop, so it must not be used for
+    strategies doing blocking I/O.
+    """
+
+    def __init__(self, strategy: StorageStrategy) -> None:
+        self._strategy = strategy
+
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        return self._strategy.fetch_events(stream_id, start=start, stop=stop)
+
+    async def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[RawEvent]:
+        events = self._strategy.iter_events(stream_id, start, stop, page_size)
+        for event in events:
+            yield event
+
+    async def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> AsyncIterator[RecordedRaw]:
+        records = self._strategy.scan_category(
+            category, after_position, page_size, tenant_id
+        )
+        for record in records:
+            yield record
+
+    async def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        return self._strategy.fetch_events_many(stream_ids)
+
+    async def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        return self._strategy.fetch_stream_info(stream_id)
+
+    async def insert_events(
+        self,
+        stream_id: StreamId,
+        versioning: Versioning,
+        events: list[RawEvent],
+    ) -> AppendResult:
+        return self._strategy.insert_events(stream_id, versioning, events)
+
+    async def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        return self._strategy.insert_events_many(streams)
+
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        self._strategy.save_snapshot(snapshot)
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        self._strategy.delete_stream(stream_id)
+
+    async def current_position(self) -> Position | None:
+        return self._strategy.current_position
+
+    def scoped_for_tenant(self, tenant_id: str) -> Self:
+        return self.__class__(self._strategy.scoped_for_tenant(tenant_id))
+
+
+class AsyncEventStore:
+    """asyncio API for working with events.
+
+    Mirrors `EventStore`, sharing its `Serde` (and so the `EventRegistry` and
+    encryption), but every storage call is awaited.
+    """
+
+    def __init__(self, storage_strategy: AsyncStorageStrategy, serde: Serde) -> None:
+        self._storage_strategy = storage_strategy
+        self._serde = serde
+
+    async def load_stream(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> Sequence[WrappedEvent]:
+        """Loads events from a given stream.
+
+        Examples:
+            >>> await event_store.load_stream(stream_id=StreamId(name="not_existing_stream"))
+            []
+            >>> await event_store.load_stream(stream_id=StreamId(name="existing_stream"))
+            [WrappedEvent(..., version=1), ..., WrappedEvent(..., version=3)]
+
+        Args:
+            stream_id: The stream identifier to load events from.
+            start: The stream version to start loading from (including).
+            stop: The stream version to stop loading at (excluding).
+
+        Returns:
+            A sequence of events or empty list if the stream doesn't exist.
+        """
+        events = await self._storage_strategy.fetch_events(
+            stream_id,
+            start=start,
+            stop=stop,
+        )
+        return self._serde.deserialize_many(events)
+
+    async def iter_stream(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[WrappedEvent]:
+        """Lazily iterates over events from a given stream.
+
+        Examples:
+            >>> async for event in event_store.iter_stream(StreamId(), page_size=500):
+            ...     aggregate.__apply__(event.event)
+
+        Args:
+            stream_id: The stream identifier to iterate events from.
+            start: The stream version to start iterating from (including).
+            stop: The stream version to stop iterating at (excluding).
+            page_size: Number of events fetched from the storage at once.
+
+        Returns:
+            An async iterator over events, empty if the stream doesn't exist.
+        """
+        events = self._storage_strategy.iter_events(
+            stream_id,
+            start=start,
+            stop=stop,
+            page_size=page_size,
+        )
+        async for event in events:
+            yield self._serde.deserialize(event)
+
+    async def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> AsyncIterator[Recorded]:
+        """Lazily iterates over events stored so far in streams of a category.
+
+        Args:
+            category: The category of streams to scan.
+            after_position: Position of the last already handled event, if resuming.
+            page_size: Number of events fetched from the storage at once.
+            tenant_id: Tenant to scan events of, or None to scan events of all tenants.
+
+        Returns:
+            An async iterator over recorded events, ordered by position.
+        """
+        records = self._storage_strategy.scan_category(
+            category,
+            after_position=after_position,
+            page_size=page_size,
+            tenant_id=tenant_id,
+        )
+        async for record in records:
+            yield self._serde.deserialize_record(record)
+
+    async def load_streams(
+        self,
+        stream_ids: Iterable[StreamId],
+    ) -> dict[StreamId, Sequence[WrappedEvent]]:
+        """Loads events of many streams at once.
+
+        Args:
+            stream_ids: The stream identifiers to load events from.
+
+        Returns:
+            A mapping of every given stream id to its events (empty if the stream
+            doesn't exist).
+        """
+        stream_ids = list(dict.fromkeys(stream_ids))
+        if not stream_ids:
+            return {}
+        events = await self._storage_strategy.fetch_events_many(stream_ids)
+        return {
+            stream_id: self._serde.deserialize_many(events.get(stream_id, []))
+            for stream_id in stream_ids
+        }
+
+    async def stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        """Returns metadata of a stream without loading and deserializing its events.
+
+        Args:
+            stream_id: The stream identifier to describe.
+
+        Returns:
+            Version, event count, timestamps and latest snapshot version of the stream,
+            or None if the stream doesn't exist.
+        """
+        return await self._storage_strategy.fetch_stream_info(stream_id)
+
+    async def append(
+        self,
+        *events: WrappedEvent | Event,
+        stream_id: StreamId,
+        expected_version: int | Versioning = 0,
+    ) -> AppendResult:
+        """Appends events to a stream with a given ID.
+
+        Examples:
+            >>> await event_store.append(WrappedEvent(...), stream_id=StreamId())
+            AppendResult(version=1, position=...)
+            >>> await event_store.append(Event(...), stream_id=StreamId(), expected_version=1)
+            AppendResult(version=2, position=...)
+
+        Args:
+            *events: The events to append (all WrappedEvent or all Event).
+            stream_id: The stream identifier to append events to.
+            expected_version: The expected version of the stream
+
+        Returns:
+            New version of the stream and position of the last appended event.
+        """
+        wrapped_events = wrap_events(
+            events,  # type: ignore[arg-type]
+            expected_version,
+        )
+        return await self._storage_strategy.insert_events(
+            stream_id=stream_id,
+            versioning=versioning_for(wrapped_events, expected_version),
+            events=self._serde.serialize_many(wrapped_events, stream_id),
+        )
+
+    async def append_many(
+        self,
+        streams: Mapping[
+            StreamId,
+            tuple[Sequence[WrappedEvent] | Sequence[Event], int | Versioning],
+        ],
+    ) -> dict[StreamId, AppendResult]:
+        """Appends events to many streams in a single write, all or nothing.
+
+        Args:
+            streams: Events (WrappedEvent or Event) and the expected version
+                of each stream to append to.
+
+        Returns:
+            New version and position of the last appended event of each stream
+            with events to append.
+        """
+        batch = serialize_batch(self._serde, streams)
+        if not batch:
+            return {}
+        return await self._storage_strategy.insert_events_many(batch)
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        """Deletes a stream with a given ID.
+
+        If a stream does not exist, this method does nothing.
+
+        Args:
+            stream_id: The stream identifier to delete.
+
+        Returns:
+            None
+        """
+        await self._storage_strategy.delete_stream(stream_id)
+
+    async def save_snapshot(self, stream_id: StreamId, snapshot: WrappedEvent) -> None:
+        """Saves a snapshot of the stream.
+
+        Args:
+            stream_id: The stream identifier to save the snapshot.
+            snapshot: The snapshot to save.
+
+        Returns:
+            None
+        """
+        serialized = self._serde.serialize(event=snapshot, stream_id=stream_id)
+        await self._storage_strategy.save_snapshot(serialized)
+
+    async def position(self) -> Position | None:
+        """Returns the current position of the event store.
+
+        Examples:
+            >>> await event_store.position()
+            Position(15)
+        """
+        return await self._storage_strategy.current_position()
@@ -1,9 +1,15 @@
 from collections.abc import Callable
+from concurrent.futures import Executor
 from functools import wraps
 from typing import NoReturn, TypeVar, cast
 
 from typing_extensions import Self
 
+from event_sourcery._event_store.async_event_store import (
+    AsyncEventStore,
+    AsyncStorageStrategy,
+)
+from event_sourcery._event_store.event.codec import JsonCodec, PayloadCodec
 from event_sourcery._event_store.event.encryption import (
     Encryption,
     EncryptionKeyStorageStrategy,
@@ -12,12 +18,16 @@ from event_sourcery._event_store.event.encryption import (
     NoKeyStorageStrategy,
 )
 from event_sourcery._event_store.event.registry import EventRegistry
-from event_sourcery._event_store.event.serde import Serde
+from event_sourcery._event_store.event.serde import ParallelDeserialization, Serde
+from event_sourcery._event_store.event.upcasting import Upcasters
 from event_sourcery._event_store.event_store import (
     EventStore,
     StorageStrategy,
 )
 from event_sourcery._event_store.outbox import (
+    AsyncOutbox,
+    AsyncOutboxStorageStrategy,
+    NoAsyncOutboxStorageStrategy,
     NoOutboxStorageStrategy,
     Outbox,
     OutboxFiltererStrategy,
@@ -125,17 +135,21 @@ class Backend(_Container):
         self[TenantId] = DEFAULT_TENANT
         self[EventRegistry] = EventRegistry()
         self[EncryptionStrategy] = NoEncryptionStrategy()
-        self[EncryptionKeyStorageStrategy] = (
-            lambda c: NoKeyStorageStrategy().scoped_for_tenant(c[TenantId])
+        self[EncryptionKeyStorageStrategy] = lambda c: (
+            NoKeyStorageStrategy().scoped_for_tenant(c[TenantId])
         )
         self[Encryption] = lambda c: Encryption(
             registry=c[EventRegistry],
             strategy=c[EncryptionStrategy],
             key_storage=c[EncryptionKeyStorageStrategy],
         )
+        self[PayloadCodec] = JsonCodec()
+        self[Upcasters] = Upcasters()
         self[Serde] = lambda c: Serde(
             registry=c[EventRegistry],
             encryption=c[Encryption],
+            parallel=c.get(ParallelDeserialization),
+            upcasters=c[Upcasters],
         )
         self[StorageStrategy] = not_configured(
             "Use one of pyES backends: SQLAlchemy, Django or KurrentDB",
@@ -149,6 +163,18 @@ class Backend(_Container):
             serde=c[Serde],
         )
         self[OutboxStorageStrategy] = lambda _: NoOutboxStorageStrategy()
+        self[AsyncStorageStrategy] = not_configured(
+            "Use one of pyES backends with asyncio support: SQLAlchemy or KurrentDB",
+        )
+        self[AsyncEventStore] = lambda c: AsyncEventStore(
+            storage_strategy=c[AsyncStorageStrategy],
+            serde=c[Serde],
+        )
+        self[AsyncOutbox] = lambda c: AsyncOutbox(
+            strategy=c[AsyncOutboxStorageStrategy],
+            serde=c[Serde],
+        )
+        self[AsyncOutboxStorageStrategy] = lambda _: NoAsyncOutboxStorageStrategy()
         self[SubscriptionStrategy] = not_configured(
             "Use one of pyES backends: SQLAlchemy, Django or KurrentDB",
         )
@@ -171,6 +197,20 @@ class Backend(_Container):
         """
         return self[Outbox]
 
+    @property
+    def async_event_store(self) -> AsyncEventStore:
+        """
+        Returns the current instance of `AsyncEventStore`.
+        """
+        return self[AsyncEventStore]
+
+    @property
+    def async_outbox(self) -> AsyncOutbox:
+        """
+        Returns the current instance of `AsyncOutbox`.
+        """
+        return self[AsyncOutbox]
+
     @property
     def subscriber(self) -> PositionPhase:
         """
@@ -206,6 +246,24 @@ class Backend(_Container):
         )
         return self
 
+    def with_parallel_deserialization(
+        self,
+        executor: Executor,
+        min_batch_size: int = 1_000,
+        chunk_size: int = 500,
+    ) -> Self:
+        """
+        Configures deserializing big batches of events in parallel.
+
+        See `ParallelDeserialization` for details.
+        """
+        self[ParallelDeserialization] = ParallelDeserialization(
+            executor=executor,
+            min_batch_size=min_batch_size,
+            chunk_size=chunk_size,
+        )
+        return self
+
 
 class TransactionalBackend(Backend):
     """
@@ -0,0 +1,87 @@
+import json
+from typing import Any, ClassVar, cast
+
+
+class PayloadCodec:
+    """
+    Interface for encoding event data and context to bytes for storage.
+
+    Used by backends storing payloads as bytes or text instead of native JSON
+    columns. Register an implementation in the backend with
+    `backend[PayloadCodec] = OrjsonCodec()`.
+
+    Attributes:
+        binary (bool): Whether encoded payloads are not valid UTF-8 JSON text.
+    """
+
+    binary: ClassVar[bool] = False
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        """
+        Encodes the payload.
+
+        Args:
+            payload (dict[str, Any]): JSON compatible event data or context.
+
+        Returns:
+            bytes: The encoded payload.
+        """
+        raise NotImplementedError()
+
+    def decode(self, encoded: bytes | str) -> dict[str, Any]:
+        """
+        Decodes the payload.
+
+        Args:
+            encoded (bytes | str): The payload encoded with `encode`.
+
+        Returns:
+            dict[str, Any]: The decoded event data or context.
+        """
+        raise NotImplementedError()
+
+
+class JsonCodec(PayloadCodec):
+    """Encodes payloads as JSON with the standard library. Used by default."""
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    def decode(self, encoded: bytes | str) -> dict[str, Any]:
+        return cast(dict[str, Any], json.loads(encoded))
+
+
+class OrjsonCodec(PayloadCodec):
+    """Encodes payloads as JSON with `orjson` (requires `orjson` package)."""
+
+    def __init__(self) -> None:
+        import orjson  # noqa: PLC0415
+
+        self._orjson = orjson
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        return cast(bytes, self._orjson.dumps(payload))
+
+    def decode(self, encoded: bytes | str) -> dict[str, Any]:
+        return cast(dict[str, Any], self._orjson.loads(encoded))
+
+
+class MsgpackCodec(PayloadCodec):
+    """Encodes payloads with MessagePack (requires `msgpack` package).
+
+    Payloads are smaller than JSON but binary, so they can't be stored in JSON
+    or text columns.
+    """
+
+    binary = True
+
+    def __init__(self) -> None:
+        import msgpack  # noqa: PLC0415
+
+        self._msgpack = msgpack
+
+    def encode(self, payload: dict[str, Any]) -> bytes:
+        return cast(bytes, self._msgpack.packb(payload))
+
+    def decode(self, encoded: bytes | str) -> dict[str, Any]:
+        return cast(dict[str, Any], self._msgpack.unpackb(encoded))
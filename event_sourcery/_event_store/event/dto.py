@@ -1,10 +1,12 @@
 import dataclasses
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Generic, TypeAlias, TypeVar
+from typing import Any, ClassVar, Generic, TypeAlias, TypeVar
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel
+from typing_extensions import Self
 
 from event_sourcery._event_store.stream_id import StreamId
 from event_sourcery._event_store.tenant_id import DEFAULT_TENANT, TenantId
@@ -28,6 +30,9 @@ class RawEvent(BaseModel):
         data (dict[str, Any]): Event payload (fields and values).
         context (dict[str, Any]): Event custom metadata.
         version (int | None): Version of the event in the stream (if applicable).
+
+    Backends storing encoded payloads may read events with `undecoded`, in which
+    case `data` is decoded on first access and `payload` keeps the stored bytes.
     """
 
     uuid: UUID
@@ -38,6 +43,85 @@ class RawEvent(BaseModel):
     context: dict[str, Any]
     version: int | None = None
 
+    @classmethod
+    def trusted(
+        cls,
+        uuid: UUID,
+        stream_id: StreamId,
+        created_at: datetime,
+        name: str,
+        data: dict[str, Any],
+        context: dict[str, Any],
+        version: int | None,
+    ) -> Self:
+        """
+        Fast constructor for raw events read back from the event store.
+
+        Skips the frozen dataclass `__init__`, so values are neither checked
+        nor converted. Meant for storage backends only.
+        """
+        raw = object.__new__(cls)
+        raw.__dict__.update(
+            uuid=uuid,
+            stream_id=stream_id,
+            created_at=created_at,
+            name=name,
+            data=data,
+            context=context,
+            version=version,
+        )
+        return raw
+
+    @classmethod
+    def undecoded(
+        cls,
+        uuid: UUID,
+        stream_id: StreamId,
+        created_at: datetime,
+        name: str,
+        payload: bytes,
+        decode: Callable[[bytes], dict[str, Any]],
+        context: dict[str, Any],
+        version: int | None,
+    ) -> Self:
+        """
+        Fast constructor for raw events read back with data still encoded.
+
+        Same as `trusted`, but `data` is decoded with `decode` on first access,
+        so events which are only filtered or forwarded as stored bytes never pay
+        for decoding. Meant for storage backends only.
+        """
+        raw = object.__new__(cls)
+        raw.__dict__.update(
+            uuid=uuid,
+            stream_id=stream_id,
+            created_at=created_at,
+            name=name,
+            context=context,
+            version=version,
+            _payload=payload,
+            _decode=decode,
+        )
+        return raw
+
+    @property
+    def payload(self) -> bytes | None:
+        """
+        Event data as stored by the backend, if the event was read undecoded.
+
+        Lets pass-through consumers (e.g. forwarding events to a message broker
+        or another store) send the stored bytes without decoding and re-encoding
+        them. It's `None` for events read or created with decoded data.
+        """
+        return self.__dict__.get("_payload")
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "data" and "_payload" in self.__dict__:
+            data = self.__dict__["_decode"](self.__dict__["_payload"])
+            self.__dict__["data"] = data
+            return data
+        return super().__getattr__(name)  # type: ignore[misc]
+
 
 Position: TypeAlias = int
 
@@ -60,6 +144,18 @@ class RecordedRaw(BaseModel):
     position: Position
     tenant_id: TenantId = DEFAULT_TENANT
 
+    @classmethod
+    def trusted(cls, entry: RawEvent, position: Position, tenant_id: TenantId) -> Self:
+        """
+        Fast constructor for records read back from the event store.
+
+        Skips the frozen dataclass `__init__`, so values are neither checked
+        nor converted. Meant for storage backends only.
+        """
+        record = object.__new__(cls)
+        record.__dict__.update(entry=entry, position=position, tenant_id=tenant_id)
+        return record
+
 
 class Event(BaseModel, extra="forbid"):
     """Base class for all events.
@@ -71,6 +167,13 @@ class Event(BaseModel, extra="forbid"):
     ```
     """
 
+    __defined_events__: ClassVar[int] = 0
+    """Number of `Event` subclasses defined so far."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Event.__defined_events__ += 1
+
 
 TEvent = TypeVar("TEvent", bound=Event)
 TContext = TypeVar("TContext", bound=BaseModel)
@@ -84,6 +187,10 @@ class Context(BaseModel, extra="allow"):
     with additional metadata fields as needed. This allows for flexible propagation
     of context information throughout event processing and handling pipelines.
 
+    Equal contexts of events read from the store share their values until one
+    of them is modified (copy-on-write). Values nested in a context (e.g. lists)
+    are not copied, so replace them instead of modifying them in place.
+
     Attributes:
         correlation_id (UUID | None): Identifier for correlating related events.
         causation_id (UUID | None): Identifier for the cause of the event.
@@ -91,9 +198,45 @@ class Context(BaseModel, extra="allow"):
     Additional fields can be added dynamically due to `extra="allow"`.
     """
 
+    __slots__ = ("_shared",)
+
     correlation_id: UUID | None = None
     causation_id: UUID | None = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._unshare()
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        self._unshare()
+        super().__delattr__(name)
+
+    def _share(self) -> Self:
+        """Makes a context sharing values with this one until it is modified."""
+        shared = self.__class__.__new__(self.__class__)
+        for name in (
+            "__dict__",
+            "__pydantic_extra__",
+            "__pydantic_fields_set__",
+            "__pydantic_private__",
+        ):
+            object.__setattr__(shared, name, getattr(self, name))
+        object.__setattr__(shared, "_shared", True)
+        return shared
+
+    def _unshare(self) -> None:
+        if not getattr(self, "_shared", False):
+            return
+        object.__setattr__(self, "__dict__", dict(self.__dict__))
+        if self.__pydantic_extra__ is not None:
+            object.__setattr__(
+                self, "__pydantic_extra__", dict(self.__pydantic_extra__)
+            )
+        object.__setattr__(
+            self, "__pydantic_fields_set__", set(self.__pydantic_fields_set__)
+        )
+        object.__setattr__(self, "_shared", False)
+
 
 @dataclasses.dataclass()
 class WrappedEvent(Generic[TEvent]):
@@ -142,6 +285,87 @@ class WrappedEvent(Generic[TEvent]):
         return context_type.model_validate(self.context.model_dump())
 
 
+@dataclasses.dataclass(init=False, eq=False, repr=False)
+class LazyWrappedEvent(WrappedEvent[TEvent]):
+    """
+    Wrapped event decoding its event and context on first access.
+
+    Metadata (`name`, `version`, `uuid`, `created_at`) is available right away,
+    while deserializing (and decrypting) the event is deferred until `event` is
+    accessed, so consumers filtering records by metadata skip it for records
+    they ignore. Decoding errors are raised on access.
+
+    Keeps the `WrappedEvent` dataclass contract: compares equal to a
+    `WrappedEvent` with the same event and metadata, and `dataclasses.replace`
+    makes an already decoded copy.
+
+    Attributes:
+        name (str): Name of the event type as stored in the event store.
+    """
+
+    name: str = dataclasses.field(kw_only=True)
+
+    def __init__(
+        self,
+        name: str,
+        version: int | None,
+        uuid: UUID,
+        created_at: datetime,
+        decode_event: Callable[[], TEvent] | None = None,
+        decode_context: Callable[[], Context] | None = None,
+        *,
+        event: TEvent | None = None,
+        context: Context | None = None,
+    ) -> None:
+        self.name = name
+        self.version = version
+        self.uuid = uuid
+        self.created_at = created_at
+        self._decode_event = decode_event
+        self._decode_context = decode_context
+        if event is not None:
+            self.__dict__["event"] = event
+        if context is not None or decode_context is None:
+            self.__dict__["context"] = context or Context()
+
+    def __getattr__(self, name: str) -> Any:
+        decoders = {"event": "_decode_event", "context": "_decode_context"}
+        if name not in decoders:
+            raise AttributeError(name)
+        decode = self.__dict__.get(decoders[name])
+        if decode is None:
+            raise AttributeError(name)
+        value = self.__dict__[name] = decode()
+        return value
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the event was already decoded."""
+        return "event" in self.__dict__
+
+    __hash__ = WrappedEvent.__hash__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WrappedEvent):
+            return NotImplemented
+        return (
+            self.event,
+            self.version,
+            self.uuid,
+            self.created_at,
+            self.context,
+        ) == (other.event, other.version, other.uuid, other.created_at, other.context)
+
+    def __repr__(self) -> str:
+        event = repr(self.event) if self.is_decoded else "<not decoded>"
+        context = repr(self.context) if "context" in self.__dict__ else "<not decoded>"
+        return (
+            f"{type(self).__name__}(event={event}, version={self.version!r}, "
+            f"uuid={self.uuid!r}, created_at={self.created_at!r}, "
+            f"context={context}, name={self.name!r})"
+        )
+
+
 @dataclasses.dataclass(frozen=True)
 class Entry:
     """
@@ -1,14 +1,23 @@
+import binascii
 import json
-from collections import UserDict
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
+from copy import copy
 from dataclasses import dataclass
-from typing import Any
+from datetime import timedelta
+from functools import partial
+from threading import Lock
+from time import monotonic
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 from typing_extensions import Self
 
-from event_sourcery._event_store.event.registry import EventRegistry
+from event_sourcery._event_store.event.registry import EncryptedField, EventRegistry
 from event_sourcery._event_store.stream_id import StreamId
-from event_sourcery._event_store.tenant_id import TenantId
+from event_sourcery._event_store.tenant_id import DEFAULT_TENANT, TenantId
 from event_sourcery.exceptions import KeyNotFoundError, NoSubjectIdFound
 
 
@@ -19,8 +28,16 @@ class EncryptionStrategy:
     Implementations should provide methods for encrypting and decrypting data using a
     given key.
     Used by the Encryption service to process event fields marked for encryption.
+
+    Attributes:
+        typed (bool): Whether the strategy encrypts any JSON compatible value and
+            decrypts it back with its type. Otherwise, values are passed to
+            `encrypt` as JSON strings (or strings as they are) and decrypted values
+            which are valid JSON are parsed.
     """
 
+    typed: ClassVar[bool] = False
+
     def encrypt(self, data: Any, key: bytes) -> str:
         """
         Encrypts the given data using the provided key.
@@ -47,6 +64,34 @@ class EncryptionStrategy:
         """
         raise NotImplementedError()
 
+    def encrypt_many(self, data: Sequence[Any], key: bytes) -> list[str]:
+        """
+        Encrypts many values with the same key, e.g. fields of an event for
+        a single subject. By default, calls `encrypt` for each value.
+
+        Args:
+            data (Sequence[Any]): The data to encrypt.
+            key (bytes): The encryption key.
+
+        Returns:
+            list[str]: The encrypted data, in the same order.
+        """
+        return [self.encrypt(value, key) for value in data]
+
+    def decrypt_many(self, data: Sequence[str], key: bytes) -> list[Any]:
+        """
+        Decrypts many values encrypted with the same key. By default, calls
+        `decrypt` for each value.
+
+        Args:
+            data (Sequence[str]): The encrypted data as strings.
+            key (bytes): The encryption key.
+
+        Returns:
+            list[Any]: The decrypted data, in the same order.
+        """
+        return [self.decrypt(value, key) for value in data]
+
 
 class EncryptionKeyStorageStrategy:
     """
@@ -69,6 +114,27 @@ class EncryptionKeyStorageStrategy:
         """
         raise NotImplementedError()
 
+    def get_many(self, subject_ids: Iterable[str]) -> dict[str, bytes]:
+        """
+        Retrieves encryption keys for many subject identifiers at once.
+
+        Used to fetch keys of a whole batch of events before decrypting them.
+        By default, calls `get` for each subject, so implementations backed by
+        remote storage should override it with a single round trip.
+
+        Args:
+            subject_ids (Iterable[str]): The subject identifiers.
+
+        Returns:
+            dict[str, bytes]: Keys of subjects that have one, subjects without
+                a key (e.g. shredded) are left out.
+        """
+        return {
+            subject_id: key
+            for subject_id in subject_ids
+            if (key := self.get(subject_id)) is not None
+        }
+
     def store(self, subject_id: str, key: bytes) -> None:
         """
         Stores the encryption key for the given subject identifier.
@@ -88,6 +154,20 @@ class EncryptionKeyStorageStrategy:
         """
         raise NotImplementedError()
 
+    def delete_many(self, subject_ids: Iterable[str]) -> None:
+        """
+        Deletes encryption keys of many subject identifiers at once.
+
+        By default, calls `delete` for each subject, so implementations backed
+        by remote storage should override it with a single round trip.
+
+        Args:
+            subject_ids (Iterable[str]): The subject identifiers whose keys
+                should be deleted.
+        """
+        for subject_id in subject_ids:
+            self.delete(subject_id)
+
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         """
         Returns a key storage strategy instance scoped for the given tenant.
@@ -109,6 +189,98 @@ class NoEncryptionStrategy(EncryptionStrategy):
         raise NotImplementedError("NoEncryptionStrategy does not support decryption.")
 
 
+_NONCE_SIZE = 12
+_TEXT = "t"
+_JSON = "j"
+
+
+class AesGcmEncryptionStrategy(EncryptionStrategy):
+    """Encrypts values with AES-GCM (requires `cryptography` package).
+
+    Keys must be 128, 192 or 256 bits long, e.g. made with `generate_key`. Every
+    value is encrypted with a random nonce and stored with a tag of its type,
+    so it's decrypted back to a string or a JSON value without guessing which
+    one it was. Ciphers aren't cached between calls, so keys of shredded
+    subjects aren't kept in memory; batch methods create a single cipher for
+    all values of a key.
+
+    The cipher releases the GIL, so with an `executor`, big batches of values
+    (e.g. fields of an event for a single subject) are processed in its threads.
+
+    Args:
+        executor: Thread pool encrypting and decrypting big batches.
+        min_batch_size: Number of values from which a batch is processed
+            with the executor.
+    """
+
+    typed = True
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        min_batch_size: int = 16,
+    ) -> None:
+        from cryptography.hazmat.primitives.ciphers.aead import (  # noqa: PLC0415
+            AESGCM,
+        )
+
+        self._cipher = AESGCM
+        self._executor = executor
+        self._min_batch_size = min_batch_size
+
+    def generate_key(self) -> bytes:
+        """
+        Generates a new random 256-bit key.
+
+        Returns:
+            bytes: The key, to be stored in the key storage for a subject.
+        """
+        return bytes(self._cipher.generate_key(bit_length=256))
+
+    def encrypt(self, data: Any, key: bytes) -> str:
+        return self._encrypt(self._cipher(bytes(key)), data)
+
+    def decrypt(self, data: str, key: bytes) -> Any:
+        return self._decrypt(self._cipher(bytes(key)), data)
+
+    def encrypt_many(self, data: Sequence[Any], key: bytes) -> list[str]:
+        encrypt = partial(self._encrypt, self._cipher(bytes(key)))
+        if self._executor is None or len(data) < self._min_batch_size:
+            return [encrypt(value) for value in data]
+        return list(self._executor.map(encrypt, data))
+
+    def decrypt_many(self, data: Sequence[str], key: bytes) -> list[Any]:
+        decrypt = partial(self._decrypt, self._cipher(bytes(key)))
+        if self._executor is None or len(data) < self._min_batch_size:
+            return [decrypt(value) for value in data]
+        return list(self._executor.map(decrypt, data))
+
+    @staticmethod
+    def _encrypt(cipher: Any, data: Any) -> str:
+        if isinstance(data, str):
+            tag, plaintext = _TEXT, data.encode("utf-8")
+        else:
+            tag, plaintext = _JSON, json.dumps(data).encode("utf-8")
+        nonce = os.urandom(_NONCE_SIZE)
+        encrypted = nonce + cipher.encrypt(nonce, plaintext, None)
+        return tag + binascii.b2a_base64(encrypted, newline=False).decode("ascii")
+
+    @staticmethod
+    def _decrypt(cipher: Any, data: str) -> Any:
+        tag = data[:1]
+        if tag not in (_TEXT, _JSON):
+            raise ValueError(f"Unknown type tag of encrypted value: {tag!r}")
+        encrypted = binascii.a2b_base64(data[1:])
+        plaintext = cipher.decrypt(
+            encrypted[:_NONCE_SIZE],
+            encrypted[_NONCE_SIZE:],
+            None,
+        )
+        if tag == _TEXT:
+            return plaintext.decode("utf-8")
+        return json.loads(plaintext)
+
+
 class NoKeyStorageStrategy(EncryptionKeyStorageStrategy):
     def get(self, subject_id: str) -> bytes | None:
         raise NotImplementedError(
@@ -125,20 +297,121 @@ class NoKeyStorageStrategy(EncryptionKeyStorageStrategy):
         return self
 
 
-class NestedDict(UserDict):
-    def __getitem__(self, item: str) -> Any:
-        match item.split(".", 1):
-            case [prefix, key]:
-                return NestedDict(self.data[prefix])[key]
-            case _:
-                return self.data[item]
+class _KeyCache:
+    """LRU of keys (or their absence) with expiry, shared by tenant scopes."""
+
+    def __init__(self, max_size: int, ttl: timedelta) -> None:
+        self._max_size = max_size
+        self._ttl = ttl.total_seconds()
+        self._lock = Lock()
+        self._entries: OrderedDict[tuple[TenantId, str], tuple[bytes | None, float]] = (
+            OrderedDict()
+        )
+
+    def get(self, tenant_id: TenantId, subject_id: str) -> tuple[bool, bytes | None]:
+        with self._lock:
+            entry = self._entries.get((tenant_id, subject_id))
+            if entry is None:
+                return False, None
+            key, expires_at = entry
+            if expires_at <= monotonic():
+                del self._entries[(tenant_id, subject_id)]
+                return False, None
+            self._entries.move_to_end((tenant_id, subject_id))
+            return True, key
+
+    def put(self, tenant_id: TenantId, subject_id: str, key: bytes | None) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[(tenant_id, subject_id)] = (key, monotonic() + self._ttl)
+            self._entries.move_to_end((tenant_id, subject_id))
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+class CachingKeyStorageStrategy(EncryptionKeyStorageStrategy):
+    """
+    Caches keys retrieved from another key storage in memory.
+
+    Without a cache, every encrypted field of every event costs a key storage
+    lookup. Keys are cached in a bounded LRU for `ttl`, and so are subjects
+    without a key (e.g. shredded ones), so masked values don't cost lookups
+    either. Keys stored or deleted through this storage (e.g. by
+    `Encryption.shred`) update the cache immediately, and the cache is shared
+    by storages scoped for tenants, which are cached separately.
+
+    Keys stored or deleted by other processes are noticed after `ttl` at most,
+    so a shredded key may still decrypt data for that long. Pick `ttl`
+    accordingly.
+
+    Examples:
+        >>> backend.with_encryption(
+        ...     strategy,
+        ...     CachingKeyStorageStrategy(key_storage, ttl=timedelta(minutes=1)),
+        ... )
+
+    Args:
+        storage: The key storage to cache keys of.
+        max_size: Maximum number of cached subjects, least recently used are
+            evicted first.
+        ttl: How long keys (and their absence) are cached.
+    """
+
+    def __init__(
+        self,
+        storage: EncryptionKeyStorageStrategy,
+        max_size: int = 10_000,
+        ttl: timedelta = timedelta(minutes=5),
+    ) -> None:
+        self._storage = storage
+        self._cache = _KeyCache(max_size, ttl)
+        self._tenant_id = DEFAULT_TENANT
+
+    def get(self, subject_id: str) -> bytes | None:
+        cached, key = self._cache.get(self._tenant_id, subject_id)
+        if not cached:
+            key = self._storage.get(subject_id)
+            self._cache.put(self._tenant_id, subject_id, key)
+        return key
+
+    def get_many(self, subject_ids: Iterable[str]) -> dict[str, bytes]:
+        keys: dict[str, bytes] = {}
+        missed: list[str] = []
+        for subject_id in subject_ids:
+            cached, key = self._cache.get(self._tenant_id, subject_id)
+            if not cached:
+                missed.append(subject_id)
+            elif key is not None:
+                keys[subject_id] = key
+        if missed:
+            fetched = self._storage.get_many(missed)
+            for subject_id in missed:
+                key = fetched.get(subject_id)
+                self._cache.put(self._tenant_id, subject_id, key)
+                if key is not None:
+                    keys[subject_id] = key
+        return keys
+
+    def store(self, subject_id: str, key: bytes) -> None:
+        self._storage.store(subject_id, key)
+        self._cache.put(self._tenant_id, subject_id, key)
+
+    def delete(self, subject_id: str) -> None:
+        self._storage.delete(subject_id)
+        self._cache.put(self._tenant_id, subject_id, None)
+
+    def delete_many(self, subject_ids: Iterable[str]) -> None:
+        subject_ids = list(subject_ids)
+        self._storage.delete_many(subject_ids)
+        for subject_id in subject_ids:
+            self._cache.put(self._tenant_id, subject_id, None)
 
-    def __setitem__(self, item: str, value: Any) -> None:
-        match item.rsplit(".", 1):
-            case [prefix, key]:
-                self[prefix][key] = value
-            case _:
-                self.data[item] = value
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        scoped = copy(self)
+        scoped._storage = self._storage.scoped_for_tenant(tenant_id)
+        scoped._tenant_id = tenant_id
+        return scoped
 
 
 @dataclass
@@ -172,24 +445,32 @@ class Encryption:
             NoSubjectIdFound: If the subject id cannot be determined for encryption.
             KeyNotFoundError: If the encryption key for a subject is missing.
         """
-        event_type = type(event)
-        data = NestedDict(event.model_dump(mode="json"))
-        for field_name in self.registry.encrypted_fields(of=event_type).keys():
-            subject_field = self.registry.subject_filed(field_name, of=event_type)
-            subject_id = (
-                subject_field and getattr(event, subject_field)
-            ) or stream_id.name
-
+        data = event.model_dump(mode="json")
+        by_subject: dict[str, list[EncryptedField]] = {}
+        for encrypted_field in self.registry.encryption_plan(of=type(event)):
+            subject_id = encrypted_field.subject_of(event) or stream_id.name
             if subject_id is None:
                 raise NoSubjectIdFound(stream_id)
-            data[field_name] = self._encrypt_value(data[field_name], subject_id)
-        return data.data
+            by_subject.setdefault(subject_id, []).append(encrypted_field)
+
+        for subject_id, fields in by_subject.items():
+            key = self.key_storage.get(subject_id)
+            if key is None:
+                raise KeyNotFoundError(subject_id)
+            encrypted = self.strategy.encrypt_many(
+                [self._serialize(field.get(data)) for field in fields],
+                key,
+            )
+            for field, value in zip(fields, encrypted, strict=True):
+                field.set(data, value)
+        return data
 
     def decrypt(
         self,
         event_type: type[BaseModel],
         raw: dict[str, Any],
         stream_id: StreamId,
+        keys: Mapping[str, bytes] | None = None,
     ) -> dict[str, Any]:
         """
         Decrypts all fields of the event marked as encrypted in the registry.
@@ -198,43 +479,83 @@ class Encryption:
             event_type (type[BaseModel]): The event class type.
             raw (dict[str, Any]): The raw event data with encrypted fields.
             stream_id (StreamId): The stream identifier used for subject resolution.
+            keys (Mapping[str, bytes] | None): Keys fetched with `fetch_keys`,
+                subjects missing there have no key. By default, keys are taken
+                from the key storage.
 
         Returns:
             dict[str, Any]: The event data with decrypted fields (or masked if no key).
         """
-        data = NestedDict(raw)
-        encrypted_fields = self.registry.encrypted_fields(of=event_type)
-        for field_name, encrypted_config in encrypted_fields.items():
-            subject_field = self.registry.subject_filed(field_name, of=event_type)
-            subject_id = data[subject_field] if subject_field else stream_id.name or ""
-            data[field_name] = self._decrypt_value(
-                data[field_name],
-                subject_id,
-                encrypted_config.mask_value,
-            )
-        return data.data
+        by_subject: dict[str, list[EncryptedField]] = {}
+        for encrypted_field, subject_id in self._subjects(event_type, raw, stream_id):
+            by_subject.setdefault(subject_id, []).append(encrypted_field)
+
+        data = dict(raw)
+        for subject_id, fields in by_subject.items():
+            if keys is None:
+                key = self.key_storage.get(subject_id)
+            else:
+                key = keys.get(subject_id)
+            if key is None:
+                values = [field.encrypted.mask_value for field in fields]
+            else:
+                decrypted = self.strategy.decrypt_many(
+                    [field.get(raw) for field in fields],
+                    key,
+                )
+                values = [self._deserialize(value) for value in decrypted]
+            for field, value in zip(fields, values, strict=True):
+                field.set(data, value)
+        return data
+
+    def fetch_keys(
+        self,
+        events: Iterable[tuple[type[BaseModel], dict[str, Any], StreamId]],
+    ) -> dict[str, bytes]:
+        """
+        Fetches keys needed to decrypt many events with a single key storage call.
 
-    def _decrypt_value(self, value: str, subject_id: str, mask_value: Any) -> Any:
-        key = self.key_storage.get(subject_id)
-        if key is None:
-            return mask_value
-        decrypted = self.strategy.decrypt(value, key)
+        Args:
+            events: Event types, raw data and stream identifiers of the events.
+
+        Returns:
+            dict[str, bytes]: Keys by subject, to be passed to `decrypt`.
+        """
+        subject_ids = {
+            subject_id
+            for event_type, raw, stream_id in events
+            for _, subject_id in self._subjects(event_type, raw, stream_id)
+        }
+        if not subject_ids:
+            return {}
+        return self.key_storage.get_many(subject_ids)
+
+    def _subjects(
+        self,
+        event_type: type[BaseModel],
+        data: dict[str, Any],
+        stream_id: StreamId,
+    ) -> Iterator[tuple[EncryptedField, str]]:
+        for encrypted_field in self.registry.encryption_plan(of=event_type):
+            if encrypted_field.subject is None:
+                subject_id = stream_id.name or ""
+            else:
+                subject_id = encrypted_field.subject_in(data)
+            yield encrypted_field, subject_id
+
+    def _serialize(self, value: Any) -> Any:
+        if self.strategy.typed or isinstance(value, str):
+            return value
+        return json.dumps(value)
+
+    def _deserialize(self, decrypted: Any) -> Any:
+        if self.strategy.typed:
+            return decrypted
         try:
             return json.loads(decrypted)
         except (json.JSONDecodeError, TypeError):
             return decrypted
 
-    def _encrypt_value(self, value: Any, subject_id: str) -> str:
-        key = self.key_storage.get(subject_id)
-        if key is None:
-            raise KeyNotFoundError(subject_id)
-        match value:
-            case str():
-                serialized = value
-            case _:
-                serialized = json.dumps(value)
-        return self.strategy.encrypt(serialized, key)
-
     def shred(self, subject_id: str) -> None:
         """
         Deletes the encryption key for the given subject, effectively making all
@@ -244,3 +565,13 @@ class Encryption:
             subject_id (str): The subject identifier whose key should be deleted.
         """
         self.key_storage.delete(subject_id)
+
+    def shred_many(self, subject_ids: Iterable[str]) -> None:
+        """
+        Crypto-shreds data of many subjects at once, see `shred`.
+
+        Args:
+            subject_ids (Iterable[str]): The subject identifiers whose keys
+                should be deleted.
+        """
+        self.key_storage.delete_many(subject_ids)
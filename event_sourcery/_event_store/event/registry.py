@@ -1,9 +1,27 @@
+import importlib
 import inspect
-from typing import Annotated, TypeAlias, get_args, get_origin, get_type_hints
+from dataclasses import dataclass
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    TypeAlias,
+    TypedDict,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from pydantic import BaseModel
 
-from event_sourcery._event_store.event.dto import DataSubject, Encrypted, Event
+from event_sourcery._event_store.event.dto import (
+    DataSubject,
+    Encrypted,
+    Event,
+)
 from event_sourcery.exceptions import (
     ClassModuleUnavailable,
     DuplicatedEvent,
@@ -40,6 +58,30 @@ def get_encrypted_fields(of: type) -> dict[str, Encrypted]:
     return fields
 
 
+def get_encrypted_field(of: type, name: str) -> Encrypted:
+    """Encryption options of a single encrypted field, found by its dotted name.
+
+    Reads fields of pydantic models from `model_fields` instead of resolving
+    type hints of the whole model.
+    """
+    *parents, key = name.split(".")
+    for parent in parents:
+        of = _field_annotation(of, parent)[0]
+    _, metadata = _field_annotation(of, key)
+    return next(m for m in metadata if isinstance(m, Encrypted))
+
+
+def _field_annotation(of: type, name: str) -> tuple[Any, list[Any]]:
+    if issubclass(of, BaseModel):
+        field = of.model_fields[name]
+        return field.annotation, field.metadata
+    hint = get_type_hints(of, include_extras=True)[name]
+    if get_origin(hint) is Annotated:
+        annotation, *metadata = get_args(hint)
+        return annotation, metadata
+    return hint, []
+
+
 def get_data_subject_filed(of: type[BaseModel]) -> str | None:
     return next(
         (
@@ -51,19 +93,178 @@ def get_data_subject_filed(of: type[BaseModel]) -> str | None:
     )
 
 
+JSON_TYPES = (str, int, float, bool, NoneType, Any)
+JSON_CONTAINERS = (list, dict, Union, UnionType)
+
+
+def is_json_native(hint: Any) -> bool:
+    if hint in JSON_TYPES:
+        return True
+    origin = get_origin(hint)
+    if origin is Literal:
+        return True
+    return origin in JSON_CONTAINERS and all(is_json_native(a) for a in get_args(hint))
+
+
+def can_be_trusted(of: type[BaseModel]) -> bool:
+    """Tells whether an event can be constructed from stored data without validation.
+
+    Only events with JSON-native fields and no validators are read back unchanged.
+    """
+    decorators = of.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return False
+    return all(is_json_native(field.annotation) for field in of.model_fields.values())
+
+
+@dataclass(frozen=True)
+class EncryptedField:
+    """Encrypted field of an event type with its paths split ahead of time.
+
+    Attributes:
+        name: Dotted name of the field, e.g. `address.street`.
+        parents: Keys of the dicts nesting the field, e.g. `("address",)`.
+        key: Key of the field in its innermost dict, e.g. `street`.
+        encrypted: Encryption options of the field.
+        subject: Path to the data subject field, `None` if the stream name
+            is the subject.
+    """
+
+    name: str
+    parents: tuple[str, ...]
+    key: str
+    encrypted: Encrypted
+    subject: tuple[str, ...] | None
+
+    @classmethod
+    def compile(
+        cls,
+        name: str,
+        encrypted: Encrypted,
+        subject_field: str | None,
+    ) -> "EncryptedField":
+        *parents, key = name.split(".")
+        return cls(
+            name=name,
+            parents=tuple(parents),
+            key=key,
+            encrypted=encrypted,
+            subject=tuple(subject_field.split(".")) if subject_field else None,
+        )
+
+    def get(self, data: dict[str, Any]) -> Any:
+        for parent in self.parents:
+            data = data[parent]
+        return data[self.key]
+
+    def set(self, data: dict[str, Any], value: Any) -> None:
+        """Sets the field, copying nested dicts instead of modifying them."""
+        for parent in self.parents:
+            data[parent] = dict(data[parent])
+            data = data[parent]
+        data[self.key] = value
+
+    def subject_of(self, event: BaseModel) -> Any:
+        """Data subject of an event instance, `None` if not in the event."""
+        if self.subject is None:
+            return None
+        value: Any = event
+        for attribute in self.subject:
+            value = getattr(value, attribute)
+        return value
+
+    def subject_in(self, data: dict[str, Any]) -> Any:
+        """Data subject of event data, `None` if not in the data."""
+        if self.subject is None:
+            return None
+        value: Any = data
+        for key in self.subject:
+            value = value[key]
+        return value
+
+
+class ManifestEntry(TypedDict):
+    """Registry manifest entry describing a single event type."""
+
+    type: str
+    encrypted: list[str]
+    subject: str | None
+
+
+def import_type(path: str) -> type[TEvent]:
+    """Imports a type from `module:qualified.name` path."""
+    module_name, _, qualname = path.partition(":")
+    imported: Any = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        imported = getattr(imported, attribute)
+    return cast(type[TEvent], imported)
+
+
 class EventRegistry:
     """Keeps mappings between event types and their names.
 
     Normally, there is no need to use it directly. If one needs to have multiple
     registries or wants more granular control, they can pass an instance
-    of EventRegistry to BackendFactory."""
+    of EventRegistry to BackendFactory.
+
+    Events read back from the store were validated when written. With
+    `trusted_reads`, events which fields are all JSON-native (str, int, float, bool,
+    None, lists, dicts and unions of them) and have no validators are constructed
+    with `model_construct`, skipping validation. A single event type can opt in
+    or out regardless of the registry with `__trusted_read__: ClassVar[bool]`.
+    Opting in an event type with other fields leaves them as stored in JSON
+    (e.g. `str` for `UUID` or `dict` for nested models).
+
+    By default, all defined `Event` subclasses are registered on creation and
+    whenever an unknown name or type is looked up. With many event types, build
+    a manifest ahead of time with `manifest()` and pass it to the registry
+    instead: event types are then imported and inspected only when first used.
+    Names not found are remembered until another `Event` subclass is defined,
+    so repeated misses don't scan all events again.
+
+    Args:
+        trusted_reads: Construct events without validation by default.
+        manifest: Event types to import lazily, built with `manifest()`.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        trusted_reads: bool = False,
+        manifest: dict[str, ManifestEntry] | None = None,
+    ) -> None:
+        self._trusted_reads = trusted_reads
         self._types_to_names: dict[type[TEvent], str] = {}
         self._names_to_types: dict[str, type[TEvent]] = {}
         self._encrypted_fields: dict[type[TEvent], dict[str, Encrypted]] = {}
         self._subject_fields: dict[type[TEvent], str] = {}
+        self._encryption_plans: dict[type[TEvent], tuple[EncryptedField, ...]] = {}
+        self._manifest = dict(manifest or {})
+        self._unknown_names: dict[str, int] = {}
+        if manifest is None:
+            self._register_defined_events(Event)
+
+    def manifest(self) -> dict[str, ManifestEntry]:
+        """
+        Describes all defined event types for creating a registry lazily.
+
+        The manifest is JSON serializable, so it can be built once (e.g. during
+        deployment) and loaded on startup.
+
+        Returns:
+            dict[str, ManifestEntry]: Import path, encrypted fields and data
+                subject field of every event type by its name.
+        """
         self._register_defined_events(Event)
+        for name in self._manifest.keys() - self._names_to_types.keys():
+            self._import(name)
+        return {
+            name: ManifestEntry(
+                type=f"{event_type.__module__}:{event_type.__qualname__}",
+                encrypted=list(self._encrypted_fields[event_type]),
+                subject=self._subject_fields.get(event_type),
+            )
+            for name, event_type in sorted(self._names_to_types.items())
+        }
 
     def _register_defined_events(self, for_base: type[TEvent]) -> None:
         for event_type in for_base.__subclasses__():
@@ -72,6 +273,39 @@ class EventRegistry:
             not_registered_type and not_registered_name and self.add(event_type)
             self._register_defined_events(event_type)
 
+    def _import(self, name: str) -> None:
+        entry = self._manifest[name]
+        event_type = import_type(entry["type"])
+        if event_type in self._types_to_names:
+            return
+        self._types_to_names[event_type] = name
+        self._names_to_types[name] = event_type
+        encrypted_fields = {
+            field: get_encrypted_field(of=event_type, name=field)
+            for field in entry["encrypted"]
+        }
+        self._encrypted_fields[event_type] = encrypted_fields
+        if entry["subject"] is not None:
+            self._subject_fields[event_type] = entry["subject"]
+        self._encryption_plans[event_type] = tuple(
+            EncryptedField.compile(
+                field,
+                encrypted,
+                encrypted.subject_field or entry["subject"],
+            )
+            for field, encrypted in encrypted_fields.items()
+        )
+
+    def _resolve(self, name: str) -> None:
+        if name in self._manifest:
+            self._import(name)
+            return
+        if self._unknown_names.get(name) == Event.__defined_events__:
+            return
+        self._register_defined_events(Event)
+        if name not in self._names_to_types:
+            self._unknown_names[name] = Event.__defined_events__
+
     def add(self, event: type[TEvent]) -> type[TEvent]:
         """Add event subclass to the registry."""
         if event in self._types_to_names:
@@ -91,17 +325,48 @@ class EventRegistry:
 
     def type_for_name(self, name: str) -> type[TEvent]:
         if name not in self._names_to_types:
-            self._register_defined_events(Event)
+            self._resolve(name)
         return self._names_to_types[name]
 
     def name_for_type(self, event: type[TEvent]) -> str:
         if event not in self._types_to_names:
-            self._register_defined_events(Event)
+            self._resolve(event_name(event))
         return self._types_to_names[event]
 
     def encrypted_fields(self, of: type[TEvent]) -> dict[str, Encrypted]:
         return self._encrypted_fields[of]
 
+    def encryption_plan(self, of: type[TEvent]) -> tuple[EncryptedField, ...]:
+        """
+        Encrypted fields of an event type with their data subjects resolved.
+
+        Compiled once per event type, so encrypting and decrypting events
+        doesn't parse field names again.
+
+        Args:
+            of (type[TEvent]): The event type.
+
+        Returns:
+            tuple[EncryptedField, ...]: The encrypted fields, empty if none.
+        """
+        plan = self._encryption_plans.get(of)
+        if plan is None:
+            plan = self._encryption_plans[of] = tuple(
+                EncryptedField.compile(
+                    name,
+                    encrypted,
+                    self.subject_filed(name, of=of),
+                )
+                for name, encrypted in self._encrypted_fields[of].items()
+            )
+        return plan
+
+    def is_trusted(self, of: type[TEvent]) -> bool:
+        trusted = getattr(of, "__trusted_read__", None)
+        if trusted is not None:
+            return bool(trusted)
+        return self._trusted_reads and can_be_trusted(of)
+
     def subject_filed(self, for_field: str, of: type[TEvent]) -> str | None:
         metadata = self._encrypted_fields[of].get(for_field)
         return (metadata and metadata.subject_field) or self._subject_fields.get(of)
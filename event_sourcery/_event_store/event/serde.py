@@ -1,9 +1,16 @@
-import dataclasses
-from collections.abc import Mapping, Sequence
-from typing import cast
+from collections.abc import Hashable, Mapping, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
+from typing import Any, TypeAlias, TypeVar, cast
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
 
 from event_sourcery._event_store.event.dto import (
     Context,
+    LazyWrappedEvent,
     RawEvent,
     Recorded,
     RecordedRaw,
@@ -11,44 +18,436 @@ from event_sourcery._event_store.event.dto import (
 )
 from event_sourcery._event_store.event.encryption import Encryption
 from event_sourcery._event_store.event.registry import EventRegistry
+from event_sourcery._event_store.event.upcasting import (
+    SCHEMA_VERSION,
+    Upcaster,
+    Upcasters,
+    schema_version,
+)
 from event_sourcery._event_store.stream_id import StreamId
 
 
+@dataclass(frozen=True)
+class _Serializer:
+    """Serialization plan compiled once per event type."""
+
+    name: str
+    encrypted: bool
+    schema_version: int
+
+
+@dataclass(frozen=True)
+class _Deserializer:
+    """Deserialization plan compiled once per event name."""
+
+    event_type: type[BaseModel]
+    wrapped_type: Any
+    encrypted: bool
+    trusted: bool
+    fields: frozenset[str]
+    schema_version: int
+
+    def __call__(
+        self,
+        event: RawEvent,
+        encryption: Encryption,
+        upcasters: Upcasters,
+        contexts: "_Contexts",
+        keys: Mapping[str, bytes] | None = None,
+    ) -> WrappedEvent:
+        return self.wrap(
+            self.event(event, encryption, upcasters, keys),
+            event,
+            contexts(event.context),
+        )
+
+    def wrap(self, event: BaseModel, raw: RawEvent, context: Context) -> WrappedEvent:
+        return self.wrapped_type(  # type: ignore[no-any-return]
+            event=event,
+            version=raw.version,
+            uuid=raw.uuid,
+            created_at=raw.created_at,
+            context=context,
+        )
+
+    def lazy(
+        self,
+        event: RawEvent,
+        encryption: Encryption,
+        upcasters: Upcasters,
+        contexts: "_Contexts",
+    ) -> LazyWrappedEvent:
+        return LazyWrappedEvent(
+            name=event.name,
+            version=event.version,
+            uuid=event.uuid,
+            created_at=event.created_at,
+            decode_event=partial(self.event, event, encryption, upcasters),
+            decode_context=partial(contexts, event.context),
+        )
+
+    def event(
+        self,
+        event: RawEvent,
+        encryption: Encryption,
+        upcasters: Upcasters,
+        keys: Mapping[str, bytes] | None = None,
+    ) -> BaseModel:
+        data = self.upcast(event, event.data, upcasters)
+        return self.decode(data, event.stream_id, encryption, keys)
+
+    def decode(
+        self,
+        data: dict[str, Any],
+        stream_id: StreamId,
+        encryption: Encryption,
+        keys: Mapping[str, bytes] | None = None,
+    ) -> BaseModel:
+        """Decrypts (if needed) and constructs the event from upcasted data."""
+        if self.encrypted:
+            data = encryption.decrypt(self.event_type, data, stream_id, keys)
+        return self._event(data)
+
+    def upcast(
+        self,
+        event: RawEvent,
+        data: dict[str, Any],
+        upcasters: Upcasters,
+    ) -> dict[str, Any]:
+        stored_version = event.context.get(SCHEMA_VERSION, 1)
+        if stored_version == self.schema_version:
+            return data
+        return upcasters.chain(event.name, stored_version, self.schema_version)(data)
+
+    def _event(self, data: dict[str, Any]) -> BaseModel:
+        if not self.trusted:
+            return self.event_type(**data)
+        if data.keys() != self.fields or self.event_type.__private_attributes__:
+            return self.event_type.model_construct(**data)
+        # same as model_construct when every field is stored, but much faster
+        return _construct(self.event_type, dict(data), set(self.fields), None)
+
+
+class _Contexts:
+    """Interns contexts read from the store.
+
+    Most events share a handful of contexts (e.g. all events of a command carry
+    the same correlation id), so equal stored contexts are validated once and
+    events get contexts sharing their values copy-on-write. Contexts with unhashable
+    values (e.g. lists) are not interned. To stay bounded, the cache starts over
+    once `max_size` distinct contexts are interned.
+    """
+
+    def __init__(self, max_size: int = 1_024) -> None:
+        self._max_size = max_size
+        self._interned: dict[Hashable, Context] = {}
+
+    def __call__(self, stored: dict[str, Any]) -> Context:
+        # value types are a part of the key, as 1 == 1.0 == True
+        key = tuple(
+            (name, value.__class__, value)
+            for name, value in stored.items()
+            if name != SCHEMA_VERSION
+        )
+        try:
+            return self._interned[key]._share()
+        except KeyError:
+            pass
+        except TypeError:  # unhashable values
+            return Context(**_context_data(stored))
+
+        context = Context(**_context_data(stored))
+        if len(self._interned) >= self._max_size:
+            self._interned.clear()
+        self._interned[key] = context
+        return context._share()
+
+
+def _context_data(context: dict[str, Any]) -> dict[str, Any]:
+    if SCHEMA_VERSION not in context:
+        return context
+    return {key: value for key, value in context.items() if key != SCHEMA_VERSION}
+
+
+_TModel = TypeVar("_TModel", bound=BaseModel)
+
+# field values, extra values and fields set of a model without private attributes
+_Dumped: TypeAlias = tuple[dict[str, Any], dict[str, Any] | None, set[str]]
+
+
+def _construct(
+    model: type[_TModel],
+    values: dict[str, Any],
+    fields_set: set[str],
+    extra: dict[str, Any] | None,
+) -> _TModel:
+    instance = object.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", extra)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _dump(instance: BaseModel) -> _Dumped | BaseModel:
+    """Cheaper to pickle than a model, restored with `_load`."""
+    if instance.__pydantic_private__:
+        return instance
+    return (
+        instance.__dict__,
+        instance.__pydantic_extra__,
+        instance.__pydantic_fields_set__,
+    )
+
+
+def _load(model: type[_TModel], dumped: _Dumped | BaseModel) -> _TModel:
+    if isinstance(dumped, BaseModel):
+        return cast(_TModel, dumped)
+    values, extra, fields_set = dumped
+    return _construct(model, values, fields_set, extra)
+
+
+def _validate_chunk(
+    deserializers: dict[str, _Deserializer],
+    chunk: list[tuple[str, dict[str, Any]]],
+) -> list[_Dumped | BaseModel]:
+    return [_dump(deserializers[name]._event(data)) for name, data in chunk]
+
+
+@dataclass(frozen=True)
+class ParallelDeserialization:
+    """
+    Deserializes big batches of events in parallel with an executor.
+
+    A batch is split into chunks deserialized by `executor` (usually
+    a `ProcessPoolExecutor`), then reassembled in the original order.
+    Workers receive deserialization plans of stored event types instead
+    of the whole registry, so event types must be importable by workers
+    (defined at module level). Events with encrypted fields are deserialized
+    in the calling process, as keys are available only there.
+
+    The calling process still pickles stored data and unpickles validated
+    values, which costs about as much as validating events with plain JSON
+    fields, and more for events with nested models. It pays off only when
+    validation is much costlier than that (e.g. expensive validators) and
+    many cores are available, so measure with
+    `python -m benchmarks.parallel_deserialization` first.
+
+    The executor is owned by the caller, who is responsible for shutting it down.
+
+    Examples:
+        >>> backend.with_parallel_deserialization(
+        ...     ProcessPoolExecutor(max_workers=16),
+        ...     min_batch_size=2_000,
+        ... )
+
+    Attributes:
+        executor (Executor): Executor running deserialization of chunks.
+        min_batch_size (int): Smaller batches are deserialized sequentially,
+            as sending them to workers costs more than it saves.
+        chunk_size (int): Number of events deserialized by a worker at once.
+    """
+
+    executor: Executor
+    min_batch_size: int = 1_000
+    chunk_size: int = 500
+
+
+class _Plans:
+    """Compiled plans and interned contexts shared by `Serde`s of a registry.
+
+    Backends create a new `Serde` for every event store, outbox or dispatcher,
+    so plans are kept as long as the registry they were compiled from.
+    """
+
+    def __init__(self) -> None:
+        self.deserializers: dict[str, _Deserializer] = {}
+        self.serializers: dict[type[BaseModel], _Serializer] = {}
+        self.contexts = _Contexts()
+
+
+_plans: WeakKeyDictionary[EventRegistry, _Plans] = WeakKeyDictionary()
+
+
+def _plans_of(registry: EventRegistry) -> _Plans:
+    plans = _plans.get(registry)
+    if plans is None:
+        plans = _plans.setdefault(registry, _Plans())
+    return plans
+
+
 class Serde:
     def __init__(
         self,
         registry: EventRegistry,
         encryption: Encryption,
+        parallel: ParallelDeserialization | None = None,
+        upcasters: Upcasters | None = None,
     ) -> None:
         self.registry = registry
         self.encryption = encryption
+        self.parallel = parallel
+        self.upcasters = upcasters or Upcasters()
+        plans = _plans_of(registry)
+        self._deserializers = plans.deserializers
+        self._serializers = plans.serializers
+        self._contexts = plans.contexts
 
     def deserialize(self, event: RawEvent) -> WrappedEvent:
-        event_as_dict = dataclasses.asdict(event)
-        del event_as_dict["stream_id"]
-        del event_as_dict["name"]
-        data = cast(Mapping, event_as_dict.pop("data"))
-        context = event_as_dict.pop("context", {})
-        event_as_dict["context"] = Context(**context)
-        event_type = self.registry.type_for_name(event.name)
-
-        processed_data = self.encryption.decrypt(
-            event_type,
-            dict(data),
-            event.stream_id,
-        )
+        deserializer = self._deserializer(event.name)
+        return deserializer(event, self.encryption, self.upcasters, self._contexts)
+
+    def deserialize_lazy(self, event: RawEvent) -> LazyWrappedEvent:
+        deserializer = self._deserializer(event.name)
+        return deserializer.lazy(event, self.encryption, self.upcasters, self._contexts)
+
+    def _deserializer(self, name: str) -> _Deserializer:
+        deserializer = self._deserializers.get(name)
+        if deserializer is None:
+            deserializer = self._compile(name)
+        return deserializer
 
-        return WrappedEvent[event_type](  # type: ignore[valid-type]
-            **event_as_dict,
-            event=event_type(**processed_data),
+    def _compile(self, name: str) -> _Deserializer:
+        event_type = self.registry.type_for_name(name)
+        deserializer = _Deserializer(
+            event_type=event_type,
+            wrapped_type=WrappedEvent[event_type],  # type: ignore[valid-type]
+            encrypted=bool(self.registry.encrypted_fields(of=event_type)),
+            trusted=self.registry.is_trusted(of=event_type),
+            fields=frozenset(event_type.model_fields),
+            schema_version=schema_version(of=event_type),
         )
+        self._deserializers[name] = deserializer
+        return deserializer
 
     def deserialize_many(self, events: Sequence[RawEvent]) -> list[WrappedEvent]:
-        return [self.deserialize(event) for event in events]
+        deserializers = [self._deserializer(event.name) for event in events]
+        upcasted = self._upcast_many(events, deserializers)
+        keys = self._fetch_keys(events, deserializers, upcasted)
+        if self.parallel is None or len(events) < self.parallel.min_batch_size:
+            return [
+                deserializer.wrap(
+                    deserializer.decode(data, event.stream_id, self.encryption, keys),
+                    event,
+                    self._contexts(event.context),
+                )
+                for event, deserializer, data in zip(
+                    events, deserializers, upcasted, strict=True
+                )
+            ]
+        return self._deserialize_in_parallel(
+            events, deserializers, upcasted, self.parallel, keys
+        )
+
+    def _upcast_many(
+        self,
+        events: Sequence[RawEvent],
+        deserializers: Sequence[_Deserializer],
+    ) -> list[dict[str, Any]]:
+        """Upcasts stored data, resolving a chain once per name and version."""
+        chains: dict[tuple[str, int], Upcaster] = {}
+        upcasted = []
+        for event, deserializer in zip(events, deserializers, strict=True):
+            stored_version = event.context.get(SCHEMA_VERSION, 1)
+            if stored_version == deserializer.schema_version:
+                upcasted.append(event.data)
+                continue
+            chain = chains.get((event.name, stored_version))
+            if chain is None:
+                chain = chains[event.name, stored_version] = self.upcasters.chain(
+                    event.name, stored_version, deserializer.schema_version
+                )
+            upcasted.append(chain(event.data))
+        return upcasted
+
+    def _fetch_keys(
+        self,
+        events: Sequence[RawEvent],
+        deserializers: Sequence[_Deserializer],
+        upcasted: Sequence[dict[str, Any]],
+    ) -> dict[str, bytes] | None:
+        """Fetches keys of all encrypted events at once, instead of one by one."""
+        encrypted = [
+            (deserializer.event_type, data, event.stream_id)
+            for event, deserializer, data in zip(
+                events, deserializers, upcasted, strict=True
+            )
+            if deserializer.encrypted
+        ]
+        if not encrypted:
+            return None
+        return self.encryption.fetch_keys(encrypted)
+
+    def _deserialize_in_parallel(
+        self,
+        events: Sequence[RawEvent],
+        deserializers: Sequence[_Deserializer],
+        upcasted: Sequence[dict[str, Any]],
+        parallel: ParallelDeserialization,
+        keys: Mapping[str, bytes] | None,
+    ) -> list[WrappedEvent]:
+        result: list[WrappedEvent | None] = [None] * len(events)
+        in_workers: list[int] = []
+        raw_events: list[RawEvent] = []
+        to_validate: list[tuple[str, dict[str, Any]]] = []
+        plans: dict[str, _Deserializer] = {}
+        for index, (event, deserializer, data) in enumerate(
+            zip(events, deserializers, upcasted, strict=True)
+        ):
+            if deserializer.encrypted:
+                result[index] = deserializer.wrap(
+                    deserializer.decode(data, event.stream_id, self.encryption, keys),
+                    event,
+                    self._contexts(event.context),
+                )
+            else:
+                plans[event.name] = deserializer
+                in_workers.append(index)
+                raw_events.append(event)
+                to_validate.append((event.name, data))
+
+        size = parallel.chunk_size
+        chunks = [
+            to_validate[start : start + size]
+            for start in range(0, len(to_validate), size)
+        ]
+        validated = parallel.executor.map(partial(_validate_chunk, plans), chunks)
+        for index, event, dumped in zip(
+            in_workers, raw_events, chain.from_iterable(validated), strict=True
+        ):
+            deserializer = plans[event.name]
+            result[index] = deserializer.wrap(
+                _load(deserializer.event_type, dumped),
+                event,
+                self._contexts(event.context),
+            )
+        return result  # type: ignore[return-value]
+
+    def deserialize_records(
+        self,
+        records: Sequence[RecordedRaw],
+        lazy: bool = False,
+    ) -> list[Recorded]:
+        if lazy:
+            return [self.deserialize_record(record, lazy=True) for record in records]
+        wrapped_events = self.deserialize_many([record.entry for record in records])
+        return [
+            Recorded(
+                wrapped_event=wrapped,
+                stream_id=record.entry.stream_id,
+                position=record.position,
+                tenant_id=record.tenant_id,
+            )
+            for wrapped, record in zip(wrapped_events, records, strict=True)
+        ]
 
-    def deserialize_record(self, record: RecordedRaw) -> Recorded:
+    def deserialize_record(self, record: RecordedRaw, lazy: bool = False) -> Recorded:
         return Recorded(
-            wrapped_event=self.deserialize(record.entry),
+            wrapped_event=(
+                self.deserialize_lazy(record.entry)
+                if lazy
+                else self.deserialize(record.entry)
+            ),
             stream_id=record.entry.stream_id,
             position=record.position,
             tenant_id=record.tenant_id,
@@ -59,17 +458,52 @@ class Serde:
         event: WrappedEvent,
         stream_id: StreamId,
     ) -> RawEvent:
+        return self._serialize(event, stream_id, event.context.model_dump(mode="json"))
+
+    def serialize_many(
+        self, events: Sequence[WrappedEvent], stream_id: StreamId
+    ) -> list[RawEvent]:
+        # events of a single commit usually share the same context object
+        contexts: dict[int, dict[str, Any]] = {}
+        serialized = []
+        for event in events:
+            context = contexts.get(id(event.context))
+            if context is None:
+                context = event.context.model_dump(mode="json")
+                contexts[id(event.context)] = context
+            serialized.append(self._serialize(event, stream_id, dict(context)))
+        return serialized
+
+    def _serialize(
+        self,
+        event: WrappedEvent,
+        stream_id: StreamId,
+        context: dict[str, Any],
+    ) -> RawEvent:
+        serializer = self._serializers.get(type(event.event))
+        if serializer is None:
+            serializer = self._compile_serializer(type(event.event))
+        if serializer.schema_version != 1:
+            context[SCHEMA_VERSION] = serializer.schema_version
         return RawEvent(
             uuid=event.uuid,
             stream_id=stream_id,
             created_at=event.created_at,
             version=event.version,
-            name=self.registry.name_for_type(type(event.event)),
-            data=self.encryption.encrypt(event.event, stream_id),
-            context=event.context.model_dump(mode="json"),
+            name=serializer.name,
+            data=(
+                self.encryption.encrypt(event.event, stream_id)
+                if serializer.encrypted
+                else event.event.model_dump(mode="json")
+            ),
+            context=context,
         )
 
-    def serialize_many(
-        self, events: Sequence[WrappedEvent], stream_id: StreamId
-    ) -> list[RawEvent]:
-        return [self.serialize(event, stream_id) for event in events]
+    def _compile_serializer(self, event_type: type[BaseModel]) -> _Serializer:
+        serializer = _Serializer(
+            name=self.registry.name_for_type(event_type),
+            encrypted=bool(self.registry.encrypted_fields(of=event_type)),
+            schema_version=schema_version(of=event_type),
+        )
+        self._serializers[event_type] = serializer
+        return serializer
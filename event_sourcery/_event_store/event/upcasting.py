@@ -0,0 +1,114 @@
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any, TypeAlias
+
+from event_sourcery._event_store.event.registry import event_name
+from event_sourcery.exceptions import DuplicatedUpcaster, MissingUpcaster
+
+SCHEMA_VERSION = "__schema_version__"
+
+Upcaster: TypeAlias = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def schema_version(of: type) -> int:
+    """Current schema version of the event type (1 unless declared otherwise)."""
+    return int(getattr(of, "__schema_version__", 1))
+
+
+class Upcasters:
+    """
+    Registry of functions migrating stored event data to newer schema versions.
+
+    Event types declare their current schema version with
+    `__schema_version__: ClassVar[int]` (1 by default), which is stored with
+    every appended event. Events stored with an older version are upcasted
+    on load before constructing the event, so event classes don't need
+    compatibility validators for old payloads.
+
+    Each upcaster migrates data by a single version. Chains of upcasters from
+    a stored version to the current one are composed once and cached.
+    Upcasters get a shallow copy of stored data and must not modify nested
+    values in place.
+    Encrypted fields are upcasted before decryption, so upcasters may rename
+    or move them (and data subject fields) but must not read or change their
+    values.
+
+    Examples:
+        >>> class OrderPlaced(Event):
+        ...     __schema_version__: ClassVar[int] = 2
+        ...     currency: str
+        >>> @backend[Upcasters].register(OrderPlaced, from_version=1)
+        ... def add_currency(data: dict[str, Any]) -> dict[str, Any]:
+        ...     return {**data, "currency": "EUR"}
+    """
+
+    def __init__(self) -> None:
+        self._upcasters: dict[str, dict[int, Upcaster]] = defaultdict(dict)
+        self._chains: dict[tuple[str, int, int], Upcaster] = {}
+
+    def register(
+        self,
+        event: type | str,
+        from_version: int,
+    ) -> Callable[[Upcaster], Upcaster]:
+        """
+        Decorator adding an upcaster, see `add`.
+        """
+
+        def _register(upcaster: Upcaster) -> Upcaster:
+            self.add(event, from_version, upcaster)
+            return upcaster
+
+        return _register
+
+    def add(self, event: type | str, from_version: int, upcaster: Upcaster) -> None:
+        """
+        Adds an upcaster migrating event data from `from_version` to the next one.
+
+        Args:
+            event (type | str): The event type or its name in the event store.
+            from_version (int): The schema version of data given to the upcaster.
+            upcaster (Upcaster): Function returning data of the next version.
+
+        Raises:
+            DuplicatedUpcaster: If an upcaster for that version was added before.
+        """
+        name = event if isinstance(event, str) else event_name(event)
+        if from_version in self._upcasters[name]:
+            raise DuplicatedUpcaster(f"Duplicated upcaster of {name} v{from_version}")
+        self._upcasters[name][from_version] = upcaster
+        self._chains.clear()
+
+    def chain(self, name: str, from_version: int, to_version: int) -> Upcaster:
+        """
+        Returns a function upcasting event data through all versions in between.
+
+        Args:
+            name (str): The event name in the event store.
+            from_version (int): The schema version of stored data.
+            to_version (int): The current schema version of the event type.
+
+        Raises:
+            MissingUpcaster: If an upcaster for any version in between is missing.
+        """
+        key = (name, from_version, to_version)
+        chain = self._chains.get(key)
+        if chain is None:
+            chain = self._chains[key] = self._compose(name, from_version, to_version)
+        return chain
+
+    def _compose(self, name: str, from_version: int, to_version: int) -> Upcaster:
+        upcasters = self._upcasters.get(name, {})
+        steps = []
+        for version in range(from_version, to_version):
+            if version not in upcasters:
+                raise MissingUpcaster(event_name=name, from_version=version)
+            steps.append(upcasters[version])
+
+        def _chain(data: dict[str, Any]) -> dict[str, Any]:
+            data = dict(data)
+            for step in steps:
+                data = step(data)
+            return data
+
+        return _chain
@@ -1,17 +1,22 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from functools import singledispatchmethod
 from typing import cast
 
 from typing_extensions import Self
 
+from event_sourcery._event_store.append_result import AppendResult
 from event_sourcery._event_store.event.dto import (
     Event,
     Position,
     RawEvent,
+    Recorded,
+    RecordedRaw,
     WrappedEvent,
 )
 from event_sourcery._event_store.event.serde import Serde
-from event_sourcery._event_store.stream_id import StreamId
+from event_sourcery._event_store.stream_id import StreamCategory, StreamId
+from event_sourcery._event_store.stream_info import StreamInfo
+from event_sourcery._event_store.tenant_id import TenantId
 from event_sourcery._event_store.versioning import (
     NO_VERSIONING,
     ExplicitVersioning,
@@ -47,12 +52,86 @@ class StorageStrategy:
         """
         raise NotImplementedError()
 
+    def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[RawEvent]:
+        """
+        Lazily iterates over events from a stream in the given range.
+
+        Events are fetched page by page, so the whole stream is never held in memory.
+
+        Args:
+            stream_id (StreamId): The stream identifier to iterate events from.
+            start (int | None): From version (inclusive), or None for the beginning.
+            stop (int | None): Stop before version (exclusive), or None for the end.
+            page_size (int): Number of events fetched from the storage at once.
+
+        Returns:
+            Iterator[RawEvent]: Raw events in the specified range.
+        """
+        raise NotImplementedError()
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> Iterator[RecordedRaw]:
+        """
+        Lazily iterates over events of all streams in a category in position order.
+
+        Events are fetched page by page with keyset pagination on the position.
+
+        Args:
+            category (StreamCategory): The category of streams to scan.
+            after_position (Position): Position to scan after (exclusive).
+            page_size (int): Number of events fetched from the storage at once.
+            tenant_id (TenantId | None): Tenant to scan events of, or None for all.
+
+        Returns:
+            Iterator[RecordedRaw]: Raw events with their positions and tenant ids.
+        """
+        raise NotImplementedError()
+
+    def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        """
+        Fetches events of many streams at once, each from its newest snapshot.
+
+        Args:
+            stream_ids (Sequence[StreamId]): The stream identifiers to fetch events from.
+
+        Returns:
+            dict[StreamId, list[RawEvent]]: Raw events of every requested stream.
+                Streams that don't exist are mapped to an empty list.
+        """
+        raise NotImplementedError()
+
+    def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        """
+        Fetches metadata of a stream without fetching its events.
+
+        Args:
+            stream_id (StreamId): The stream identifier to describe.
+
+        Returns:
+            StreamInfo | None: Metadata of the stream or None if it doesn't exist.
+        """
+        raise NotImplementedError()
+
     def insert_events(
         self,
         stream_id: StreamId,
         versioning: Versioning,
         events: list[RawEvent],
-    ) -> None:
+    ) -> AppendResult:
         """
         Inserts events into a stream with using versioning strategy.
 
@@ -60,6 +139,28 @@ class StorageStrategy:
             stream_id (StreamId): The stream identifier to insert events into.
             versioning (Versioning): Versioning strategy for optimistic locking.
             events (list[RawEvent]): List of raw events to insert.
+
+        Returns:
+            AppendResult: New version of the stream and position of the last event.
+        """
+        raise NotImplementedError()
+
+    def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        """
+        Inserts events into many streams at once, all or nothing.
+
+        Versions of all streams are checked before any event is written. If any of
+        them does not match, nothing is inserted.
+
+        Args:
+            streams (Mapping[StreamId, tuple[list[RawEvent], Versioning]]):
+                Raw events and versioning strategy for each stream to insert into.
+
+        Returns:
+            dict[StreamId, AppendResult]: Result of the insert into each stream.
         """
         raise NotImplementedError()
 
@@ -101,6 +202,51 @@ class StorageStrategy:
         raise NotImplementedError()
 
 
+def wrap_events(
+    events: Sequence[WrappedEvent] | Sequence[Event],
+    expected_version: int | Versioning,
+) -> Sequence[WrappedEvent]:
+    if not events or not isinstance(events[0], Event):
+        return cast(Sequence[WrappedEvent], events)
+    if isinstance(expected_version, Versioning):
+        return [WrappedEvent.wrap(event=event, version=None) for event in events]
+    return [
+        WrappedEvent.wrap(event=event, version=version)
+        for version, event in enumerate(events, start=expected_version + 1)
+    ]
+
+
+def versioning_for(
+    events: Sequence[WrappedEvent],
+    expected_version: int | Versioning,
+) -> Versioning:
+    if expected_version is NO_VERSIONING:
+        return NO_VERSIONING
+    return ExplicitVersioning(
+        expected_version=cast(int, expected_version),
+        initial_version=cast(int, events[-1].version),
+    )
+
+
+def serialize_batch(
+    serde: Serde,
+    streams: Mapping[
+        StreamId,
+        tuple[Sequence[WrappedEvent] | Sequence[Event], int | Versioning],
+    ],
+) -> dict[StreamId, tuple[list[RawEvent], Versioning]]:
+    batch: dict[StreamId, tuple[list[RawEvent], Versioning]] = {}
+    for stream_id, (events, expected_version) in streams.items():
+        if not events:
+            continue
+        wrapped_events = wrap_events(events, expected_version)
+        batch[stream_id] = (
+            serde.serialize_many(wrapped_events, stream_id),
+            versioning_for(wrapped_events, expected_version),
+        )
+    return batch
+
+
 class EventStore:
     """API for working with events."""
 
@@ -135,6 +281,123 @@ class EventStore:
         events = self._storage_strategy.fetch_events(stream_id, start=start, stop=stop)
         return self._serde.deserialize_many(events)
 
+    def iter_stream(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[WrappedEvent]:
+        """Lazily iterates over events from a given stream.
+
+        Works like `load_stream`, but events are fetched from the storage in pages
+        and deserialized one by one, so long streams don't have to fit in memory.
+
+        Examples:
+            >>> list(event_store.iter_stream(StreamId(name="not_existing_stream")))
+            []
+            >>> for event in event_store.iter_stream(StreamId(), page_size=500):
+            ...     aggregate.__apply__(event.event)
+
+        Args:
+            stream_id: The stream identifier to iterate events from.
+            start: The stream version to start iterating from (including).
+            stop: The stream version to stop iterating at (excluding).
+            page_size: Number of events fetched from the storage at once.
+
+        Returns:
+            An iterator over events, empty if the stream doesn't exist.
+        """
+        events = self._storage_strategy.iter_events(
+            stream_id,
+            start=start,
+            stop=stop,
+            page_size=page_size,
+        )
+        return (self._serde.deserialize(event) for event in events)
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> Iterator[Recorded]:
+        """Lazily iterates over events stored so far in streams of a category.
+
+        Unlike a subscription to the category, it's a plain paged read without gap
+        detection nor time limits, ending at the last stored event. Suited for
+        rebuilding read models from scratch.
+
+        Examples:
+            >>> for record in event_store.scan_category("invoices", page_size=1000):
+            ...     projection.handle(record)
+            ...     checkpoint = record.position
+
+        Args:
+            category: The category of streams to scan.
+            after_position: Position of the last already handled event, if resuming.
+            page_size: Number of events fetched from the storage at once.
+            tenant_id: Tenant to scan events of, or None to scan events of all tenants.
+
+        Returns:
+            An iterator over recorded events, ordered by position.
+        """
+        records = self._storage_strategy.scan_category(
+            category,
+            after_position=after_position,
+            page_size=page_size,
+            tenant_id=tenant_id,
+        )
+        return (self._serde.deserialize_record(record) for record in records)
+
+    def load_streams(
+        self,
+        stream_ids: Iterable[StreamId],
+    ) -> dict[StreamId, Sequence[WrappedEvent]]:
+        """Loads events of many streams at once.
+
+        Examples:
+            >>> event_store.load_streams([StreamId(name="existing_stream"), StreamId()])
+            {
+                StreamId(..., name="existing_stream"): [WrappedEvent(..., version=1)],
+                StreamId(...): [],
+            }
+
+        Args:
+            stream_ids: The stream identifiers to load events from.
+
+        Returns:
+            A mapping of every given stream id to its events (empty if the stream
+            doesn't exist).
+        """
+        stream_ids = list(dict.fromkeys(stream_ids))
+        if not stream_ids:
+            return {}
+        events = self._storage_strategy.fetch_events_many(stream_ids)
+        return {
+            stream_id: self._serde.deserialize_many(events.get(stream_id, []))
+            for stream_id in stream_ids
+        }
+
+    def stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        """Returns metadata of a stream without loading and deserializing its events.
+
+        Examples:
+            >>> event_store.stream_info(StreamId(name="not_existing_stream"))
+            None
+            >>> event_store.stream_info(StreamId(name="existing_stream"))
+            StreamInfo(..., version=3, event_count=3, ...)
+
+        Args:
+            stream_id: The stream identifier to describe.
+
+        Returns:
+            Version, event count, timestamps and latest snapshot version of the stream,
+            or None if the stream doesn't exist.
+        """
+        return self._storage_strategy.fetch_stream_info(stream_id)
+
     @singledispatchmethod
     def append(
         self,
@@ -142,7 +405,7 @@ class EventStore:
         *events: WrappedEvent,
         stream_id: StreamId,
         expected_version: int | Versioning = 0,
-    ) -> None:
+    ) -> AppendResult:
         """Appends events to a stream with a given ID.
 
         Implements optimistic locking to ensure stream wasn't modified since last read.
@@ -150,9 +413,9 @@ class EventStore:
 
         Examples:
             >>> event_store.append(WrappedEvent(...), stream_id=StreamId())
-            None
+            AppendResult(version=1, position=...)
             >>> event_store.append(WrappedEvent(...), stream_id=StreamId(), expected_version=1)
-            None
+            AppendResult(version=2, position=...)
 
         Args:
             first: The first event to append (WrappedEvent or Event).
@@ -161,9 +424,9 @@ class EventStore:
             expected_version: The expected version of the stream
 
         Returns:
-            None
+            New version of the stream and position of the last appended event.
         """
-        self._append(
+        return self._append(
             stream_id=stream_id,
             events=(first, *events),
             expected_version=expected_version,
@@ -175,53 +438,57 @@ class EventStore:
         *events: Event,
         stream_id: StreamId,
         expected_version: int | Versioning = 0,
-    ) -> None:
-        wrapped_events = self._wrap_events(expected_version, events)
-        self.append(
-            *wrapped_events,
+    ) -> AppendResult:
+        return self.append(
+            *wrap_events(events, expected_version),
             stream_id=stream_id,
             expected_version=expected_version,
         )
 
-    @singledispatchmethod
-    def _wrap_events(
-        self,
-        expected_version: int,
-        events: Sequence[Event],
-    ) -> Sequence[WrappedEvent]:
-        return [
-            WrappedEvent.wrap(event=event, version=version)
-            for version, event in enumerate(events, start=expected_version + 1)
-        ]
-
-    @_wrap_events.register
-    def _wrap_events_versioning(
-        self, expected_version: Versioning, events: Sequence[Event]
-    ) -> Sequence[WrappedEvent]:
-        return [WrappedEvent.wrap(event=event, version=None) for event in events]
-
     def _append(
         self,
         stream_id: StreamId,
         events: Sequence[WrappedEvent],
         expected_version: int | Versioning,
-    ) -> None:
-        new_version = events[-1].version
-        versioning: Versioning
-        if expected_version is not NO_VERSIONING:
-            versioning = ExplicitVersioning(
-                expected_version=cast(int, expected_version),
-                initial_version=cast(int, new_version),
-            )
-        else:
-            versioning = NO_VERSIONING
-
-        self._storage_strategy.insert_events(
+    ) -> AppendResult:
+        return self._storage_strategy.insert_events(
             stream_id=stream_id,
-            versioning=versioning,
+            versioning=versioning_for(events, expected_version),
             events=self._serde.serialize_many(events, stream_id),
         )
 
+    def append_many(
+        self,
+        streams: Mapping[
+            StreamId,
+            tuple[Sequence[WrappedEvent] | Sequence[Event], int | Versioning],
+        ],
+    ) -> dict[StreamId, AppendResult]:
+        """Appends events to many streams in a single write.
+
+        Optimistic locking is applied to every stream and it is all or nothing:
+        if the version of any stream doesn't match, no events are appended.
+
+        Examples:
+            >>> event_store.append_many({
+            ...     StreamId(): ([WrappedEvent(...)], 0),
+            ...     StreamId(): ([Event(...), Event(...)], 3),
+            ... })
+            {StreamId(...): AppendResult(version=1, ...), StreamId(...): AppendResult(version=5, ...)}
+
+        Args:
+            streams: Events (WrappedEvent or Event) and the expected version
+                of each stream to append to.
+
+        Returns:
+            New version and position of the last appended event of each stream
+            with events to append.
+        """
+        batch = serialize_batch(self._serde, streams)
+        if not batch:
+            return {}
+        return self._storage_strategy.insert_events_many(batch)
+
     def delete_stream(self, stream_id: StreamId) -> None:
         """Deletes a stream with a given ID.
 
@@ -0,0 +1,234 @@
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from datetime import timedelta
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
+from time import monotonic
+from types import TracebackType
+from typing import Any
+
+from typing_extensions import Self
+
+from event_sourcery._event_store.append_result import AppendResult
+from event_sourcery._event_store.event.dto import Event, WrappedEvent
+from event_sourcery._event_store.event_store import EventStore
+from event_sourcery._event_store.stream_id import StreamId
+from event_sourcery._event_store.versioning import Versioning
+
+
+@dataclass
+class _Append:
+    stream_id: StreamId
+    events: Sequence[WrappedEvent] | Sequence[Event]
+    expected_version: int | Versioning
+    future: Future[AppendResult] = field(default_factory=Future)
+
+
+class GroupCommitEventStore:
+    """Appends events from many threads in shared writes.
+
+    Wraps an `EventStore` with a writer thread that collects `append` calls over
+    a short window, then writes them all with a single `EventStore.append_many`
+    within a single transaction. Each caller waits for its own outcome: if the
+    group write fails (e.g. one of the streams was modified concurrently), every
+    append from the group is retried in its own transaction, so only the offending
+    callers get an error like `ConcurrentStreamWriteError`.
+
+    Appends to the same stream within a window are written in consecutive groups,
+    in the order they were made.
+
+    The wrapped event store is used only by the writer thread, so it must not be
+    shared with other threads. For database backends, give it a dedicated session.
+
+    If the writer thread stops on an error that isn't an `Exception`, pending
+    appends fail with it and the store rejects new ones as if it was closed.
+
+    Examples:
+        >>> with GroupCommitEventStore(backend.event_store, session.begin) as store:
+        ...     store.append(Event(...), stream_id=StreamId(), expected_version=3)
+        AppendResult(version=4, position=...)
+
+    Args:
+        event_store: The event store to write with.
+        transaction: Factory of a context manager committing the write on exit
+            and rolling it back on exception, e.g. `Session.begin` for SQLAlchemy.
+            By default, no transaction is managed.
+        window: How long to wait for more appends after the first one.
+        max_events: Number of events which ends the window early.
+    """
+
+    def __init__(
+        self,
+        event_store: EventStore,
+        transaction: Callable[[], AbstractContextManager[Any]] = nullcontext,
+        window: timedelta = timedelta(milliseconds=2),
+        max_events: int = 500,
+    ) -> None:
+        self._event_store = event_store
+        self._transaction = transaction
+        self._window = window.total_seconds()
+        self._max_events = max_events
+        self._queue: SimpleQueue[_Append | None] = SimpleQueue()
+        self._lock = Lock()
+        self._closed = False
+        self._writer = Thread(
+            target=self._write_forever,
+            name="event-sourcery-group-commit",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def append(
+        self,
+        *events: WrappedEvent | Event,
+        stream_id: StreamId,
+        expected_version: int | Versioning = 0,
+    ) -> AppendResult:
+        """Appends events to a stream, waiting until they are written.
+
+        Args:
+            *events: The events to append (all WrappedEvent or all Event).
+            stream_id: The stream identifier to append events to.
+            expected_version: The expected version of the stream
+
+        Returns:
+            New version of the stream and position of the last appended event.
+        """
+        return self.submit(
+            *events,
+            stream_id=stream_id,
+            expected_version=expected_version,
+        ).result()
+
+    def submit(
+        self,
+        *events: WrappedEvent | Event,
+        stream_id: StreamId,
+        expected_version: int | Versioning = 0,
+    ) -> Future[AppendResult]:
+        """Schedules appending events to a stream without waiting for the write.
+
+        Args:
+            *events: The events to append (all WrappedEvent or all Event).
+            stream_id: The stream identifier to append events to.
+            expected_version: The expected version of the stream
+
+        Returns:
+            A future resolved with the result of the append once the events are
+            written, or failed with the error of writing them.
+        """
+        if not events:
+            raise ValueError("At least one event is required")
+        append = _Append(
+            stream_id,
+            events,  # type: ignore[arg-type]
+            expected_version,
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("GroupCommitEventStore is closed")
+            self._queue.put(append)
+        return append.future
+
+    def close(self) -> None:
+        """Writes appends submitted so far and stops the writer thread."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        self._writer.join()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _write_forever(self) -> None:
+        appends: list[_Append] = []
+        error: BaseException = RuntimeError("GroupCommitEventStore is closed")
+        try:
+            while appends := self._collect():
+                appends = [
+                    a for a in appends if a.future.set_running_or_notify_cancel()
+                ]
+                for group in _groups(appends):
+                    self._write(group)
+        except BaseException as stopped_by:
+            error = stopped_by
+            raise
+        finally:
+            self._stop(appends, error)
+
+    def _stop(self, unfinished: list[_Append], error: BaseException) -> None:
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                append = self._queue.get_nowait()
+            except Empty:
+                break
+            if append is not None and append.future.set_running_or_notify_cancel():
+                unfinished.append(append)
+        for append in unfinished:
+            if not append.future.done():
+                append.future.set_exception(error)
+
+    def _collect(self) -> list[_Append]:
+        first = self._queue.get()
+        if first is None:
+            return []
+
+        appends = [first]
+        events = len(first.events)
+        deadline = monotonic() + self._window
+        while events < self._max_events and (timeout := deadline - monotonic()) > 0:
+            try:
+                append = self._queue.get(timeout=timeout)
+            except Empty:
+                break
+            if append is None:
+                self._queue.put(None)
+                break
+            appends.append(append)
+            events += len(append.events)
+        return appends
+
+    def _write(self, group: list[_Append]) -> None:
+        try:
+            results = self._append_many(group)
+        except Exception as error:
+            if len(group) == 1:
+                group[0].future.set_exception(error)
+                return
+            for append in group:
+                self._write([append])
+        else:
+            for append in group:
+                append.future.set_result(results[append.stream_id])
+
+    def _append_many(self, group: list[_Append]) -> dict[StreamId, AppendResult]:
+        with self._transaction():
+            return self._event_store.append_many(
+                {a.stream_id: (a.events, a.expected_version) for a in group}
+            )
+
+
+def _groups(appends: list[_Append]) -> Iterator[list[_Append]]:
+    while appends:
+        group: dict[StreamId, _Append] = {}
+        later: list[_Append] = []
+        for append in appends:
+            if append.stream_id in group:
+                later.append(append)
+            else:
+                group[append.stream_id] = append
+        yield list(group.values())
+        appends = later
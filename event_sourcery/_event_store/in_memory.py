@@ -1,14 +1,20 @@
 import time
-from collections.abc import Generator, Iterator
+from bisect import bisect_right
+from collections.abc import Generator, Iterator, Mapping, Sequence
 from contextlib import AbstractContextManager, contextmanager
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 from operator import getitem
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 from typing_extensions import Self
 
+from event_sourcery._event_store.append_result import AppendResult
+from event_sourcery._event_store.async_event_store import (
+    AsyncStorageStrategy,
+    SyncStorageStrategyAdapter,
+)
 from event_sourcery._event_store.backend import (
     TransactionalBackend,
     not_configured,
@@ -26,11 +32,14 @@ from event_sourcery._event_store.event_store import (
     StorageStrategy,
 )
 from event_sourcery._event_store.outbox import (
+    AsyncOutboxStorageStrategy,
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
+    SyncOutboxStorageStrategyAdapter,
     no_filter,
 )
-from event_sourcery._event_store.stream_id import StreamId
+from event_sourcery._event_store.stream_id import StreamCategory, StreamId
+from event_sourcery._event_store.stream_info import StreamInfo
 from event_sourcery._event_store.subscription.in_transaction import Dispatcher
 from event_sourcery._event_store.subscription.interfaces import (
     SubscriptionStrategy,
@@ -44,7 +53,11 @@ from event_sourcery.exceptions import ConcurrentStreamWriteError
 class Storage:
     records: list[RecordedRaw] = field(default_factory=list, init=False)
     _data: dict[StreamId, list[RecordedRaw]] = field(default_factory=dict, init=False)
-    _versions: dict[StreamId, int | None] = field(default_factory=dict, init=False)
+    _infos: dict[StreamId, StreamInfo] = field(default_factory=dict, init=False)
+    _categories: dict[StreamCategory | None, list[RecordedRaw]] = field(
+        default_factory=dict,
+        init=False,
+    )
 
     @property
     def current_position(self) -> int | None:
@@ -55,31 +68,66 @@ class Storage:
 
     def create(self, stream_id: StreamId, version: Versioning) -> None:
         self._data[stream_id] = []
-        if version is NO_VERSIONING:
-            self._versions[stream_id] = None
-        else:
-            self._versions[stream_id] = 0
+        self._infos[stream_id] = StreamInfo(
+            stream_id=stream_id,
+            version=None if version is NO_VERSIONING else 0,
+            event_count=0,
+        )
 
     def append(self, records: list[RecordedRaw]) -> None:
         self.records.extend(records)
         for record in records:
             stream_id = record.entry.stream_id
             self._data[stream_id].append(record)
-            self._versions[stream_id] = record.entry.version
+            self._categories.setdefault(stream_id.category, []).append(record)
+            info = self._infos[stream_id]
+            self._infos[stream_id] = replace(
+                info,
+                version=record.entry.version,
+                event_count=info.event_count + 1,
+                created_at=info.created_at or record.entry.created_at,
+                updated_at=record.entry.created_at,
+            )
 
     def replace(self, with_snapshot: RecordedRaw) -> None:
         stream_id = with_snapshot.entry.stream_id
         self._data[stream_id] = [with_snapshot]
-        self._versions[stream_id] = with_snapshot.entry.version
+        self._infos[stream_id] = replace(
+            self._infos[stream_id],
+            version=with_snapshot.entry.version,
+            snapshot_version=with_snapshot.entry.version,
+        )
 
     def read(self, stream_id: StreamId) -> list[RecordedRaw]:
         return copy(self._data[stream_id])
 
     def delete(self, stream_id: StreamId) -> None:
         del self._data[stream_id]
+        del self._infos[stream_id]
+        if stream_id.category in self._categories:
+            self._categories[stream_id.category] = [
+                record
+                for record in self._categories[stream_id.category]
+                if record.entry.stream_id != stream_id
+            ]
 
     def get_version(self, stream_id: StreamId) -> int | None:
-        return self._versions[stream_id]
+        return self._infos[stream_id].version
+
+    def info(self, stream_id: StreamId) -> StreamInfo:
+        return self._infos[stream_id]
+
+    def in_category(
+        self,
+        category: StreamCategory,
+        after_position: int,
+    ) -> list[RecordedRaw]:
+        records = self._categories.get(category, [])
+        return records[bisect_right(records, after_position, key=_position) :]
+
+
+def _position(record: RecordedRaw) -> int:
+    return record.position
 
 
 @dataclass
@@ -246,11 +294,56 @@ class InMemoryStorageStrategy(StorageStrategy):
         )
         return [r.entry for r in stream if r.tenant_id == self._tenant_id]
 
+    def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[RawEvent]:
+        yield from self.fetch_events(stream_id, start=start, stop=stop)
+
+    def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        return {stream_id: self.fetch_events(stream_id) for stream_id in stream_ids}
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> Iterator[RecordedRaw]:
+        for record in self._storage.in_category(category, after_position):
+            if tenant_id is None or record.tenant_id == tenant_id:
+                yield record
+
+    def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        if stream_id not in self._storage:
+            return None
+        records = self._storage.read(stream_id)
+        if records and records[0].tenant_id != self._tenant_id:
+            return None
+        return self._storage.info(stream_id)
+
     def insert_events(
         self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
-    ) -> None:
+    ) -> AppendResult:
+        return self.insert_events_many({stream_id: (events, versioning)})[stream_id]
+
+    def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        for stream_id, (_, versioning) in streams.items():
+            self._validate_version(stream_id=stream_id, versioning=versioning)
+        for stream_id, (_, versioning) in streams.items():
+            self._ensure_stream(stream_id=stream_id, versioning=versioning)
+
         position = self.current_position or 0
-        self._ensure_stream(stream_id=stream_id, versioning=versioning)
+        events = [raw for events, _ in streams.values() for raw in events]
         records = [
             RecordedRaw(entry=raw, position=position, tenant_id=self._tenant_id)
             for position, raw in enumerate(events, start=position + 1)
@@ -259,6 +352,7 @@ class InMemoryStorageStrategy(StorageStrategy):
         if self._outbox:
             self._outbox.put_into_outbox(records)
         self._dispatcher.dispatch(*records)
+        return AppendResult.per_stream(records)
 
     def save_snapshot(self, snapshot: RawEvent) -> None:
         record = RecordedRaw(
@@ -272,14 +366,15 @@ class InMemoryStorageStrategy(StorageStrategy):
         if stream_id not in self._storage:
             self._storage.create(stream_id, versioning)
 
-        versioning.validate_if_compatible(self._storage.get_version(stream_id))
+    def _validate_version(self, stream_id: StreamId, versioning: Versioning) -> None:
+        if stream_id in self._storage:
+            last_version = self._storage.get_version(stream_id)
+        else:
+            last_version = None if versioning is NO_VERSIONING else 0
+
+        versioning.validate_if_compatible(last_version)
 
         if versioning is not NO_VERSIONING and versioning.expected_version:
-            last_version = (
-                self._storage.get_version(stream_id)
-                if stream_id in self._storage
-                else None
-            )
             if last_version != versioning.expected_version:
                 raise ConcurrentStreamWriteError(
                     last_version,
@@ -336,6 +431,9 @@ class InMemoryBackend(TransactionalBackend):
             outbox_strategy=c.get(InMemoryOutboxStorageStrategy),
         ).scoped_for_tenant(c[TenantId])
         self[SubscriptionStrategy] = lambda c: InMemorySubscriptionStrategy(c[Storage])
+        self[AsyncStorageStrategy] = lambda c: SyncStorageStrategyAdapter(
+            c[StorageStrategy],
+        )
 
     def configure(self, config: InMemoryConfig | None = None) -> Self:
         """
@@ -363,6 +461,9 @@ class InMemoryBackend(TransactionalBackend):
             )
         )
         self[OutboxStorageStrategy] = lambda c: c[InMemoryOutboxStorageStrategy]
+        self[AsyncOutboxStorageStrategy] = lambda c: SyncOutboxStorageStrategyAdapter(
+            c[InMemoryOutboxStorageStrategy],
+        )
         return self
 
 
@@ -1,5 +1,9 @@
-from collections.abc import Callable, Iterator
-from contextlib import AbstractContextManager
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+)
 from typing import Protocol, runtime_checkable
 
 from event_sourcery._event_store.event.dto import (
@@ -48,6 +52,28 @@ class OutboxStorageStrategy:
         raise NotImplementedError()
 
 
+class AsyncOutboxStorageStrategy:
+    """
+    Interface for asyncio backend outbox storage implementation.
+    """
+
+    def outbox_entries(
+        self, limit: int
+    ) -> AsyncIterator[AbstractAsyncContextManager[RecordedRaw]]:
+        """
+        Returns an async iterator over context managers for outbox entries to be
+        published. Semantics are the same as in `OutboxStorageStrategy`.
+
+        Args:
+            limit (int): The maximum number of entries to return.
+
+        Returns:
+            AsyncIterator[AbstractAsyncContextManager[RecordedRaw]]:
+                Async context managers to wrap record processing
+        """
+        raise NotImplementedError()
+
+
 class Outbox:
     """
     Outbox pattern implementation for reliable event publishing.
@@ -82,17 +108,83 @@ class Outbox:
             publisher (Callable[[Recorded], None]): Function to publish a single event.
             limit (int, optional): Maximum number of entries to process in one run. Defaults to 100.
         """
+        self.run_raw(
+            lambda raw_record: publisher(self._serde.deserialize_record(raw_record)),
+            limit=limit,
+        )
+
+    def run_raw(
+        self,
+        publisher: Callable[[RecordedRaw], None],
+        limit: int = 100,
+    ) -> None:
+        """
+        Publishes outbox entries as stored, without deserializing them.
+
+        Meant for pass-through publishers, e.g. forwarding events to a message
+        broker or another store. With backends reading payloads undecoded, the
+        stored bytes are available as `RawEvent.payload` and forwarding them
+        skips decoding and re-encoding event data. Retries work as in `run`.
+
+        Args:
+            publisher (Callable[[RecordedRaw], None]): Function to publish
+                a single raw record.
+            limit (int, optional): Maximum number of entries to process in one run. Defaults to 100.
+        """
         stream = self._strategy.outbox_entries(limit=limit)
         for entry in stream:
             with entry as raw_record:
-                event = self._serde.deserialize(raw_record.entry)
-                record = Recorded(
-                    wrapped_event=event,
-                    stream_id=raw_record.entry.stream_id,
-                    position=raw_record.position,
-                    tenant_id=raw_record.tenant_id,
-                )
-                publisher(record)
+                publisher(raw_record)
+
+
+class AsyncOutbox:
+    """
+    asyncio counterpart of `Outbox`, publishing entries with a coroutine publisher.
+
+    Args:
+        strategy (AsyncOutboxStorageStrategy): The backend strategy for outbox storage.
+        serde (Serde): The serializer/deserializer for event records.
+    """
+
+    def __init__(self, strategy: AsyncOutboxStorageStrategy, serde: Serde) -> None:
+        self._strategy = strategy
+        self._serde = serde
+
+    async def run(
+        self,
+        publisher: Callable[[Recorded], Awaitable[None]],
+        limit: int = 100,
+    ) -> None:
+        """
+        Processes and publishes outbox entries using the provided publisher coroutine.
+
+        Args:
+            publisher (Callable[[Recorded], Awaitable[None]]):
+                Coroutine function to publish a single event.
+            limit (int, optional): Maximum number of entries to process in one run. Defaults to 100.
+        """
+        await self.run_raw(
+            lambda raw_record: publisher(self._serde.deserialize_record(raw_record)),
+            limit=limit,
+        )
+
+    async def run_raw(
+        self,
+        publisher: Callable[[RecordedRaw], Awaitable[None]],
+        limit: int = 100,
+    ) -> None:
+        """
+        Publishes outbox entries as stored, without deserializing them.
+        See `Outbox.run_raw`.
+
+        Args:
+            publisher (Callable[[RecordedRaw], Awaitable[None]]):
+                Coroutine function to publish a single raw record.
+            limit (int, optional): Maximum number of entries to process in one run. Defaults to 100.
+        """
+        async for entry in self._strategy.outbox_entries(limit=limit):
+            async with entry as raw_record:
+                await publisher(raw_record)
 
 
 def no_filter(entry: RawEvent) -> bool:
@@ -104,3 +196,35 @@ class NoOutboxStorageStrategy(OutboxStorageStrategy):
         self, limit: int
     ) -> Iterator[AbstractContextManager[RecordedRaw]]:
         return iter([])
+
+
+class NoAsyncOutboxStorageStrategy(AsyncOutboxStorageStrategy):
+    async def outbox_entries(
+        self, limit: int
+    ) -> AsyncIterator[AbstractAsyncContextManager[RecordedRaw]]:
+        return
+        yield
+
+
+class SyncOutboxStorageStrategyAdapter(AsyncOutboxStorageStrategy):
+    """
+    Exposes a non-blocking `OutboxStorageStrategy` (e.g. in-memory) as
+    `AsyncOutboxStorageStrategy`.
+    """
+
+    def __init__(self, strategy: OutboxStorageStrategy) -> None:
+        self._strategy = strategy
+
+    async def outbox_entries(
+        self, limit: int
+    ) -> AsyncIterator[AbstractAsyncContextManager[RecordedRaw]]:
+        for entry in self._strategy.outbox_entries(limit):
+            yield self._publish_context(entry)
+
+    @staticmethod
+    @asynccontextmanager
+    async def _publish_context(
+        entry: AbstractContextManager[RecordedRaw],
+    ) -> AsyncIterator[RecordedRaw]:
+        with entry as raw_record:
+            yield raw_record
@@ -1,6 +1,8 @@
 from dataclasses import InitVar, dataclass
 from typing import Any, TypeAlias
-from uuid import UUID, uuid4, uuid5
+from uuid import UUID, SafeUUID, uuid4, uuid5
+
+from typing_extensions import Self
 
 from event_sourcery.exceptions import IncompatibleUuidAndName
 
@@ -67,6 +69,26 @@ class StreamId(StreamUUID):
 
     category: StreamCategory | None = None
 
+    @classmethod
+    def trusted(
+        cls,
+        uuid: UUID,
+        name: str | None,
+        category: StreamCategory | None,
+    ) -> Self:
+        """
+        Fast constructor for stream ids read back from the event store.
+
+        Skips checking that the UUID matches the name (which costs two UUIDv5
+        computations). Meant for storage backends only.
+        """
+        stream_id = object.__new__(cls)
+        object.__setattr__(stream_id, "int", uuid.int)
+        object.__setattr__(stream_id, "is_safe", SafeUUID.unknown)
+        object.__setattr__(stream_id, "name", name)
+        object.__setattr__(stream_id, "category", category)
+        return stream_id
+
     def __repr__(self) -> str:
         return (
             f"{type(self).__name__}"
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from event_sourcery._event_store.stream_id import StreamId
+
+
+@dataclass(frozen=True)
+class StreamInfo:
+    """
+    Metadata of a stream, available without loading its events.
+
+    Attributes:
+        stream_id (StreamId): Identifier of the stream.
+        version (int | None): Current version of the stream (None if versionless).
+        event_count (int): Number of events stored in the stream.
+        created_at (datetime | None): Creation time of the first stored event.
+        updated_at (datetime | None): Creation time of the last stored event.
+        snapshot_version (int | None): Version of the latest snapshot, if any.
+    """
+
+    stream_id: StreamId
+    version: int | None
+    event_count: int
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    snapshot_version: int | None = None
@@ -82,9 +82,10 @@ class SubscriptionBuilder(PositionPhase, FilterPhase, BuildPhase):
         self,
         size: int,
         timelimit: Seconds | timedelta,
+        lazy: bool = False,
     ) -> Iterator[list[Recorded]]:
         seconds = self._to_timedelta(timelimit)
         subscription = self._build(batch_size=size, timelimit=seconds)
         return (  # pragma: no cover  # apparently, bug in coverage.py
-            [self._serde.deserialize_record(e) for e in batch] for batch in subscription
+            self._serde.deserialize_records(batch, lazy=lazy) for batch in subscription
         )
@@ -12,7 +12,7 @@ __all__ = ["Dispatcher", "Listener", "Listeners"]
 from collections import defaultdict
 from collections.abc import Iterator
 from itertools import chain
-from typing import Protocol
+from typing import Protocol, cast
 
 from event_sourcery._event_store.event.dto import (
     Event,
@@ -134,14 +134,22 @@ class Dispatcher:
         """
         Dispatches one or more raw event records to all registered listeners.
 
+        Listeners are matched by event name and stream category, so events
+        without listeners are not deserialized. Listeners receive
+        `LazyWrappedEvent`s, decoded once when any of them accesses the event.
+
         Args:
             *raws (RecordedRaw): One or more events to dispatch.
         """
         for raw in raws:
-            record = self._serde.deserialize_record(raw)
-            event = record.wrapped_event.event.__class__
-            category = record.stream_id.category or ""
+            event = cast(
+                type[Event], self._serde.registry.type_for_name(raw.entry.name)
+            )
+            category = raw.entry.stream_id.category or ""
             listeners = set(self._listeners[event]) | set(self._listeners[category])
+            if not listeners:
+                continue
+            record = self._serde.deserialize_record(raw, lazy=True)
             for listener in listeners:
                 listener(
                     record.wrapped_event,
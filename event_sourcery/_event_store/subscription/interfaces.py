@@ -90,7 +90,20 @@ class BuildPhase:
         self,
         size: int,
         timelimit: Seconds | timedelta,
+        lazy: bool = False,
     ) -> Iterator[list[Recorded]]:
+        """
+        Builds a subscription yielding batches of recorded events.
+
+        Args:
+            size (int): Maximum number of events in a batch.
+            timelimit (Seconds | timedelta): How long to wait for a full batch.
+            lazy (bool): If True, records hold `LazyWrappedEvent`s, decoding
+                (and decrypting) events only when their `event` is accessed.
+
+        Returns:
+            Iterator[list[Recorded]]: An iterator over batches of recorded events.
+        """
         raise NotImplementedError()
 
 
@@ -1,4 +1,6 @@
 __all__ = [
+    "AesGcmEncryptionStrategy",
+    "CachingKeyStorageStrategy",
     "DataSubject",
     "Encrypted",
     "Encryption",
@@ -11,6 +13,8 @@ from event_sourcery._event_store.event.dto import (
     Encrypted,
 )
 from event_sourcery._event_store.event.encryption import (
+    AesGcmEncryptionStrategy,
+    CachingKeyStorageStrategy,
     Encryption,
     NoEncryptionStrategy,
     NoKeyStorageStrategy,
@@ -3,19 +3,34 @@ __all__ = [
     "Entry",
     "Event",
     "EventRegistry",
+    "JsonCodec",
+    "LazyWrappedEvent",
+    "MsgpackCodec",
+    "OrjsonCodec",
+    "ParallelDeserialization",
+    "PayloadCodec",
     "Position",
     "RawEvent",
     "Recorded",
     "RecordedRaw",
     "Serde",
+    "Upcaster",
+    "Upcasters",
     "WrappedEvent",
 ]
 
 
+from event_sourcery._event_store.event.codec import (
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    PayloadCodec,
+)
 from event_sourcery._event_store.event.dto import (
     Context,
     Entry,
     Event,
+    LazyWrappedEvent,
     Position,
     RawEvent,
     Recorded,
@@ -23,4 +38,5 @@ from event_sourcery._event_store.event.dto import (
     WrappedEvent,
 )
 from event_sourcery._event_store.event.registry import EventRegistry
-from event_sourcery._event_store.event.serde import Serde
+from event_sourcery._event_store.event.serde import ParallelDeserialization, Serde
+from event_sourcery._event_store.event.upcasting import Upcaster, Upcasters
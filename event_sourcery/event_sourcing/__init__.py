@@ -1,8 +1,11 @@
 __all__ = [
     "Aggregate",
+    "AsyncRepository",
     "Repository",
+    "SnapshotPolicy",
     "WrappedAggregate",
 ]
 
 from event_sourcery.event_sourcing.aggregate import Aggregate, WrappedAggregate
-from event_sourcery.event_sourcing.repository import Repository
+from event_sourcery.event_sourcing.repository import AsyncRepository, Repository
+from event_sourcery.event_sourcing.snapshot_policy import SnapshotPolicy
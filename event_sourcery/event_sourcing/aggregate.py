@@ -3,6 +3,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from typing import ClassVar, Generic, TypeVar
+from uuid import UUID
 
 from event_sourcery import StreamCategory, StreamId
 from event_sourcery.event import Context, Event
@@ -21,10 +22,14 @@ class Aggregate:
 
     Attributes:
         category (ClassVar[StreamCategory]): StreamCategory for the aggregate type (group streams).
+        snapshot_type (ClassVar[type[Event] | None]): Event type of the aggregate's
+            snapshots. Snapshots of this type are passed to `__restore__` instead of
+            `__apply__`. None if the aggregate doesn't support snapshots.
         __changes__ (list[Event]): List of yet not persisted events.
     """
 
     category: ClassVar[StreamCategory]
+    snapshot_type: ClassVar[type[Event] | None] = None
     _changes: list[Event]
 
     @property
@@ -43,6 +48,7 @@ class Aggregate:
             Iterator[Iterator[Event]]: Iterator over unpersisted events.
         """
         yield iter(self.__changes__)
+        self._changes = []
 
     def __apply__(self, event: Event) -> None:
         """
@@ -56,6 +62,29 @@ class Aggregate:
         """
         raise NotImplementedError
 
+    def __snapshot__(self) -> Event:
+        """
+        Captures the aggregate's current state as a snapshot event.
+
+        Must be implemented by aggregates declaring `snapshot_type`.
+
+        Returns:
+            Event: The snapshot, an instance of `snapshot_type`.
+        """
+        raise NotImplementedError
+
+    def __restore__(self, snapshot: Event) -> None:
+        """
+        Restores the aggregate's state from a snapshot event.
+
+        Must be implemented by aggregates declaring `snapshot_type`. Called instead of
+        replaying the events the snapshot was taken from.
+
+        Args:
+            snapshot (Event): The snapshot to restore from, an instance of `snapshot_type`.
+        """
+        raise NotImplementedError
+
     def _emit(self, event: Event) -> None:
         """
         Applies and tracks a new event as a pending change.
@@ -92,6 +121,10 @@ class WrappedAggregate(Generic[TAggregate]):
         created_at: Timestamp of the first event in the stream.
         updated_at: Timestamp of the last event in the stream.
         stored_version: Number of events persisted before this session.
+        snapshot_version: Version of the latest snapshot the aggregate was restored
+            from or saved with, if any.
+        last_uuid: Identifier of the last event (or snapshot) the aggregate was
+            restored from or saved with, if any.
     """
 
     aggregate: TAggregate
@@ -100,6 +133,8 @@ class WrappedAggregate(Generic[TAggregate]):
     stored_version: int = 0
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    snapshot_version: int | None = None
+    last_uuid: UUID | None = None
 
     @property
     def version(self) -> int:
@@ -1,11 +1,16 @@
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import replace
+from datetime import timedelta
+from time import monotonic
 from typing import Generic, TypeVar, cast
 
-from event_sourcery import EventStore, StreamId, StreamUUID
+from event_sourcery import AsyncEventStore, EventStore, StreamId, StreamUUID
 from event_sourcery.event import Context, Event, WrappedEvent
 from event_sourcery.event_sourcing import Aggregate
 from event_sourcery.event_sourcing.aggregate import WrappedAggregate
+from event_sourcery.event_sourcing.snapshot_policy import SnapshotPolicy
 
 TAggregate = TypeVar("TAggregate", bound=Aggregate)
 TEvent = TypeVar("TEvent", bound=Event)
@@ -18,10 +23,35 @@ class Repository(Generic[TAggregate]):
     Provides loading and persisting of aggregates using an event store. Handles event
     replay to reconstruct aggregate state and persists new events emitted by the
     aggregate.
+
+    With ``cache_size`` set, up to that many most recently saved aggregates are kept
+    in memory. Loading a cached aggregate fetches only the last event it was cached
+    with and newer ones instead of replaying the whole stream. If that event is
+    no longer in the store, e.g. because the transaction saving it was rolled back
+    or the stream was deleted, the stream is replayed from scratch. Aggregates are
+    cached as soon as they're saved, so within a transaction that is rolled back
+    later, loading an aggregate sees its uncommitted state, just like loading
+    its events does.
+
+    With ``snapshot_policy`` set, snapshots of aggregates declaring ``snapshot_type``
+    are saved whenever the policy says so. Loading then restores the aggregate with
+    ``__restore__`` from the latest snapshot and replays only newer events.
+
+    Args:
+        event_store (EventStore): The event store to load and persist aggregates with.
+        cache_size (int): Maximum number of cached aggregates, 0 disables the cache.
+        snapshot_policy (SnapshotPolicy | None): When to save snapshots, None to never.
     """
 
-    def __init__(self, event_store: EventStore) -> None:
+    def __init__(
+        self,
+        event_store: EventStore,
+        cache_size: int = 0,
+        snapshot_policy: SnapshotPolicy | None = None,
+    ) -> None:
         self._event_store = event_store
+        self._cache = _AggregateCache[TAggregate](cache_size)
+        self._snapshot_policy = snapshot_policy
 
     @contextmanager
     def aggregate(
@@ -37,6 +67,12 @@ class Repository(Generic[TAggregate]):
         yields a ``WrappedAggregate`` containing the aggregate and stream metadata,
         and persists any new events emitted during the context.
 
+        If the aggregate is cached, the cached instance is caught up with newer events
+        and yielded instead of the given one. It's taken out of the cache for the
+        duration of the context and put back only once saved successfully, so
+        a failed command (e.g. on ``ConcurrentStreamWriteError``) makes the next load
+        replay the stream from scratch.
+
         Args:
             uuid (StreamUUID): The unique identifier of the aggregate's stream.
             aggregate (TAggregate): The aggregate initial instance to load state into.
@@ -45,34 +81,33 @@ class Repository(Generic[TAggregate]):
         Yields:
             WrappedAggregate[TAggregate]: The aggregate wrapped with stream metadata.
         """
-        stream_id = StreamId(uuid=uuid, name=uuid.name, category=aggregate.category)
-
-        wrapped = WrappedAggregate(
-            aggregate=aggregate,
-            stream_id=stream_id,
-            context=context or Context(),
-        )
-        self._load(wrapped)
+        started = monotonic()
+        wrapped = _wrap(uuid, aggregate, context)
+        cached = self._cache.take(wrapped.stream_id)
+        if cached is not None and self._catch_up(cached):
+            wrapped = replace(cached, context=wrapped.context)
+        else:
+            self._load(wrapped)
+        replay_time = timedelta(seconds=monotonic() - started)
         yield wrapped
         self._save(wrapped)
+        self._snapshot(wrapped, replay_time)
+        self._cache.put(wrapped)
 
     def _load(self, wrapped: WrappedAggregate[TAggregate]) -> None:
-        stream = self._event_store.load_stream(wrapped.stream_id)
-        for envelope in stream:
-            wrapped.aggregate.__apply__(envelope.event)
-            wrapped.stored_version = cast(int, envelope.version)
-            if wrapped.created_at is None:
-                wrapped.created_at = envelope.created_at
-            wrapped.updated_at = envelope.created_at
+        for envelope in self._event_store.iter_stream(wrapped.stream_id):
+            _apply(wrapped, envelope)
+
+    def _catch_up(self, cached: WrappedAggregate[TAggregate]) -> bool:
+        events = self._event_store.load_stream(
+            cached.stream_id,
+            start=cached.stored_version or 1,
+        )
+        return _apply_newer(cached, events)
 
     def _save(self, wrapped: WrappedAggregate[TAggregate]) -> None:
         with wrapped.aggregate.__persisting_changes__() as pending:
-            start_from = wrapped.stored_version + 1
-            events = [
-                WrappedEvent.wrap(event, version, context=wrapped.context)
-                for version, event in enumerate(pending, start=start_from)
-            ]
-
+            events = _pending_events(wrapped, pending)
             if not events:
                 return
 
@@ -81,3 +116,198 @@ class Repository(Generic[TAggregate]):
                 stream_id=wrapped.stream_id,
                 expected_version=wrapped.stored_version,
             )
+            _track(wrapped, events)
+
+    def _snapshot(
+        self,
+        wrapped: WrappedAggregate[TAggregate],
+        replay_time: timedelta,
+    ) -> None:
+        snapshot = _due_snapshot(self._snapshot_policy, wrapped, replay_time)
+        if snapshot is not None:
+            self._event_store.save_snapshot(wrapped.stream_id, snapshot)
+            wrapped.snapshot_version = snapshot.version
+            wrapped.last_uuid = snapshot.uuid
+
+
+class AsyncRepository(Generic[TAggregate]):
+    """
+    asyncio counterpart of `Repository`, working on top of `AsyncEventStore`.
+
+    Args:
+        event_store (AsyncEventStore): The event store to load and persist aggregates.
+        cache_size (int): Maximum number of cached aggregates, 0 disables the cache.
+        snapshot_policy (SnapshotPolicy | None): When to save snapshots, None to never.
+    """
+
+    def __init__(
+        self,
+        event_store: AsyncEventStore,
+        cache_size: int = 0,
+        snapshot_policy: SnapshotPolicy | None = None,
+    ) -> None:
+        self._event_store = event_store
+        self._cache = _AggregateCache[TAggregate](cache_size)
+        self._snapshot_policy = snapshot_policy
+
+    @asynccontextmanager
+    async def aggregate(
+        self,
+        uuid: StreamUUID,
+        aggregate: TAggregate,
+        context: Context | None = None,
+    ) -> AsyncIterator[WrappedAggregate[TAggregate]]:
+        """
+        Async context manager for loading an aggregate instance.
+
+        Behaves like `Repository.aggregate`, awaiting the event store on load and save.
+
+        Args:
+            uuid (StreamUUID): The unique identifier of the aggregate's stream.
+            aggregate (TAggregate): The aggregate initial instance to load state into.
+            context (Context | None): Optional context to attach to all emitted events.
+
+        Yields:
+            WrappedAggregate[TAggregate]: The aggregate wrapped with stream metadata.
+        """
+        started = monotonic()
+        wrapped = _wrap(uuid, aggregate, context)
+        cached = self._cache.take(wrapped.stream_id)
+        if cached is not None and await self._catch_up(cached):
+            wrapped = replace(cached, context=wrapped.context)
+        else:
+            await self._load(wrapped)
+        replay_time = timedelta(seconds=monotonic() - started)
+        yield wrapped
+        await self._save(wrapped)
+        await self._snapshot(wrapped, replay_time)
+        self._cache.put(wrapped)
+
+    async def _load(self, wrapped: WrappedAggregate[TAggregate]) -> None:
+        async for envelope in self._event_store.iter_stream(wrapped.stream_id):
+            _apply(wrapped, envelope)
+
+    async def _catch_up(self, cached: WrappedAggregate[TAggregate]) -> bool:
+        events = await self._event_store.load_stream(
+            cached.stream_id,
+            start=cached.stored_version or 1,
+        )
+        return _apply_newer(cached, events)
+
+    async def _save(self, wrapped: WrappedAggregate[TAggregate]) -> None:
+        with wrapped.aggregate.__persisting_changes__() as pending:
+            events = _pending_events(wrapped, pending)
+            if not events:
+                return
+
+            await self._event_store.append(
+                *events,
+                stream_id=wrapped.stream_id,
+                expected_version=wrapped.stored_version,
+            )
+            _track(wrapped, events)
+
+    async def _snapshot(
+        self,
+        wrapped: WrappedAggregate[TAggregate],
+        replay_time: timedelta,
+    ) -> None:
+        snapshot = _due_snapshot(self._snapshot_policy, wrapped, replay_time)
+        if snapshot is not None:
+            await self._event_store.save_snapshot(wrapped.stream_id, snapshot)
+            wrapped.snapshot_version = snapshot.version
+            wrapped.last_uuid = snapshot.uuid
+
+
+def _wrap(
+    uuid: StreamUUID,
+    aggregate: TAggregate,
+    context: Context | None,
+) -> WrappedAggregate[TAggregate]:
+    return WrappedAggregate(
+        aggregate=aggregate,
+        stream_id=StreamId(uuid=uuid, name=uuid.name, category=aggregate.category),
+        context=context or Context(),
+    )
+
+
+def _apply(wrapped: WrappedAggregate[TAggregate], envelope: WrappedEvent) -> None:
+    snapshot_type = wrapped.aggregate.snapshot_type
+    if snapshot_type is not None and isinstance(envelope.event, snapshot_type):
+        wrapped.aggregate.__restore__(envelope.event)
+        wrapped.snapshot_version = envelope.version
+    else:
+        wrapped.aggregate.__apply__(envelope.event)
+    _track(wrapped, [envelope])
+
+
+def _apply_newer(
+    wrapped: WrappedAggregate[TAggregate],
+    envelopes: Sequence[WrappedEvent],
+) -> bool:
+    if wrapped.last_uuid is not None:
+        if not envelopes or envelopes[0].uuid != wrapped.last_uuid:
+            return False
+        envelopes = envelopes[1:]
+    if envelopes and envelopes[0].version != wrapped.stored_version + 1:
+        return False
+    for envelope in envelopes:
+        _apply(wrapped, envelope)
+    return True
+
+
+def _track(
+    wrapped: WrappedAggregate[TAggregate],
+    envelopes: Sequence[WrappedEvent],
+) -> None:
+    for envelope in envelopes:
+        wrapped.stored_version = cast(int, envelope.version)
+        wrapped.last_uuid = envelope.uuid
+        if wrapped.created_at is None:
+            wrapped.created_at = envelope.created_at
+        wrapped.updated_at = envelope.created_at
+
+
+def _due_snapshot(
+    policy: SnapshotPolicy | None,
+    wrapped: WrappedAggregate[TAggregate],
+    replay_time: timedelta,
+) -> WrappedEvent | None:
+    if policy is None or wrapped.aggregate.snapshot_type is None:
+        return None
+    events_since_snapshot = wrapped.stored_version - (wrapped.snapshot_version or 0)
+    if not policy.is_due(events_since_snapshot, replay_time):
+        return None
+    return WrappedEvent.wrap(
+        wrapped.aggregate.__snapshot__(),
+        wrapped.stored_version,
+        context=wrapped.context,
+    )
+
+
+def _pending_events(
+    wrapped: WrappedAggregate[TAggregate],
+    pending: Iterator[Event],
+) -> list[WrappedEvent]:
+    return [
+        WrappedEvent.wrap(event, version, context=wrapped.context)
+        for version, event in enumerate(pending, start=wrapped.stored_version + 1)
+    ]
+
+
+class _AggregateCache(Generic[TAggregate]):
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._entries: OrderedDict[StreamId, WrappedAggregate[TAggregate]] = (
+            OrderedDict()
+        )
+
+    def take(self, stream_id: StreamId) -> WrappedAggregate[TAggregate] | None:
+        return self._entries.pop(stream_id, None)
+
+    def put(self, wrapped: WrappedAggregate[TAggregate]) -> None:
+        if self._size <= 0:
+            return
+        self._entries[wrapped.stream_id] = wrapped
+        if len(self._entries) > self._size:
+            self._entries.popitem(last=False)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class SnapshotPolicy:
+    """
+    Decides when `Repository` saves a snapshot of an aggregate.
+
+    A snapshot is saved after the aggregate is persisted, if any condition is met.
+    Only aggregates declaring `snapshot_type` are snapshotted.
+
+    Examples:
+        >>> SnapshotPolicy(every=500)
+        >>> SnapshotPolicy(replay_time_budget=timedelta(milliseconds=50))
+
+    Attributes:
+        every (int | None): Snapshot once that many events were stored since
+            the latest snapshot (or the beginning of the stream).
+        replay_time_budget (timedelta | None): Snapshot when loading the aggregate
+            took longer than that.
+    """
+
+    every: int | None = None
+    replay_time_budget: timedelta | None = None
+
+    def is_due(self, events_since_snapshot: int, replay_time: timedelta) -> bool:
+        """
+        Tells whether a snapshot should be saved.
+
+        Args:
+            events_since_snapshot (int): Events stored since the latest snapshot.
+            replay_time (timedelta): Time it took to load the aggregate.
+
+        Returns:
+            bool: True if a snapshot should be saved.
+        """
+        if events_since_snapshot <= 0:
+            return False
+        if self.every is not None and events_since_snapshot >= self.every:
+            return True
+        return (
+            self.replay_time_budget is not None
+            and replay_time > self.replay_time_budget
+        )
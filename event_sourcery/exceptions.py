@@ -65,3 +65,13 @@ class NoSubjectIdFound(PrivacyError):
 
 class NoProviderConfigured(Exception):
     pass
+
+
+class DuplicatedUpcaster(Exception):
+    pass
+
+
+@dataclass
+class MissingUpcaster(EventStoreException):
+    event_name: str
+    from_version: int
@@ -1,4 +1,6 @@
 __all__ = [
+    "AsyncOutboxStorageStrategy",
+    "AsyncStorageStrategy",
     "EncryptionKeyStorageStrategy",
     "EncryptionStrategy",
     "OutboxFiltererStrategy",
@@ -8,12 +10,14 @@ __all__ = [
     "Versioning",
 ]
 
+from event_sourcery._event_store.async_event_store import AsyncStorageStrategy
 from event_sourcery._event_store.event.encryption import (
     EncryptionKeyStorageStrategy,
     EncryptionStrategy,
 )
 from event_sourcery._event_store.event_store import StorageStrategy
 from event_sourcery._event_store.outbox import (
+    AsyncOutboxStorageStrategy,
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
 )
@@ -1,10 +1,14 @@
 __all__ = [
+    "AsyncOutbox",
+    "NoAsyncOutboxStorageStrategy",
     "NoOutboxStorageStrategy",
     "Outbox",
     "no_filter",
 ]
 
 from event_sourcery._event_store.outbox import (
+    AsyncOutbox,
+    NoAsyncOutboxStorageStrategy,
     NoOutboxStorageStrategy,
     Outbox,
     no_filter,
@@ -6,14 +6,10 @@ from event_sourcery.event import RawEvent, RecordedRaw
 from event_sourcery_django.models import Event, OutboxEntry, Snapshot, Stream
 
 
-def raw_event(from_entry: Event, in_stream: Stream) -> RawEvent:
-    return RawEvent(
+def raw_event(from_entry: Event | Snapshot, in_stream: Stream) -> RawEvent:
+    return RawEvent.trusted(
         uuid=from_entry.uuid,
-        stream_id=StreamId(
-            uuid=in_stream.uuid,
-            name=in_stream.name,
-            category=None if in_stream.category == "" else in_stream.category,
-        ),
+        stream_id=stream_id(in_stream),
         created_at=from_entry.created_at,
         version=from_entry.version,
         name=from_entry.name,
@@ -22,6 +18,22 @@ def raw_event(from_entry: Event, in_stream: Stream) -> RawEvent:
     )
 
 
+def raw_record(from_entry: Event, in_stream: Stream) -> RecordedRaw:
+    return RecordedRaw.trusted(
+        entry=raw_event(from_entry, in_stream),
+        position=from_entry.id,
+        tenant_id=in_stream.tenant_id,
+    )
+
+
+def stream_id(of_stream: Stream) -> StreamId:
+    return StreamId.trusted(
+        uuid=of_stream.uuid,
+        name=of_stream.name,
+        category=None if of_stream.category == "" else of_stream.category,
+    )
+
+
 def entry(from_raw: RawEvent, to_stream: Stream) -> Event:
     return Event(
         uuid=from_raw.uuid,
@@ -1,11 +1,28 @@
-from collections.abc import Sequence
+import operator
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass, replace
-from typing import cast
+from functools import reduce
 
-from more_itertools import first, first_true
+from django.db.models import (
+    Case,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
 from typing_extensions import Self
 
-from event_sourcery import DEFAULT_TENANT, NO_VERSIONING, StreamId, TenantId
+from event_sourcery import (
+    DEFAULT_TENANT,
+    NO_VERSIONING,
+    AppendResult,
+    StreamCategory,
+    StreamId,
+    StreamInfo,
+    TenantId,
+)
 from event_sourcery.event import Position, RawEvent, RecordedRaw
 from event_sourcery.exceptions import (
     AnotherStreamWithThisNameButOtherIdExists,
@@ -47,14 +64,7 @@ class DjangoStorageStrategy(StorageStrategy):
 
         events: Sequence[models.Event | models.Snapshot]
 
-        snapshot_query = models.Snapshot.objects.filter(stream=stream).order_by(
-            "-created_at"
-        )
-        if start is not None:
-            snapshot_query = snapshot_query.filter(version__gte=start)
-        if stop is not None:
-            snapshot_query = snapshot_query.filter(version__lt=stop)
-        latest_snapshot = snapshot_query.first()
+        latest_snapshot = self._latest_snapshot(stream, start, stop)
         if latest_snapshot is None:
             events = events_query.all()
         else:
@@ -65,61 +75,273 @@ class DjangoStorageStrategy(StorageStrategy):
 
         return [dto.raw_event(event, stream) for event in events]
 
+    @staticmethod
+    def _latest_snapshot(
+        stream: models.Stream,
+        start: int | None,
+        stop: int | None,
+    ) -> models.Snapshot | None:
+        snapshot_query = models.Snapshot.objects.filter(stream=stream).order_by(
+            "-created_at"
+        )
+        if start is not None:
+            snapshot_query = snapshot_query.filter(version__gte=start)
+        if stop is not None:
+            snapshot_query = snapshot_query.filter(version__lt=stop)
+        latest_snapshot: models.Snapshot | None = snapshot_query.first()
+        return latest_snapshot
+
+    def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[RawEvent]:
+        try:
+            stream = models.Stream.objects.by_stream_id(
+                stream_id=stream_id,
+                tenant_id=self._tenant_id,
+            ).get()
+        except models.Stream.DoesNotExist:
+            return
+
+        events_query = models.Event.objects.filter(stream=stream).order_by(
+            "version", "id"
+        )
+        if start is not None:
+            events_query = events_query.filter(version__gte=start)
+        if stop is not None:
+            events_query = events_query.filter(version__lt=stop)
+
+        latest_snapshot = self._latest_snapshot(stream, start, stop)
+        if latest_snapshot is not None:
+            yield dto.raw_event(latest_snapshot, stream)
+            events_query = events_query.filter(version__gt=latest_snapshot.version)
+
+        page_query = events_query
+        while True:
+            fetched = 0
+            for event in page_query[:page_size].iterator(chunk_size=page_size):
+                fetched += 1
+                yield dto.raw_event(event, stream)
+            if fetched < page_size:
+                return
+            page_query = (
+                events_query.filter(id__gt=event.id)
+                if event.version is None
+                else events_query.filter(version__gt=event.version)
+            )
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> Iterator[RecordedRaw]:
+        events_query = (
+            models.Event.objects.filter(stream__category=category)
+            .select_related("stream")
+            .order_by("id")
+        )
+        if tenant_id is not None:
+            events_query = events_query.filter(stream__tenant_id=tenant_id)
+
+        last_position = after_position
+        while True:
+            page = list(events_query.filter(id__gt=last_position)[:page_size])
+            for event in page:
+                yield dto.raw_record(event, event.stream)
+            if len(page) < page_size:
+                return
+            last_position = page[-1].id
+
+    def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        by_uuid = {(sid.int, sid.category or ""): sid for sid in stream_ids}
+        by_name = {
+            (sid.name, sid.category or ""): sid for sid in stream_ids if sid.name
+        }
+        streams = models.Stream.objects.filter(
+            Q(uuid__in=stream_ids) | Q(name__in=[name for name, _ in by_name]),
+            tenant_id=self._tenant_id,
+        )
+        newer = models.Snapshot.objects.filter(stream=OuterRef("stream")).order_by(
+            "-created_at"
+        )
+        snapshots = list(
+            models.Snapshot.objects.filter(
+                stream__in=streams,
+                uuid=Subquery(newer.values("uuid")[:1]),
+            ).select_related("stream")
+        )
+        events = (
+            models.Event.objects.annotate(
+                snapshot_version=Subquery(newer.values("version")[:1])
+            )
+            .filter(
+                Q(snapshot_version__isnull=True) | Q(version__gt=F("snapshot_version")),
+                stream__in=streams,
+            )
+            .select_related("stream")
+            .order_by("stream_id", "version")
+        )
+
+        fetched: dict[StreamId, list[RawEvent]] = {sid: [] for sid in stream_ids}
+        entries: list[models.Event | models.Snapshot] = [*snapshots, *events]
+        for entry in entries:
+            stream = entry.stream
+            stream_id = by_uuid.get((stream.uuid.int, stream.category)) or by_name.get(
+                (stream.name, stream.category)
+            )
+            if stream_id is not None:
+                fetched[stream_id].append(dto.raw_event(entry, stream))
+        return fetched
+
+    def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        latest_snapshot = models.Snapshot.objects.filter(
+            stream=OuterRef("pk")
+        ).order_by("-created_at")
+        events = models.Event.objects.filter(stream=OuterRef("pk"))
+        first = events.order_by("version", "id")
+        last = events.order_by("-version", "-id")
+        stream = (
+            models.Stream.objects.by_stream_id(
+                stream_id=stream_id,
+                tenant_id=self._tenant_id,
+            )
+            .annotate(
+                first_version=Subquery(first.values("version")[:1]),
+                created_at=Subquery(first.values("created_at")[:1]),
+                last_version=Subquery(last.values("version")[:1]),
+                updated_at=Subquery(last.values("created_at")[:1]),
+                snapshot_version=Subquery(latest_snapshot.values("version")[:1]),
+            )
+            .first()
+        )
+        if stream is None:
+            return None
+
+        if stream.last_version is not None:
+            event_count = stream.last_version - stream.first_version + 1
+        elif stream.version is None:
+            event_count = models.Event.objects.filter(stream=stream).count()
+        else:
+            event_count = 0
+        return StreamInfo(
+            stream_id=dto.stream_id(stream),
+            version=(
+                stream.version if stream.last_version is None else stream.last_version
+            ),
+            event_count=event_count,
+            created_at=stream.created_at,
+            updated_at=stream.updated_at,
+            snapshot_version=stream.snapshot_version,
+        )
+
     def insert_events(
         self,
         stream_id: StreamId,
         versioning: Versioning,
         events: list[RawEvent],
-    ) -> None:
-        self._ensure_stream(stream_id=stream_id, versioning=versioning)
-        event = cast(RawEvent, first(events))
-        stream = models.Stream.objects.by_stream_id(
-            stream_id=event.stream_id,
-            tenant_id=self._tenant_id,
-        ).get()
-        entries = [dto.entry(event, stream) for event in events]
-        models.Event.objects.bulk_create(entries)
+    ) -> AppendResult:
+        return self.insert_events_many({stream_id: (events, versioning)})[stream_id]
+
+    def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        ensured = self._ensure_streams(
+            {stream_id: versioning for stream_id, (_, versioning) in streams.items()}
+        )
+        self._bump_versions(
+            [
+                (ensured[stream_id], versioning)
+                for stream_id, (_, versioning) in streams.items()
+            ]
+        )
+        inserted = [
+            (raw, dto.entry(raw, ensured[stream_id]))
+            for stream_id, (events, _) in streams.items()
+            for raw in events
+        ]
+        models.Event.objects.bulk_create([db for _, db in inserted])
         records = [
             RecordedRaw(entry=raw, position=db.id, tenant_id=self._tenant_id)
-            for raw, db in zip(events, entries, strict=False)
+            for raw, db in inserted
         ]
         if self._outbox:
             self._outbox.put_into_outbox(records)
         self._dispatcher.dispatch(*records)
+        return AppendResult.per_stream(records)
 
-    def _ensure_stream(self, stream_id: StreamId, versioning: Versioning) -> None:
-        initial_version = versioning.initial_version
-
-        matching_streams = models.Stream.objects.by_stream_id(
-            stream_id=stream_id,
+    def _ensure_streams(
+        self,
+        streams: Mapping[StreamId, Versioning],
+    ) -> dict[StreamId, models.Stream]:
+        matching_streams = models.Stream.objects.by_stream_ids(
+            streams,
             tenant_id=self._tenant_id,
-        ).all()
-        if stream_id.name and matching_streams:
-            stream_with_same_name = first_true(
-                matching_streams, pred=lambda stream: stream.name == stream_id.name
+        )
+        by_uuid = {(s.uuid.int, s.category): s for s in matching_streams}
+        missing = [
+            models.Stream(
+                uuid=stream_id,
+                name=stream_id.name,
+                category=stream_id.category or "",
+                tenant_id=self._tenant_id,
+                version=versioning.initial_version,
             )
+            for stream_id, versioning in streams.items()
+            if (stream_id.int, stream_id.category or "") not in by_uuid
+        ]
+        if missing:
+            models.Stream.objects.bulk_create(missing, ignore_conflicts=True)
+            matching_streams = matching_streams.all()
+            by_uuid = {(s.uuid.int, s.category): s for s in matching_streams}
+
+        by_name = {(s.name, s.category): s for s in matching_streams if s.name}
+        ensured = {}
+        for stream_id in streams:
+            category = stream_id.category or ""
+            stream_with_same_name = by_name.get((stream_id.name, category))
             if (
                 stream_with_same_name is not None
                 and stream_with_same_name.uuid != stream_id
             ):
                 raise AnotherStreamWithThisNameButOtherIdExists()
+            ensured[stream_id] = by_uuid[(stream_id.int, category)]
+        return ensured
 
-        model, created = models.Stream.objects.get_or_create(
-            uuid=stream_id,
-            name=stream_id.name,
-            category=stream_id.category or "",
-            tenant_id=self._tenant_id,
-            defaults={"version": initial_version},
-        )
+    def _bump_versions(self, streams: list[tuple[models.Stream, Versioning]]) -> None:
+        for model, versioning in streams:
+            versioning.validate_if_compatible(model.version)
 
-        versioning.validate_if_compatible(model.version)
+        to_bump = [
+            (model, versioning)
+            for model, versioning in streams
+            if versioning.expected_version and versioning is not NO_VERSIONING
+        ]
+        if not to_bump:
+            return
 
-        if versioning.expected_version and versioning is not NO_VERSIONING:
-            result = models.Stream.objects.filter(
-                id=model.id, version=versioning.expected_version
-            ).update(version=versioning.initial_version)
-            if result != 1:
-                raise ConcurrentStreamWriteError
+        expected = (
+            Q(id=model.id, version=versioning.expected_version)
+            for model, versioning in to_bump
+        )
+        result = models.Stream.objects.filter(reduce(operator.or_, expected)).update(
+            version=Case(
+                *(
+                    When(id=model.id, then=Value(versioning.initial_version))
+                    for model, versioning in to_bump
+                )
+            )
+        )
+        if result != len(to_bump):
+            raise ConcurrentStreamWriteError
 
     def save_snapshot(self, snapshot: RawEvent) -> None:
         stream = models.Stream.objects.by_stream_id(
@@ -0,0 +1,62 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from typing_extensions import Self
+
+from event_sourcery import DEFAULT_TENANT, TenantId
+from event_sourcery.interfaces import EncryptionKeyStorageStrategy
+from event_sourcery_django import models
+
+
+@dataclass(repr=False)
+class DjangoKeyStorage(EncryptionKeyStorageStrategy):
+    """
+    Stores encryption keys in a database table, keyed by tenant and subject.
+
+    Keys are read and written with the default database connection, so storing
+    or shredding a key is committed together with the rest of the transaction.
+    Keys of many subjects are read (`get_many`) and deleted (`delete_many`) with
+    a single query each.
+
+    Examples:
+        >>> backend.with_encryption(strategy, DjangoKeyStorage())
+    """
+
+    _tenant_id: TenantId = DEFAULT_TENANT
+
+    def get(self, subject_id: str) -> bytes | None:
+        key = (
+            models.EncryptionKey.objects.filter(
+                tenant_id=self._tenant_id,
+                subject_id=subject_id,
+            )
+            .values_list("key", flat=True)
+            .first()
+        )
+        return None if key is None else bytes(key)
+
+    def get_many(self, subject_ids: Iterable[str]) -> dict[str, bytes]:
+        rows = models.EncryptionKey.objects.filter(
+            tenant_id=self._tenant_id,
+            subject_id__in=list(subject_ids),
+        ).values_list("subject_id", "key")
+        return {subject_id: bytes(key) for subject_id, key in rows}
+
+    def store(self, subject_id: str, key: bytes) -> None:
+        models.EncryptionKey.objects.update_or_create(
+            tenant_id=self._tenant_id,
+            subject_id=subject_id,
+            defaults={"key": key},
+        )
+
+    def delete(self, subject_id: str) -> None:
+        self.delete_many([subject_id])
+
+    def delete_many(self, subject_ids: Iterable[str]) -> None:
+        models.EncryptionKey.objects.filter(
+            tenant_id=self._tenant_id,
+            subject_id__in=list(subject_ids),
+        ).delete()
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        return replace(self, _tenant_id=tenant_id)
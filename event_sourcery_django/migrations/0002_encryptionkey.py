@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event_sourcery_django", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EncryptionKey",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("tenant_id", models.CharField(max_length=255)),
+                ("subject_id", models.CharField(max_length=255)),
+                ("key", models.BinaryField()),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("tenant_id", "subject_id"),
+                        name="ux_encryption_keys_tenant_subject",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,3 +1,6 @@
+import operator
+from collections.abc import Iterable
+from functools import reduce
 from typing import ClassVar
 from uuid import uuid4
 
@@ -8,7 +11,8 @@ from event_sourcery import StreamId, TenantId
 
 
 class StreamManager(models.Manager):
-    def by_stream_id(self, stream_id: StreamId, tenant_id: TenantId) -> models.QuerySet:
+    @staticmethod
+    def _condition(stream_id: StreamId, tenant_id: TenantId) -> models.Q:
         category = stream_id.category or ""
         condition = models.Q(uuid=stream_id, category=category, tenant_id=tenant_id)
         if stream_id.name:
@@ -17,7 +21,18 @@ class StreamManager(models.Manager):
                 category=category,
                 tenant_id=tenant_id,
             )
-        return self.filter(condition)
+        return condition
+
+    def by_stream_id(self, stream_id: StreamId, tenant_id: TenantId) -> models.QuerySet:
+        return self.filter(self._condition(stream_id, tenant_id))
+
+    def by_stream_ids(
+        self,
+        stream_ids: Iterable[StreamId],
+        tenant_id: TenantId,
+    ) -> models.QuerySet:
+        conditions = (self._condition(sid, tenant_id) for sid in stream_ids)
+        return self.filter(reduce(operator.or_, conditions, models.Q(pk__in=[])))
 
 
 class Stream(models.Model):
@@ -75,6 +90,24 @@ class Snapshot(models.Model):
     created_at = models.DateTimeField()
 
 
+class EncryptionKey(models.Model):
+    objects: models.Manager
+
+    id = models.BigAutoField(primary_key=True)
+    tenant_id = models.CharField(max_length=255)
+    subject_id = models.CharField(max_length=255)
+    key = models.BinaryField()
+
+    class Meta:
+        # the unique index on tenant and subject serves point and IN lookups
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant_id", "subject_id"],
+                name="ux_encryption_keys_tenant_subject",
+            ),
+        ]
+
+
 class OutboxEntry(models.Model):
     objects: models.Manager
 
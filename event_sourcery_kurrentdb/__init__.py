@@ -1,4 +1,5 @@
 __all__ = [
+    "KurrentDBAsyncStorageStrategy",
     "KurrentDBBackend",
     "KurrentDBConfig",
     "KurrentDBStorageStrategy",
@@ -6,20 +7,25 @@ __all__ = [
 
 from typing import TypeAlias
 
-from kurrentdbclient import KurrentDBClient
+from kurrentdbclient import AsyncKurrentDBClient, KurrentDBClient
 from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
 from typing_extensions import Self
 
 from event_sourcery import TenantId
 from event_sourcery.backend import Backend, not_configured
+from event_sourcery.event import PayloadCodec
 from event_sourcery.interfaces import (
+    AsyncStorageStrategy,
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
     StorageStrategy,
     SubscriptionStrategy,
 )
 from event_sourcery.outbox import no_filter
-from event_sourcery_kurrentdb.event_store import KurrentDBStorageStrategy
+from event_sourcery_kurrentdb.event_store import (
+    KurrentDBAsyncStorageStrategy,
+    KurrentDBStorageStrategy,
+)
 from event_sourcery_kurrentdb.outbox import KurrentDBOutboxStorageStrategy
 from event_sourcery_kurrentdb.subscription import KurrentDBSubscriptionStrategy
 
@@ -58,19 +64,31 @@ class KurrentDBBackend(Backend):
         self[KurrentDBClient] = not_configured(
             "Configure backend with `.configure(kurrentdb_client, config)`",
         )
+        self[AsyncKurrentDBClient] = not_configured(
+            "Configure backend with `.configure(async_kurrentdb_client, config)`",
+        )
         self[KurrentDBConfig] = not_configured(
             "Configure backend with `.configure(kurrentdb_client, config)`",
         )
         self[StorageStrategy] = lambda c: KurrentDBStorageStrategy(
             c[KurrentDBClient],
             c[KurrentDBConfig].timeout,
+            c[PayloadCodec],
+        ).scoped_for_tenant(c[TenantId])
+        self[AsyncStorageStrategy] = lambda c: KurrentDBAsyncStorageStrategy(
+            c[AsyncKurrentDBClient],
+            c[KurrentDBConfig].timeout,
+            c[PayloadCodec],
         ).scoped_for_tenant(c[TenantId])
         self[SubscriptionStrategy] = lambda c: KurrentDBSubscriptionStrategy(
             c[KurrentDBClient],
+            c[PayloadCodec],
         )
 
     def configure(
-        self, client: KurrentDBClient, config: KurrentDBConfig | None = None
+        self,
+        client: KurrentDBClient | AsyncKurrentDBClient,
+        config: KurrentDBConfig | None = None,
     ) -> Self:
         """
         Sets the backend configuration for KurrentDB client and outbox behavior.
@@ -79,9 +97,10 @@ class KurrentDBBackend(Backend):
         If no config is provided, the default configuration is used.
         This method must be called before using the backend in production
         to ensure correct event publishing and subscription reliability.
+        Passing a connected `AsyncKurrentDBClient` configures `async_event_store`.
 
         Args:
-            client (KurrentDBClient):
+            client (KurrentDBClient | AsyncKurrentDBClient):
                 The KurrentDB client instance to use for backend operations.
             config (KurrentDBConfig | None):
                 Optional custom configuration. If None, uses default SQLAlchemyConfig().
@@ -89,7 +108,10 @@ class KurrentDBBackend(Backend):
         Returns:
             Self: The configured backend instance (for chaining).
         """
-        self[KurrentDBClient] = client
+        if isinstance(client, AsyncKurrentDBClient):
+            self[AsyncKurrentDBClient] = client
+        else:
+            self[KurrentDBClient] = client
         self[KurrentDBConfig] = config or KurrentDBConfig()
         return self
 
@@ -101,6 +123,7 @@ class KurrentDBBackend(Backend):
             c[KurrentDBConfig].outbox_name,
             c[KurrentDBConfig].outbox_attempts,
             c[KurrentDBConfig].timeout,
+            c[PayloadCodec],
         )
         self[OutboxStorageStrategy] = lambda c: c[KurrentDBOutboxStorageStrategy]
         self[KurrentDBOutboxStorageStrategy].create_subscription()
@@ -3,15 +3,28 @@ from datetime import datetime
 from typing import Any, Literal, cast
 
 from kurrentdbclient import NewEvent, RecordedEvent
+from kurrentdbclient.events import ContentType
 
-from event_sourcery.event import Position, RawEvent, RecordedRaw
+from event_sourcery import StreamId, StreamInfo
+from event_sourcery.event import (
+    JsonCodec,
+    PayloadCodec,
+    Position,
+    RawEvent,
+    RecordedRaw,
+)
 from event_sourcery_kurrentdb import stream
 
 ES_PREFIX = "$es-"
+JSON: ContentType = "application/json"
+BINARY: ContentType = "application/octet-stream"
+JSON_CODEC = JsonCodec()
 
 
 def raw_event(
-    from_entry: RecordedEvent, version: int | Literal["undefined"] = "undefined"
+    from_entry: RecordedEvent,
+    codec: PayloadCodec,
+    version: int | Literal["undefined"] = "undefined",
 ) -> RawEvent:
     metadata = json.loads(from_entry.metadata.decode("utf-8"))
     created_at = datetime.fromisoformat(metadata.pop("created_at"))
@@ -21,28 +34,59 @@ def raw_event(
 
     version = cast(int, version)
 
-    return RawEvent(
+    return RawEvent.undecoded(
         uuid=from_entry.id,
         stream_id=stream.Name.from_stream_name(from_entry.stream_name).uuid,
         created_at=created_at,
         version=version,
         name=from_entry.type,
-        data=json.loads(from_entry.data.decode("utf-8")),
+        payload=from_entry.data,
+        decode=codec_for(from_entry, codec).decode,
         context={k: v for k, v in metadata.items() if not k.startswith(ES_PREFIX)},
     )
 
 
-def snapshot(from_entry: RecordedEvent) -> RawEvent:
+def codec_for(from_entry: RecordedEvent, codec: PayloadCodec) -> PayloadCodec:
+    # events written before switching to or from a binary codec keep their format
+    if (from_entry.content_type == BINARY) == codec.binary:
+        return codec
+    return JSON_CODEC
+
+
+def snapshot(from_entry: RecordedEvent, codec: PayloadCodec) -> RawEvent:
     metadata = json.loads(from_entry.metadata.decode("utf-8"))
     position = metadata[f"{ES_PREFIX}stream_position"]
-    return raw_event(from_entry, version=stream.Position(position).as_version())
+    return raw_event(
+        from_entry,
+        codec,
+        version=stream.Position(position).as_version(),
+    )
+
+
+def stream_info(
+    stream_id: StreamId,
+    first_entry: RecordedEvent,
+    last_entry: RecordedEvent,
+    snapshot_version: int | None,
+    codec: PayloadCodec,
+) -> StreamInfo:
+    first, last = raw_event(first_entry, codec), raw_event(last_entry, codec)
+    return StreamInfo(
+        stream_id=stream_id,
+        version=last.version,
+        event_count=last_entry.stream_position - first_entry.stream_position + 1,
+        created_at=first.created_at,
+        updated_at=last.created_at,
+        snapshot_version=snapshot_version,
+    )
 
 
-def new_entry(from_raw: RawEvent, **metadata: Any) -> NewEvent:
+def new_entry(from_raw: RawEvent, codec: PayloadCodec, **metadata: Any) -> NewEvent:
     return NewEvent(
         id=from_raw.uuid,
         type=from_raw.name,
-        data=json.dumps(from_raw.data).encode("utf-8"),
+        data=codec.encode(from_raw.data),
+        content_type=BINARY if codec.binary else JSON,
         metadata=json.dumps(
             dict(
                 **from_raw.context,
@@ -53,10 +97,10 @@ def new_entry(from_raw: RawEvent, **metadata: Any) -> NewEvent:
     )
 
 
-def raw_record(from_entry: RecordedEvent) -> RecordedRaw:
+def raw_record(from_entry: RecordedEvent, codec: PayloadCodec) -> RecordedRaw:
     stream_name = stream.Name.from_stream_name(from_entry.stream_name)
-    return RecordedRaw(
-        entry=raw_event(from_entry),
+    return RecordedRaw.trusted(
+        entry=raw_event(from_entry, codec),
         position=Position(from_entry.commit_position or 0),
         tenant_id=stream_name.tenant_id,
     )
@@ -1,14 +1,28 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
 from dataclasses import dataclass, replace
 from typing import cast
 
-from kurrentdbclient import KurrentDBClient, StreamState
-from kurrentdbclient.exceptions import NotFoundError
+from kurrentdbclient import AsyncKurrentDBClient, KurrentDBClient, StreamState
+from kurrentdbclient.exceptions import NotFoundError, WrongCurrentVersionError
 from typing_extensions import Self
 
-from event_sourcery import DEFAULT_TENANT, NO_VERSIONING, StreamId, TenantId
-from event_sourcery.event import Position, RawEvent
+from event_sourcery import (
+    DEFAULT_TENANT,
+    NO_VERSIONING,
+    AppendResult,
+    StreamCategory,
+    StreamId,
+    StreamInfo,
+    TenantId,
+)
+from event_sourcery.event import PayloadCodec, Position, RawEvent, RecordedRaw
 from event_sourcery.exceptions import ConcurrentStreamWriteError
-from event_sourcery.interfaces import StorageStrategy, Versioning
+from event_sourcery.interfaces import (
+    AsyncStorageStrategy,
+    StorageStrategy,
+    Versioning,
+)
 from event_sourcery_kurrentdb import dto, stream
 
 
@@ -16,6 +30,7 @@ from event_sourcery_kurrentdb import dto, stream
 class KurrentDBStorageStrategy(StorageStrategy):
     _client: KurrentDBClient
     _timeout: float | None
+    _codec: PayloadCodec
     _tenant_id: TenantId = DEFAULT_TENANT
 
     def fetch_events(
@@ -37,13 +52,73 @@ class KurrentDBStorageStrategy(StorageStrategy):
             timeout=self._timeout,
         )
         try:
-            events = [dto.raw_event(entry) for entry in entries]
+            events = [dto.raw_event(entry, self._codec) for entry in entries]
             if snapshot:
                 return [snapshot, *events]
             return events
         except NotFoundError:
             return []
 
+    def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[RawEvent]:
+        name = stream.Name(self._tenant_id, stream_id)
+        if start is None and (snapshot := self._read_snapshot(name)) is not None:
+            yield snapshot
+            start = cast(int, snapshot.version) + 1
+
+        position, remaining = stream.scope(start, stop)
+        position = position or stream.Position(0)
+        while remaining > 0:
+            entries = self._client.read_stream(
+                stream_name=str(name),
+                stream_position=position,
+                limit=min(page_size, remaining),
+                timeout=self._timeout,
+            )
+            try:
+                page = [dto.raw_event(entry, self._codec) for entry in entries]
+            except NotFoundError:
+                return
+            yield from page
+            if len(page) < page_size:
+                return
+            position = stream.Position.from_version(cast(int, page[-1].version) + 1)
+            remaining -= len(page)
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> Iterator[RecordedRaw]:
+        last_position = after_position
+        while True:
+            entries = self._client.read_all(
+                commit_position=last_position,
+                filter_include=[stream.category_filter(category, tenant_id)],
+                filter_by_stream_name=True,
+                limit=page_size + 1,
+                timeout=self._timeout,
+            )
+            page = [dto.raw_record(entry, self._codec) for entry in entries]
+            page = [record for record in page if record.position > last_position]
+            yield from page[:page_size]
+            if len(page) < page_size:
+                return
+            last_position = page[page_size - 1].position
+
+    def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        return {stream_id: self.fetch_events(stream_id) for stream_id in stream_ids}
+
     def _read_snapshot(self, name: stream.Name) -> RawEvent | None:
         snapshots = self._client.read_stream(
             name.snapshot,
@@ -53,29 +128,76 @@ class KurrentDBStorageStrategy(StorageStrategy):
         )
         try:
             last = next(iter(snapshots))
-            return dto.snapshot(last)
+            return dto.snapshot(last, self._codec)
         except NotFoundError:
             return None
 
+    def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        name = stream.Name(self._tenant_id, stream_id)
+        try:
+            first = self._client.get_stream(str(name), limit=1, timeout=self._timeout)
+            last = self._client.get_stream(
+                str(name), backwards=True, limit=1, timeout=self._timeout
+            )
+        except NotFoundError:
+            return None
+        if not first or not last:
+            return None
+
+        snapshot = self._read_snapshot(name)
+        return dto.stream_info(
+            stream_id,
+            first[0],
+            last[0],
+            snapshot_version=snapshot.version if snapshot else None,
+            codec=self._codec,
+        )
+
     def insert_events(
         self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
-    ) -> None:
-        for sid in {e.stream_id for e in events}:
-            self._ensure_stream(stream_id=sid, versioning=versioning)
-            stream_name = stream.Name(self._tenant_id, sid)
-            stream_events = [e for e in events if e.stream_id == sid]
-            self._append_events(stream_name, events=stream_events)
-
-    def _append_events(self, name: stream.Name, events: list[RawEvent]) -> int:
-        return cast(
-            int,
-            self._client.append_events(
-                str(name),
-                current_version=StreamState.ANY,
-                events=(dto.new_entry(e) for e in events),
-                timeout=self._timeout,
-            ),
-        )
+    ) -> AppendResult:
+        results = self.insert_events_many({stream_id: (events, versioning)})
+        return results[stream_id]
+
+    def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        for stream_id, (_, versioning) in streams.items():
+            self._ensure_stream(stream_id=stream_id, versioning=versioning)
+
+        results = {}
+        for stream_id, (events, versioning) in streams.items():
+            stream_name = stream.Name(self._tenant_id, stream_id)
+            position = self._append_events(stream_name, events, versioning)
+            results[stream_id] = AppendResult(
+                version=events[-1].version,
+                position=Position(position),
+            )
+        return results
+
+    def _append_events(
+        self,
+        name: stream.Name,
+        events: list[RawEvent],
+        versioning: Versioning,
+    ) -> int:
+        current_version: int | StreamState = StreamState.ANY
+        if versioning is not NO_VERSIONING and versioning.expected_version:
+            current_version = stream.Position.from_version(versioning.expected_version)
+
+        try:
+            return cast(
+                int,
+                self._client.append_events(
+                    str(name),
+                    current_version=current_version,
+                    events=(dto.new_entry(e, self._codec) for e in events),
+                    timeout=self._timeout,
+                ),
+            )
+        except WrongCurrentVersionError as error:
+            raise ConcurrentStreamWriteError(current_version) from error
 
     def save_snapshot(self, snapshot: RawEvent) -> None:
         name = stream.Name(self._tenant_id, snapshot.stream_id)
@@ -83,7 +205,9 @@ class KurrentDBStorageStrategy(StorageStrategy):
         self._client.append_events(
             name.snapshot,
             current_version=StreamState.ANY,
-            events=[dto.new_entry(snapshot, stream_position=stream_position)],
+            events=[
+                dto.new_entry(snapshot, self._codec, stream_position=stream_position)
+            ],
             timeout=self._timeout,
         )
 
@@ -128,3 +252,227 @@ class KurrentDBStorageStrategy(StorageStrategy):
 
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         return replace(self, _tenant_id=tenant_id)
+
+
+@dataclass(repr=False)
+class KurrentDBAsyncStorageStrategy(AsyncStorageStrategy):
+    _client: AsyncKurrentDBClient
+    _timeout: float | None
+    _codec: PayloadCodec
+    _tenant_id: TenantId = DEFAULT_TENANT
+
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        snapshot = None
+        name = stream.Name(self._tenant_id, stream_id)
+        if start is None and (snapshot := await self._read_snapshot(name)) is not None:
+            start = cast(int, snapshot.version) + 1
+
+        position, limit = stream.scope(start, stop)
+        try:
+            entries = await self._client.get_stream(
+                stream_name=str(name),
+                stream_position=position,
+                limit=limit,
+                timeout=self._timeout,
+            )
+        except NotFoundError:
+            return []
+        events = [dto.raw_event(entry, self._codec) for entry in entries]
+        if snapshot:
+            return [snapshot, *events]
+        return events
+
+    async def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[RawEvent]:
+        name = stream.Name(self._tenant_id, stream_id)
+        if start is None and (snapshot := await self._read_snapshot(name)) is not None:
+            yield snapshot
+            start = cast(int, snapshot.version) + 1
+
+        position, remaining = stream.scope(start, stop)
+        position = position or stream.Position(0)
+        while remaining > 0:
+            try:
+                entries = await self._client.get_stream(
+                    stream_name=str(name),
+                    stream_position=position,
+                    limit=min(page_size, remaining),
+                    timeout=self._timeout,
+                )
+            except NotFoundError:
+                return
+            for entry in entries:
+                yield dto.raw_event(entry, self._codec)
+            if len(entries) < page_size:
+                return
+            position = stream.Position(entries[-1].stream_position + 1)
+            remaining -= len(entries)
+
+    async def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> AsyncIterator[RecordedRaw]:
+        last_position = after_position
+        while True:
+            entries = await self._client.read_all(
+                commit_position=last_position,
+                filter_include=[stream.category_filter(category, tenant_id)],
+                filter_by_stream_name=True,
+                limit=page_size + 1,
+                timeout=self._timeout,
+            )
+            page = [dto.raw_record(entry, self._codec) async for entry in entries]
+            page = [record for record in page if record.position > last_position]
+            for record in page[:page_size]:
+                yield record
+            if len(page) < page_size:
+                return
+            last_position = page[page_size - 1].position
+
+    async def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        return {
+            stream_id: await self.fetch_events(stream_id) for stream_id in stream_ids
+        }
+
+    async def _read_snapshot(self, name: stream.Name) -> RawEvent | None:
+        try:
+            snapshots = await self._client.get_stream(
+                name.snapshot,
+                limit=1,
+                backwards=True,
+                timeout=self._timeout,
+            )
+        except NotFoundError:
+            return None
+        return dto.snapshot(snapshots[0], self._codec) if snapshots else None
+
+    async def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        name = stream.Name(self._tenant_id, stream_id)
+        try:
+            first, last, snapshot = await asyncio.gather(
+                self._client.get_stream(str(name), limit=1, timeout=self._timeout),
+                self._client.get_stream(
+                    str(name), backwards=True, limit=1, timeout=self._timeout
+                ),
+                self._read_snapshot(name),
+            )
+        except NotFoundError:
+            return None
+        if not first or not last:
+            return None
+
+        return dto.stream_info(
+            stream_id,
+            first[0],
+            last[0],
+            snapshot_version=snapshot.version if snapshot else None,
+            codec=self._codec,
+        )
+
+    async def insert_events(
+        self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
+    ) -> AppendResult:
+        results = await self.insert_events_many({stream_id: (events, versioning)})
+        return results[stream_id]
+
+    async def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        for stream_id, (_, versioning) in streams.items():
+            await self._ensure_stream(stream_id=stream_id, versioning=versioning)
+
+        results = {}
+        for stream_id, (events, versioning) in streams.items():
+            stream_name = stream.Name(self._tenant_id, stream_id)
+            position = await self._append_events(stream_name, events, versioning)
+            results[stream_id] = AppendResult(
+                version=events[-1].version,
+                position=Position(position),
+            )
+        return results
+
+    async def _append_events(
+        self,
+        name: stream.Name,
+        events: list[RawEvent],
+        versioning: Versioning,
+    ) -> int:
+        current_version: int | StreamState = StreamState.ANY
+        if versioning is not NO_VERSIONING and versioning.expected_version:
+            current_version = stream.Position.from_version(versioning.expected_version)
+
+        try:
+            return await self._client.append_events(
+                str(name),
+                current_version=current_version,
+                events=[dto.new_entry(e, self._codec) for e in events],
+                timeout=self._timeout,
+            )
+        except WrongCurrentVersionError as error:
+            raise ConcurrentStreamWriteError(current_version) from error
+
+    async def _ensure_stream(self, stream_id: StreamId, versioning: Versioning) -> None:
+        name = stream.Name(self._tenant_id, stream_id)
+
+        if versioning is not NO_VERSIONING and versioning.expected_version:
+            expected = stream.Position.from_version(versioning.expected_version)
+            if (position := await self._get_stream_position(name)) != expected:
+                raise ConcurrentStreamWriteError(position, expected)
+
+    async def _get_stream_position(self, name: stream.Name) -> stream.Position | None:
+        try:
+            entries = await self._client.get_stream(
+                str(name),
+                backwards=True,
+                limit=1,
+                timeout=self._timeout,
+            )
+        except NotFoundError:
+            return None
+        return stream.Position(entries[0].stream_position) if entries else None
+
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        name = stream.Name(self._tenant_id, snapshot.stream_id)
+        stream_position = stream.Position.from_version(cast(int, snapshot.version))
+        await self._client.append_events(
+            name.snapshot,
+            current_version=StreamState.ANY,
+            events=[
+                dto.new_entry(snapshot, self._codec, stream_position=stream_position)
+            ],
+            timeout=self._timeout,
+        )
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        name = stream.Name(self._tenant_id, stream_id)
+        try:
+            await self._client.delete_stream(
+                str(name),
+                current_version=StreamState.ANY,
+                timeout=self._timeout,
+            )
+        except NotFoundError:
+            pass
+
+    async def current_position(self) -> Position | None:
+        return Position(await self._client.get_commit_position(timeout=self._timeout))
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        return replace(self, _tenant_id=tenant_id)
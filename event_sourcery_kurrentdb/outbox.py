@@ -8,7 +8,7 @@ from kurrentdbclient import KurrentDBClient, RecordedEvent
 from kurrentdbclient.exceptions import DeadlineExceededError, NotFoundError
 from kurrentdbclient.persistent import AbstractPersistentSubscription
 
-from event_sourcery.event import RecordedRaw
+from event_sourcery.event import PayloadCodec, RecordedRaw
 from event_sourcery.interfaces import (
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
@@ -25,6 +25,7 @@ class KurrentDBOutboxStorageStrategy(OutboxStorageStrategy):
     _outbox_name: str
     _max_publish_attempts: int
     _timeout: float | None
+    _codec: PayloadCodec
     _active_subscription: AbstractPersistentSubscription = field(init=False)
 
     def create_subscription(self) -> None:
@@ -67,7 +68,7 @@ class KurrentDBOutboxStorageStrategy(OutboxStorageStrategy):
         with self._context(limit) as subscription:
             try:
                 for entry in subscription:
-                    record = dto.raw_record(entry)
+                    record = dto.raw_record(entry, self._codec)
                     if self._filterer(record.entry):
                         yield self._publish_context(entry, record)
             except DeadlineExceededError:
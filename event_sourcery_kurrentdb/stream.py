@@ -51,6 +51,10 @@ class Position(int):
 MAX_POSITION = Position(sys.maxsize)
 
 
+def category_filter(category: str, tenant_id: TenantId | None) -> str:
+    return f"{category}-{tenant_id or '[^-]*'}-\\w+"
+
+
 def scope(
     start_version: int | None,
     stop_version: int | None,
@@ -7,9 +7,9 @@ from typing import Protocol
 import kurrentdbclient.exceptions
 from kurrentdbclient import KurrentDBClient, RecordedEvent
 
-from event_sourcery.event import Position, RecordedRaw
+from event_sourcery.event import PayloadCodec, Position, RecordedRaw
 from event_sourcery.interfaces import SubscriptionStrategy
-from event_sourcery_kurrentdb import dto
+from event_sourcery_kurrentdb import dto, stream
 
 
 class BuilderCallable(Protocol):
@@ -21,9 +21,10 @@ class BuilderCallable(Protocol):
 @dataclass(repr=False)
 class KurrentDBSubscriptionStrategy(SubscriptionStrategy):
     _client: KurrentDBClient
+    _codec: PayloadCodec
 
-    @staticmethod
     def _iterator(
+        self,
         builder: BuilderCallable,
         size: int,
     ) -> Iterator[list[RecordedRaw]]:
@@ -31,7 +32,7 @@ class KurrentDBSubscriptionStrategy(SubscriptionStrategy):
         batch = []
         while True:
             try:
-                raw = dto.raw_record(next(subscription))
+                raw = dto.raw_record(next(subscription), self._codec)
                 builder = partial(builder, commit_position=raw.position)
                 batch.append(raw)
                 if len(batch) == size:
@@ -66,7 +67,7 @@ class KurrentDBSubscriptionStrategy(SubscriptionStrategy):
             self._client.subscribe_to_all,
             commit_position=start_from,
             timeout=timelimit.total_seconds(),
-            filter_include=[f"{category}-[^-]*-\\w+"],
+            filter_include=[stream.category_filter(category, tenant_id=None)],
             filter_by_stream_name=True,
         )
         return self._iterator(builder, batch_size)
@@ -1,4 +1,5 @@
 __all__ = [
+    "BaseEncryptionKey",
     "BaseEvent",
     "BaseOutboxEntry",
     "BaseProjectorCursor",
@@ -7,6 +8,8 @@ __all__ = [
     "Models",
     "SQLAlchemyBackend",
     "SQLAlchemyConfig",
+    "SqlAlchemyAsyncStorageStrategy",
+    "SqlAlchemyKeyStorage",
     "SqlAlchemyStorageStrategy",
     "configure_models",
     "models",
@@ -16,6 +19,7 @@ from dataclasses import dataclass
 from datetime import timedelta
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing_extensions import Self
 
@@ -23,6 +27,8 @@ from event_sourcery import TenantId
 from event_sourcery.backend import TransactionalBackend, not_configured
 from event_sourcery.in_transaction import Dispatcher
 from event_sourcery.interfaces import (
+    AsyncOutboxStorageStrategy,
+    AsyncStorageStrategy,
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
     StorageStrategy,
@@ -30,9 +36,14 @@ from event_sourcery.interfaces import (
 )
 from event_sourcery.outbox import no_filter
 from event_sourcery_sqlalchemy import models
-from event_sourcery_sqlalchemy.event_store import SqlAlchemyStorageStrategy
+from event_sourcery_sqlalchemy.event_store import (
+    SqlAlchemyAsyncStorageStrategy,
+    SqlAlchemyStorageStrategy,
+)
+from event_sourcery_sqlalchemy.key_storage import SqlAlchemyKeyStorage
 from event_sourcery_sqlalchemy.models import configure_models
 from event_sourcery_sqlalchemy.models.base import (
+    BaseEncryptionKey,
     BaseEvent,
     BaseOutboxEntry,
     BaseProjectorCursor,
@@ -45,7 +56,10 @@ from event_sourcery_sqlalchemy.models.default import (
     DefaultSnapshot,
     DefaultStream,
 )
-from event_sourcery_sqlalchemy.outbox import SqlAlchemyOutboxStorageStrategy
+from event_sourcery_sqlalchemy.outbox import (
+    SqlAlchemyAsyncOutboxStorageStrategy,
+    SqlAlchemyOutboxStorageStrategy,
+)
 from event_sourcery_sqlalchemy.subscription import SqlAlchemySubscriptionStrategy
 
 
@@ -105,6 +119,7 @@ class SQLAlchemyBackend(TransactionalBackend):
         super().__init__()
         self[Models] = not_configured(self.UNCONFIGURED_MESSAGE)
         self[Session] = not_configured(self.UNCONFIGURED_MESSAGE)
+        self[AsyncSession] = not_configured(self.UNCONFIGURED_MESSAGE)
         self[SQLAlchemyConfig] = not_configured(self.UNCONFIGURED_MESSAGE)
         self[StorageStrategy] = lambda c: SqlAlchemyStorageStrategy(
             c[Session],
@@ -114,6 +129,10 @@ class SQLAlchemyBackend(TransactionalBackend):
             c[Models].snapshot_model,
             c[Models].stream_model,
         ).scoped_for_tenant(c[TenantId])
+        self[AsyncStorageStrategy] = lambda c: SqlAlchemyAsyncStorageStrategy(
+            c[AsyncSession],
+            c[StorageStrategy],
+        )
         self[SubscriptionStrategy] = lambda c: SqlAlchemySubscriptionStrategy(
             c[Session],
             c[SQLAlchemyConfig].gap_retry_interval,
@@ -123,7 +142,7 @@ class SQLAlchemyBackend(TransactionalBackend):
 
     def configure(
         self,
-        session: Session,
+        session: Session | AsyncSession,
         config: SQLAlchemyConfig | None = None,
         custom_models: Models | None = None,
     ) -> Self:
@@ -134,11 +153,14 @@ class SQLAlchemyBackend(TransactionalBackend):
         instance, and optional custom ORM models.
         If no config or models are provided, the default configuration and models are
         used.
+        When an `AsyncSession` is given, `async_event_store` and `async_outbox` work on
+        it, while synchronous components use its `sync_session` and may only be called
+        from within `AsyncSession.run_sync`.
         This method must be called before using the backend in production to ensure
         correct event publishing and subscription reliability.
 
         Args:
-            session (Session): The SQLAlchemy session instance to use for backend operations.
+            session (Session | AsyncSession): The SQLAlchemy session instance to use for backend operations.
             config (SQLAlchemyConfig | None): Optional custom configuration. If None, uses default Config().
             custom_models (Models | None): Optional custom ORM models. If None, uses default models.
 
@@ -154,6 +176,9 @@ class SQLAlchemyBackend(TransactionalBackend):
                 outbox_entry_model=DefaultOutboxEntry,
             )
 
+        if isinstance(session, AsyncSession):
+            self[AsyncSession] = session
+            session = session.sync_session
         self[Session] = session
         self[SQLAlchemyConfig] = config or SQLAlchemyConfig()
         self[Models] = custom_models
@@ -161,8 +186,8 @@ class SQLAlchemyBackend(TransactionalBackend):
 
     def with_outbox(self, filterer: OutboxFiltererStrategy = no_filter) -> Self:
         self[OutboxFiltererStrategy] = filterer  # type: ignore[type-abstract]
-        self[SqlAlchemyOutboxStorageStrategy] = (
-            lambda c: SqlAlchemyOutboxStorageStrategy(
+        self[SqlAlchemyOutboxStorageStrategy] = lambda c: (
+            SqlAlchemyOutboxStorageStrategy(
                 c[Session],
                 c[OutboxFiltererStrategy],  # type: ignore[type-abstract]
                 c[SQLAlchemyConfig].outbox_attempts,
@@ -170,4 +195,10 @@ class SQLAlchemyBackend(TransactionalBackend):
             )
         )
         self[OutboxStorageStrategy] = lambda c: c[SqlAlchemyOutboxStorageStrategy]
+        self[AsyncOutboxStorageStrategy] = lambda c: (
+            SqlAlchemyAsyncOutboxStorageStrategy(
+                c[AsyncSession],
+                c[SqlAlchemyOutboxStorageStrategy],
+            )
+        )
         return self
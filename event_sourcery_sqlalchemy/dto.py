@@ -1,19 +1,34 @@
 from event_sourcery import StreamId
-from event_sourcery.event import RawEvent
-from event_sourcery_sqlalchemy.models.base import BaseEvent, BaseStream
+from event_sourcery.event import RawEvent, RecordedRaw
+from event_sourcery_sqlalchemy.models.base import BaseEvent, BaseSnapshot, BaseStream
 
 
-def raw_event(from_entry: BaseEvent, in_stream: BaseStream) -> RawEvent:
-    return RawEvent(
+def raw_event(
+    from_entry: BaseEvent | BaseSnapshot,
+    in_stream: BaseStream,
+) -> RawEvent:
+    return RawEvent.trusted(
         uuid=from_entry.uuid,
-        stream_id=StreamId(
-            uuid=in_stream.uuid,
-            name=in_stream.name,
-            category=None if in_stream.category == "" else in_stream.category,
-        ),
+        stream_id=stream_id(in_stream),
         created_at=from_entry.created_at,
         version=from_entry.version,
         name=from_entry.name,
         data=from_entry.data,
         context=from_entry.event_context,
     )
+
+
+def raw_record(from_entry: BaseEvent, in_stream: BaseStream) -> RecordedRaw:
+    return RecordedRaw.trusted(
+        entry=raw_event(from_entry, in_stream),
+        position=from_entry.id,
+        tenant_id=in_stream.tenant_id,
+    )
+
+
+def stream_id(of_stream: BaseStream) -> StreamId:
+    return StreamId.trusted(
+        uuid=of_stream.uuid,
+        name=of_stream.name,
+        category=None if of_stream.category == "" else of_stream.category,
+    )
@@ -1,25 +1,51 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, replace
-from typing import cast
+from functools import partial
+from itertools import islice
+from typing import TypeVar
 
-from more_itertools import first_true
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    case,
+    delete,
+    func,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, contains_eager
 from typing_extensions import Self
 
-from event_sourcery import DEFAULT_TENANT, NO_VERSIONING, StreamId, TenantId
+from event_sourcery import (
+    DEFAULT_TENANT,
+    NO_VERSIONING,
+    AppendResult,
+    StreamCategory,
+    StreamId,
+    StreamInfo,
+    TenantId,
+)
 from event_sourcery.event import Position, RawEvent, RecordedRaw
 from event_sourcery.exceptions import (
     AnotherStreamWithThisNameButOtherIdExists,
     ConcurrentStreamWriteError,
 )
 from event_sourcery.in_transaction import Dispatcher
-from event_sourcery.interfaces import StorageStrategy, Versioning
+from event_sourcery.interfaces import (
+    AsyncStorageStrategy,
+    StorageStrategy,
+    Versioning,
+)
+from event_sourcery_sqlalchemy import dto
 from event_sourcery_sqlalchemy.models.base import BaseEvent, BaseSnapshot, BaseStream
 from event_sourcery_sqlalchemy.outbox import SqlAlchemyOutboxStorageStrategy
 
+T = TypeVar("T")
+
 
 @dataclass(repr=False)
 class SqlAlchemyStorageStrategy(StorageStrategy):
@@ -51,26 +77,7 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
 
         events: Sequence[BaseEvent | BaseSnapshot]
         try:
-            snapshot_stmt = (
-                select(self._snapshot_model)
-                .join(self._stream_model)
-                .filter(
-                    self._stream_model.stream_id == stream_id,
-                    self._stream_model.tenant_id == self._tenant_id,
-                )
-                .order_by(self._snapshot_model.created_at.desc())
-                .limit(1)
-            )
-            if start is not None:
-                snapshot_stmt = snapshot_stmt.filter(
-                    self._snapshot_model.version >= start
-                )
-
-            if stop is not None:
-                snapshot_stmt = snapshot_stmt.filter(
-                    self._snapshot_model.version < stop
-                )
-
+            snapshot_stmt = self._latest_snapshot_stmt(stream_id, start, stop)
             latest_snapshot = self._session.execute(snapshot_stmt).scalars().one()
         except NoResultFound:
             events = self._session.execute(events_stmt).scalars().all()
@@ -84,23 +91,162 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
         if not events:
             return []
 
-        raw_dict_events = [
-            RawEvent(
-                uuid=event.uuid,
-                stream_id=event.stream_id,
-                created_at=event.created_at,
-                version=event.version,
-                name=event.name,
-                data=event.data,
-                context=event.event_context,
+        stream = events[0].stream
+        return [dto.raw_event(event, stream) for event in events]
+
+    def _latest_snapshot_stmt(
+        self,
+        stream_id: StreamId,
+        start: int | None,
+        stop: int | None,
+    ) -> Select[tuple[BaseSnapshot]]:
+        snapshot_stmt = (
+            select(self._snapshot_model)
+            .join(self._stream_model)
+            .filter(
+                self._stream_model.stream_id == stream_id,
+                self._stream_model.tenant_id == self._tenant_id,
             )
-            for event in events
-        ]
-        return raw_dict_events
+            .order_by(self._snapshot_model.created_at.desc())
+            .limit(1)
+        )
+        if start is not None:
+            snapshot_stmt = snapshot_stmt.filter(self._snapshot_model.version >= start)
+
+        if stop is not None:
+            snapshot_stmt = snapshot_stmt.filter(self._snapshot_model.version < stop)
+
+        return snapshot_stmt
+
+    def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> Iterator[RawEvent]:
+        events_stmt = (
+            select(self._event_model)
+            .filter_by(stream_id=stream_id, tenant_id=self._tenant_id)
+            .order_by(self._event_model.version, self._event_model.id)
+            .limit(page_size)
+            .execution_options(yield_per=page_size)
+        )
+        if start is not None:
+            events_stmt = events_stmt.filter(self._event_model.version >= start)
+
+        if stop is not None:
+            events_stmt = events_stmt.filter(self._event_model.version < stop)
+
+        snapshot_stmt = self._latest_snapshot_stmt(stream_id, start, stop)
+        latest_snapshot = self._session.execute(snapshot_stmt).scalars().first()
+        if latest_snapshot is not None:
+            yield dto.raw_event(latest_snapshot, latest_snapshot.stream)
+            events_stmt = events_stmt.filter(
+                self._event_model.version > latest_snapshot.version
+            )
+
+        page_stmt = events_stmt
+        while True:
+            fetched = 0
+            for entry in self._session.execute(page_stmt).scalars():
+                fetched += 1
+                yield dto.raw_event(entry, entry.stream)
+            if fetched < page_size:
+                return
+            page_stmt = events_stmt.filter(
+                self._event_model.id > entry.id
+                if entry.version is None
+                else self._event_model.version > entry.version
+            )
+
+    def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> Iterator[RecordedRaw]:
+        events_stmt = (
+            select(self._event_model)
+            .join(self._event_model.stream)
+            .options(contains_eager(self._event_model.stream))
+            .filter(self._stream_model.category == category)
+            .order_by(self._event_model.id)
+            .limit(page_size)
+        )
+        if tenant_id is not None:
+            events_stmt = events_stmt.filter(self._stream_model.tenant_id == tenant_id)
+
+        last_position = after_position
+        while True:
+            page_stmt = events_stmt.filter(self._event_model.id > last_position)
+            page = self._session.execute(page_stmt).scalars().all()
+            for entry in page:
+                yield dto.raw_record(entry, entry.stream)
+            if len(page) < page_size:
+                return
+            last_position = page[-1].id
+
+    def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        requested = {(sid.int, sid.category or ""): sid for sid in stream_ids}
+        in_streams = self._stream_model.uuid.in_(stream_ids) & (
+            self._stream_model.tenant_id == self._tenant_id
+        )
+
+        newer = aliased(self._snapshot_model)
+        latest_snapshots_stmt = (
+            select(self._snapshot_model)
+            .join(self._snapshot_model.stream)
+            .options(contains_eager(self._snapshot_model.stream))
+            .where(in_streams)
+            .where(
+                self._snapshot_model.uuid
+                == select(newer.uuid)
+                .where(newer._db_stream_id == self._snapshot_model._db_stream_id)
+                .order_by(newer.created_at.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+        )
+        snapshots = self._session.execute(latest_snapshots_stmt).scalars().all()
+
+        snapshot_version = (
+            select(newer.version)
+            .where(newer._db_stream_id == self._event_model._db_stream_id)
+            .order_by(newer.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        events_stmt = (
+            select(self._event_model)
+            .join(self._event_model.stream)
+            .options(contains_eager(self._event_model.stream))
+            .where(in_streams)
+            .where(
+                or_(
+                    snapshot_version.is_(None),
+                    self._event_model.version > snapshot_version,
+                )
+            )
+            .order_by(self._event_model._db_stream_id, self._event_model.version)
+        )
+        events = self._session.execute(events_stmt).scalars().all()
 
-    def _ensure_stream(self, stream_id: StreamId, versioning: Versioning) -> None:
-        initial_version = versioning.initial_version
+        fetched: dict[StreamId, list[RawEvent]] = {sid: [] for sid in stream_ids}
+        entries: list[BaseEvent | BaseSnapshot] = [*snapshots, *events]
+        for entry in entries:
+            stream = entry.stream
+            stream_id = requested.get((stream.uuid.int, stream.category))
+            if stream_id is None or stream_id.name not in (None, stream.name):
+                continue
+            fetched[stream_id].append(dto.raw_event(entry, stream))
+        return fetched
 
+    def _matching_condition(self, stream_id: StreamId) -> ColumnElement[bool]:
         condition = (
             (self._stream_model.uuid == stream_id)
             & (self._stream_model.category == (stream_id.category or ""))
@@ -112,97 +258,206 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
                 & (self._stream_model.category == (stream_id.category or ""))
                 & (self._stream_model.tenant_id == self._tenant_id)
             )
-        matching_streams_stmt = select(self._stream_model).where(condition)
+        return condition
+
+    @staticmethod
+    def _is_matching(stream: BaseStream, stream_id: StreamId) -> bool:
+        return stream.category == (stream_id.category or "") and (
+            stream.uuid == stream_id
+            or (stream_id.name is not None and stream.name == stream_id.name)
+        )
+
+    def _ensure_streams(
+        self,
+        streams: Mapping[StreamId, Versioning],
+    ) -> dict[StreamId, BaseStream]:
+        matching_streams_stmt = select(self._stream_model).where(
+            or_(*(self._matching_condition(stream_id) for stream_id in streams))
+        )
         matching_streams = self._session.execute(matching_streams_stmt).scalars().all()
-        if not matching_streams:
-            ensure_stream_stmt = (
+        missing = [
+            (stream_id, versioning)
+            for stream_id, versioning in streams.items()
+            if not any(self._is_matching(s, stream_id) for s in matching_streams)
+        ]
+        if missing:
+            ensure_streams_stmt = (
                 postgresql_insert(self._stream_model)
                 .values(
-                    uuid=stream_id,
-                    name=stream_id.name,
-                    category=stream_id.category or "",
-                    version=initial_version,
-                    tenant_id=self._tenant_id,
+                    [
+                        {
+                            "uuid": stream_id,
+                            "name": stream_id.name,
+                            "category": stream_id.category or "",
+                            "version": versioning.initial_version,
+                            "tenant_id": self._tenant_id,
+                        }
+                        for stream_id, versioning in missing
+                    ]
                 )
                 .on_conflict_do_nothing()
             )
-            self._session.execute(ensure_stream_stmt)
+            self._session.execute(ensure_streams_stmt)
             matching_streams = (
                 self._session.execute(matching_streams_stmt).scalars().all()
             )
 
-        if stream_id.name is not None:
-            matching_stream_with_same_name: BaseStream = [
-                stream
-                for stream in matching_streams
-                if stream.name == stream_id.name
-                and stream.category == (stream_id.category or "")
-            ].pop()
-            if matching_stream_with_same_name.stream_id != stream_id:
-                raise AnotherStreamWithThisNameButOtherIdExists()
-
-        stream = cast(
-            BaseStream,
-            first_true(
-                matching_streams, pred=lambda stream: stream.stream_id == stream_id
-            ),
-        )
-        self._session.info.setdefault("strong_set", set())
-        self._session.info["strong_set"].add(stream)
-
-        versioning.validate_if_compatible(stream.version)
-
-        if versioning.expected_version and versioning is not NO_VERSIONING:
-            bump_version_stmt = (
-                update(self._stream_model)
-                .where(
-                    self._stream_model.stream_id == stream_id,
-                    self._stream_model.version == versioning.expected_version,
+        ensured = {}
+        for stream_id in streams:
+            if stream_id.name is not None:
+                matching_stream_with_same_name: BaseStream = [
+                    stream
+                    for stream in matching_streams
+                    if stream.name == stream_id.name
+                    and stream.category == (stream_id.category or "")
+                ].pop()
+                if matching_stream_with_same_name.stream_id != stream_id:
+                    raise AnotherStreamWithThisNameButOtherIdExists()
+
+            ensured[stream_id] = next(
+                stream for stream in matching_streams if stream.stream_id == stream_id
+            )
+        return ensured
+
+    def _bump_versions(self, streams: list[tuple[BaseStream, Versioning]]) -> None:
+        for stream, versioning in streams:
+            versioning.validate_if_compatible(stream.version)
+
+        to_bump = [
+            (stream, versioning)
+            for stream, versioning in streams
+            if versioning.expected_version and versioning is not NO_VERSIONING
+        ]
+        if not to_bump:
+            return
+
+        bump_versions_stmt = (
+            update(self._stream_model)
+            .where(
+                or_(
+                    *(
+                        (self._stream_model.id == stream.id)
+                        & (self._stream_model.version == versioning.expected_version)
+                        for stream, versioning in to_bump
+                    )
                 )
-                .values(version=versioning.initial_version)
             )
-            result = self._session.execute(bump_version_stmt)
+            .values(
+                version=case(
+                    {
+                        stream.id: versioning.initial_version
+                        for stream, versioning in to_bump
+                    },
+                    value=self._stream_model.id,
+                )
+            )
+        )
+        result = self._session.execute(bump_versions_stmt)
+
+        if result.rowcount != len(to_bump):
+            # optimistic lock failed
+            raise ConcurrentStreamWriteError
+
+    def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        latest_snapshot_version = (
+            select(self._snapshot_model.version)
+            .where(self._snapshot_model._db_stream_id == self._stream_model.id)
+            .order_by(self._snapshot_model.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        events = self._event_model
+        in_stream = events._db_stream_id == self._stream_model.id
+        first = select(events).where(in_stream).order_by(events.version, events.id)
+        last = (
+            select(events)
+            .where(in_stream)
+            .order_by(events.version.desc(), events.id.desc())
+        )
+        stmt = select(
+            self._stream_model,
+            first.with_only_columns(events.version).limit(1).scalar_subquery(),
+            first.with_only_columns(events.created_at).limit(1).scalar_subquery(),
+            last.with_only_columns(events.version).limit(1).scalar_subquery(),
+            last.with_only_columns(events.created_at).limit(1).scalar_subquery(),
+            latest_snapshot_version,
+        ).filter(
+            self._stream_model.stream_id == stream_id,
+            self._stream_model.tenant_id == self._tenant_id,
+        )
+        row = self._session.execute(stmt).one_or_none()
+        if row is None:
+            return None
 
-            if result.rowcount != 1:
-                # optimistic lock failed
-                raise ConcurrentStreamWriteError
+        (
+            stream,
+            first_version,
+            created_at,
+            last_version,
+            updated_at,
+            snapshot_version,
+        ) = row
+        if last_version is not None:
+            event_count = last_version - first_version + 1
+        elif stream.version is None:
+            count_stmt = select(func.count()).where(events._db_stream_id == stream.id)
+            event_count = self._session.execute(count_stmt).scalar_one()
+        else:
+            event_count = 0
+        return StreamInfo(
+            stream_id=stream.stream_id,
+            version=stream.version if last_version is None else last_version,
+            event_count=event_count,
+            created_at=created_at,
+            updated_at=updated_at,
+            snapshot_version=snapshot_version,
+        )
 
     def insert_events(
         self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
-    ) -> None:
-        self._ensure_stream(stream_id=stream_id, versioning=versioning)
-
-        stream = cast(
-            BaseStream,
-            first_true(
-                self._session.info["strong_set"],
-                pred=lambda model: isinstance(model, self._stream_model)
-                and model.stream_id == stream_id
-                and model.tenant_id == self._tenant_id,
-            ),
-        )
-
-        entries = [
-            self._event_model(
-                uuid=event.uuid,
-                created_at=event.created_at,
-                name=event.name,
-                data=event.data,
-                event_context=event.context,
-                version=event.version,
-            )
-            for event in events
-        ]
-        stream.events.extend(entries)
+    ) -> AppendResult:
+        return self.insert_events_many({stream_id: (events, versioning)})[stream_id]
+
+    def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        ensured = self._ensure_streams(
+            {stream_id: versioning for stream_id, (_, versioning) in streams.items()}
+        )
+        self._bump_versions(
+            [
+                (ensured[stream_id], versioning)
+                for stream_id, (_, versioning) in streams.items()
+            ]
+        )
+
+        inserted: list[tuple[RawEvent, BaseEvent]] = []
+        for stream_id, (events, _) in streams.items():
+            entries = [
+                self._event_model(
+                    uuid=event.uuid,
+                    created_at=event.created_at,
+                    name=event.name,
+                    data=event.data,
+                    event_context=event.context,
+                    version=event.version,
+                )
+                for event in events
+            ]
+            ensured[stream_id].events.extend(entries)
+            inserted.extend(zip(events, entries, strict=True))
+
         self._session.flush()
         records = [
-            RecordedRaw(entry=raw, position=db.id, tenant_id=db.tenant_id)
-            for raw, db in zip(events, entries, strict=False)
+            RecordedRaw(entry=raw, position=db.id, tenant_id=self._tenant_id)
+            for raw, db in inserted
         ]
         if self._outbox:
             self._outbox.put_into_outbox(records)
         self._session.flush()
         self._dispatcher.dispatch(*records)
+        return AppendResult.per_stream(records)
 
     def save_snapshot(self, snapshot: RawEvent) -> None:
         entry = self._snapshot_model(
@@ -239,3 +494,92 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
 
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         return replace(self, _tenant_id=tenant_id)
+
+
+@dataclass(repr=False)
+class SqlAlchemyAsyncStorageStrategy(AsyncStorageStrategy):
+    """
+    Runs `SqlAlchemyStorageStrategy` on an `AsyncSession`.
+
+    Every call is executed with `AsyncSession.run_sync`, so the ORM code is shared
+    with the synchronous strategy while database I/O is awaited on the event loop.
+    """
+
+    _session: AsyncSession
+    _strategy: StorageStrategy
+
+    async def _run(self, call: Callable[[], T]) -> T:
+        return await self._session.run_sync(lambda _: call())
+
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        return await self._run(
+            partial(self._strategy.fetch_events, stream_id, start, stop)
+        )
+
+    async def iter_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[RawEvent]:
+        events = self._strategy.iter_events(stream_id, start, stop, page_size)
+        while page := await self._run(lambda: list(islice(events, page_size))):
+            for event in page:
+                yield event
+
+    async def scan_category(
+        self,
+        category: StreamCategory,
+        after_position: Position = 0,
+        page_size: int = 100,
+        tenant_id: TenantId | None = None,
+    ) -> AsyncIterator[RecordedRaw]:
+        records = self._strategy.scan_category(
+            category, after_position, page_size, tenant_id
+        )
+        while page := await self._run(lambda: list(islice(records, page_size))):
+            for record in page:
+                yield record
+
+    async def fetch_events_many(
+        self,
+        stream_ids: Sequence[StreamId],
+    ) -> dict[StreamId, list[RawEvent]]:
+        return await self._run(partial(self._strategy.fetch_events_many, stream_ids))
+
+    async def fetch_stream_info(self, stream_id: StreamId) -> StreamInfo | None:
+        return await self._run(partial(self._strategy.fetch_stream_info, stream_id))
+
+    async def insert_events(
+        self,
+        stream_id: StreamId,
+        versioning: Versioning,
+        events: list[RawEvent],
+    ) -> AppendResult:
+        return await self._run(
+            partial(self._strategy.insert_events, stream_id, versioning, events)
+        )
+
+    async def insert_events_many(
+        self,
+        streams: Mapping[StreamId, tuple[list[RawEvent], Versioning]],
+    ) -> dict[StreamId, AppendResult]:
+        return await self._run(partial(self._strategy.insert_events_many, streams))
+
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        await self._run(partial(self._strategy.save_snapshot, snapshot))
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        await self._run(partial(self._strategy.delete_stream, stream_id))
+
+    async def current_position(self) -> Position | None:
+        return await self._run(lambda: self._strategy.current_position)
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        return replace(self, _strategy=self._strategy.scoped_for_tenant(tenant_id))
@@ -1,13 +1,30 @@
-import json
 from typing import Any
 
 from sqlalchemy.dialects.postgresql import JSONB as POSTGRES_JSONB
 from sqlalchemy.types import Text, TypeDecorator
 
+from event_sourcery.event import JsonCodec, PayloadCodec
+
 
 class JSONB(TypeDecorator):
+    """
+    JSON column, native on PostgreSQL and stored as text on other databases.
+
+    Args:
+        codec (PayloadCodec | None): Codec for the text representation, e.g.
+            `OrjsonCodec()`. Must produce UTF-8 JSON text, so binary codecs are
+            rejected. Not used on PostgreSQL. Defaults to `JsonCodec()`.
+    """
+
     impl = Text
 
+    def __init__(self, codec: PayloadCodec | None = None) -> None:
+        super().__init__()
+        codec = codec or JsonCodec()
+        if codec.binary:
+            raise ValueError(f"{type(codec).__name__} can't encode payloads as text")
+        self.codec = codec
+
     def load_dialect_impl(self, dialect: Any) -> Any:
         if dialect.name == "postgresql":
             return dialect.type_descriptor(POSTGRES_JSONB())
@@ -18,10 +35,10 @@ class JSONB(TypeDecorator):
         if dialect.name == "postgresql":
             return value
         else:
-            return json.dumps(value)
+            return self.codec.encode(value).decode("utf-8")
 
     def process_result_value(self, value: Any, dialect: Any) -> Any | None:
         if dialect.name == "postgresql":
             return value
         else:
-            return json.loads(value)
+            return self.codec.decode(value)
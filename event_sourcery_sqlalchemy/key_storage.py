@@ -0,0 +1,75 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from typing_extensions import Self
+
+from event_sourcery import DEFAULT_TENANT, TenantId
+from event_sourcery.interfaces import EncryptionKeyStorageStrategy
+from event_sourcery_sqlalchemy.models.base import BaseEncryptionKey
+from event_sourcery_sqlalchemy.models.default import DefaultEncryptionKey
+
+
+@dataclass(repr=False)
+class SqlAlchemyKeyStorage(EncryptionKeyStorageStrategy):
+    """
+    Stores encryption keys in a database table, keyed by tenant and subject.
+
+    Keys are read and written with the given session, so storing or shredding
+    a key is committed together with the rest of the transaction. Keys of many
+    subjects are read (`get_many`) and deleted (`delete_many`) with a single
+    query each. Requires a synchronous `Session`.
+
+    Examples:
+        >>> backend.with_encryption(strategy, SqlAlchemyKeyStorage(session))
+
+    Args:
+        session: The session to read and write keys with.
+        model: The encryption key model, mapped with `configure_models`.
+    """
+
+    _session: Session
+    _model: type[BaseEncryptionKey] = DefaultEncryptionKey
+    _tenant_id: TenantId = DEFAULT_TENANT
+
+    def get(self, subject_id: str) -> bytes | None:
+        return self._session.scalar(
+            select(self._model.key).where(
+                self._model.tenant_id == self._tenant_id,
+                self._model.subject_id == subject_id,
+            )
+        )
+
+    def get_many(self, subject_ids: Iterable[str]) -> dict[str, bytes]:
+        subject_ids = list(subject_ids)
+        if not subject_ids:
+            return {}
+        rows = self._session.execute(
+            select(self._model.subject_id, self._model.key).where(
+                self._model.tenant_id == self._tenant_id,
+                self._model.subject_id.in_(subject_ids),
+            )
+        )
+        return dict(rows.tuples().all())
+
+    def store(self, subject_id: str, key: bytes) -> None:
+        self._session.merge(self._model(self._tenant_id, subject_id, key))
+        self._session.flush()
+
+    def delete(self, subject_id: str) -> None:
+        self.delete_many([subject_id])
+
+    def delete_many(self, subject_ids: Iterable[str]) -> None:
+        subject_ids = list(subject_ids)
+        if not subject_ids:
+            return
+        self._session.execute(
+            delete(self._model).where(
+                self._model.tenant_id == self._tenant_id,
+                self._model.subject_id.in_(subject_ids),
+            )
+        )
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        return replace(self, _tenant_id=tenant_id)
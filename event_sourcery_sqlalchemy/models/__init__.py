@@ -5,6 +5,7 @@ from sqlalchemy.orm import DeclarativeBase, registry
 from sqlalchemy.orm.clsregistry import ClsRegistryToken
 
 from event_sourcery_sqlalchemy.models.base import (
+    BaseEncryptionKey,
     BaseEvent,
     BaseOutboxEntry,
     BaseProjectorCursor,
@@ -12,6 +13,7 @@ from event_sourcery_sqlalchemy.models.base import (
     BaseStream,
 )
 from event_sourcery_sqlalchemy.models.default import (
+    DefaultEncryptionKey,
     DefaultEvent,
     DefaultOutboxEntry,
     DefaultProjectorCursor,
@@ -34,15 +36,16 @@ def configure_models(
     snapshot_model: type[BaseSnapshot] = DefaultSnapshot,
     outbox_entry_model: type[BaseOutboxEntry] = DefaultOutboxEntry,
     projector_cursor_model: type[BaseProjectorCursor] = DefaultProjectorCursor,
+    encryption_key_model: type[BaseEncryptionKey] = DefaultEncryptionKey,
 ) -> None:
     """
     Configures SQLAlchemy ORM models for Event Sourcery backend.
 
     Sets up mapping information and registers the provided (or default) models with
     SQLAlchemy's registry.
-    This function allows customization of event, stream, snapshot, outbox entry, and
-    projector cursor models for advanced scenarios, or uses the default models for
-    standard usage.
+    This function allows customization of event, stream, snapshot, outbox entry,
+    projector cursor and encryption key models for advanced scenarios, or uses the
+    default models for standard usage.
     Ensures all models are mapped declaratively and share the same metadata and class
     registry, enabling flexible schema management and migrations.
 
@@ -59,6 +62,9 @@ def configure_models(
             Outbox entry model class to use. Defaults to DefaultOutboxEntry.
         projector_cursor_model (type[BaseProjectorCursor], optional):
             Projector cursor model class to use. Defaults to DefaultProjectorCursor.
+        encryption_key_model (type[BaseEncryptionKey], optional):
+            Encryption key model class used by `SqlAlchemyKeyStorage`.
+            Defaults to DefaultEncryptionKey.
     """
     event_model.__set_mapping_information__(stream_model)
     snapshot_model.__set_mapping_information__(stream_model)
@@ -71,6 +77,7 @@ def configure_models(
         snapshot_model,
         outbox_entry_model,
         projector_cursor_model,
+        encryption_key_model,
     ):
         if model_cls in _class_registry.values():
             continue
@@ -9,6 +9,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     UniqueConstraint,
     and_,
@@ -216,6 +217,18 @@ class BaseOutboxEntry:
     tries_left = mapped_column(Integer(), nullable=False)
 
 
+class BaseEncryptionKey:
+    # primary key on tenant and subject serves both point and IN lookups
+    tenant_id = mapped_column(String(255), primary_key=True)
+    subject_id = mapped_column(String(255), primary_key=True)
+    key = mapped_column(LargeBinary(), nullable=False)
+
+    def __init__(self, tenant_id: TenantId, subject_id: str, key: bytes) -> None:
+        self.tenant_id = tenant_id
+        self.subject_id = subject_id
+        self.key = key
+
+
 class BaseProjectorCursor:
     __tablename__: str
 
@@ -1,4 +1,5 @@
 from event_sourcery_sqlalchemy.models.base import (
+    BaseEncryptionKey,
     BaseEvent,
     BaseOutboxEntry,
     BaseProjectorCursor,
@@ -25,3 +26,7 @@ class DefaultOutboxEntry(BaseOutboxEntry):
 
 class DefaultProjectorCursor(BaseProjectorCursor):
     __tablename__ = "event_sourcery_projector_cursors"
+
+
+class DefaultEncryptionKey(BaseEncryptionKey):
+    __tablename__ = "event_sourcery_encryption_keys"
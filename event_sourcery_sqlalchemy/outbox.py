@@ -1,18 +1,25 @@
 import dataclasses
 import logging
-from collections.abc import Generator, Iterator
-from contextlib import AbstractContextManager, contextmanager
+from collections.abc import AsyncIterator, Generator, Iterator
+from contextlib import (
+    AbstractAsyncContextManager,
+    AbstractContextManager,
+    asynccontextmanager,
+    contextmanager,
+)
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import cast
 from uuid import UUID
 
-from sqlalchemy import insert, select
+from sqlalchemy import Select, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from event_sourcery import StreamId
 from event_sourcery.event import RawEvent, RecordedRaw
 from event_sourcery.interfaces import (
+    AsyncOutboxStorageStrategy,
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
 )
@@ -60,21 +67,33 @@ class SqlAlchemyOutboxStorageStrategy(OutboxStorageStrategy):
     def outbox_entries(
         self, limit: int
     ) -> Iterator[AbstractContextManager[RecordedRaw]]:
-        stmt = (
+        entries = self._session.execute(self._entries_stmt(limit)).scalars().all()
+        for entry in entries:
+            yield self._publish_context(entry)
+
+    def _entries_stmt(self, limit: int) -> Select[tuple[BaseOutboxEntry]]:
+        return (
             select(self._outbox_entry_model)
             .filter(self._outbox_entry_model.tries_left > 0)
             .order_by(self._outbox_entry_model.id)
             .limit(limit)
             .with_for_update(skip_locked=True)
         )
-        entries = self._session.execute(stmt).scalars().all()
-        for entry in entries:
-            yield self._publish_context(entry)
 
     @contextmanager
     def _publish_context(
         self, entry: BaseOutboxEntry
     ) -> Generator[RecordedRaw, None, None]:
+        try:
+            yield self._recorded(entry)
+        except Exception:
+            logger.exception("Failed to publish message #%d", entry.id)
+            entry.tries_left -= 1
+        else:
+            self._session.delete(entry)
+
+    @staticmethod
+    def _recorded(entry: BaseOutboxEntry) -> RecordedRaw:
         raw = RawEvent(
             uuid=UUID(entry.data["uuid"]),
             stream_id=StreamId(
@@ -87,14 +106,34 @@ class SqlAlchemyOutboxStorageStrategy(OutboxStorageStrategy):
             data=entry.data["data"],
             context=entry.data["context"],
         )
+        return RecordedRaw(
+            entry=raw,
+            position=entry.position,
+            tenant_id=entry.data["tenant_id"],
+        )
+
+
+@dataclass(repr=False)
+class SqlAlchemyAsyncOutboxStorageStrategy(AsyncOutboxStorageStrategy):
+    _session: AsyncSession
+    _strategy: SqlAlchemyOutboxStorageStrategy
+
+    async def outbox_entries(
+        self, limit: int
+    ) -> AsyncIterator[AbstractAsyncContextManager[RecordedRaw]]:
+        stmt = self._strategy._entries_stmt(limit)
+        entries = (await self._session.execute(stmt)).scalars().all()
+        for entry in entries:
+            yield self._publish_context(entry)
+
+    @asynccontextmanager
+    async def _publish_context(
+        self, entry: BaseOutboxEntry
+    ) -> AsyncIterator[RecordedRaw]:
         try:
-            yield RecordedRaw(
-                entry=raw,
-                position=entry.position,
-                tenant_id=entry.data["tenant_id"],
-            )
+            yield self._strategy._recorded(entry)
         except Exception:
             logger.exception("Failed to publish message #%d", entry.id)
             entry.tries_left -= 1
         else:
-            self._session.delete(entry)
+            await self._session.delete(entry)
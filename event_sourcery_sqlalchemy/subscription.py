@@ -212,11 +212,4 @@ class GapDetectingIterator(Iterator[list[RecordedRaw]]):
 
     @staticmethod
     def _batch_to_recorded_raw(batch: list[BaseEvent]) -> list[RecordedRaw]:
-        return [
-            RecordedRaw(
-                entry=dto.raw_event(event, event.stream),
-                position=event.id,
-                tenant_id=event.tenant_id,
-            )
-            for event in batch
-        ]
+        return [dto.raw_record(event, event.stream) for event in batch]
@@ -1,8 +1,9 @@
+import asyncio
 from collections.abc import Iterator
 from contextlib import contextmanager
 
 import pytest
-from kurrentdbclient import KurrentDBClient, StreamState
+from kurrentdbclient import AsyncKurrentDBClient, KurrentDBClient, StreamState
 
 from event_sourcery_kurrentdb import KurrentDBBackend
 
@@ -26,3 +27,14 @@ def kurrentdb_client() -> Iterator[KurrentDBClient]:
 def kurrentdb_backend(request: pytest.FixtureRequest) -> Iterator[KurrentDBBackend]:
     with kurrentdb_client() as client:
         yield KurrentDBBackend().configure(client)
+
+
+@pytest.fixture()
+def kurrentdb_async_backend(
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[KurrentDBBackend]:
+    with kurrentdb_client():
+        client = AsyncKurrentDBClient(uri="kurrentdb://localhost:2113?Tls=false")
+        loop.run_until_complete(client.connect())
+        yield KurrentDBBackend().configure(client)
+        loop.run_until_complete(client.close())
@@ -1,3 +1,4 @@
+import asyncio
 import errno
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -8,6 +9,7 @@ from typing import Any
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import (
     DeclarativeBase as Declarative,
 )
@@ -16,6 +18,7 @@ from sqlalchemy.orm import (
     close_all_sessions,
     sessionmaker,
 )
+from sqlalchemy.pool import NullPool
 
 from event_sourcery_sqlalchemy import (
     SQLAlchemyBackend,
@@ -92,3 +95,52 @@ def sqlalchemy_postgres_backend() -> Iterator[SQLAlchemyBackend]:
                 outbox_attempts=1, gap_retry_interval=timedelta(seconds=0.1)
             ),
         )
+
+
+@contextmanager
+def sqlalchemy_async_session(
+    url: str,
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[AsyncSession]:
+    engine = create_async_engine(url, poolclass=NullPool)
+    session = AsyncSession(engine)
+    yield session
+    loop.run_until_complete(session.close())
+    loop.run_until_complete(engine.dispose())
+
+
+@pytest.fixture()
+def sqlalchemy_sqlite_async_backend(
+    tmp_path: Path,
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[SQLAlchemyBackend]:
+    pytest.importorskip("aiosqlite")
+    with (
+        sqlalchemy_sqlite_session(tmp_path),
+        sqlalchemy_async_session(
+            f"sqlite+aiosqlite:///{tmp_path / 'sqlite.db'}",
+            loop,
+        ) as session,
+    ):
+        yield SQLAlchemyBackend().configure(
+            session,
+            SQLAlchemyConfig(outbox_attempts=1),
+        )
+
+
+@pytest.fixture()
+def sqlalchemy_postgres_async_backend(
+    loop: asyncio.AbstractEventLoop,
+) -> Iterator[SQLAlchemyBackend]:
+    pytest.importorskip("asyncpg")
+    with (
+        sqlalchemy_postgres_session(),
+        sqlalchemy_async_session(
+            "postgresql+asyncpg://es:es@localhost:5432/es",
+            loop,
+        ) as session,
+    ):
+        yield SQLAlchemyBackend().configure(
+            session,
+            SQLAlchemyConfig(outbox_attempts=1),
+        )
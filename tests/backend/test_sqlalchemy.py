@@ -1,9 +1,11 @@
-from typing import cast
+from typing import Any, cast
 
 import pytest
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Session
 
 from event_sourcery import Event, StreamId
+from event_sourcery.event import OrjsonCodec, PayloadCodec
 from event_sourcery_sqlalchemy import (
     BaseEvent,
     BaseSnapshot,
@@ -12,6 +14,7 @@ from event_sourcery_sqlalchemy import (
     SQLAlchemyBackend,
     configure_models,
 )
+from event_sourcery_sqlalchemy.jsonb import JSONB
 from tests import mark
 from tests.backend.sqlalchemy import (
     DeclarativeBase,
@@ -86,3 +89,24 @@ def test_backends_with_different_tables_are_isolated(
     assert stream_in_custom_tables[0].version == 1
     assert stream_in_default_tables[0].event.name == "Rascal"
     assert stream_in_custom_tables[0].event.name == "Bloke"
+
+
+def test_jsonb_stores_text_encoded_with_codec() -> None:
+    pytest.importorskip("orjson")
+    column_type, dialect = JSONB(OrjsonCodec()), sqlite.dialect()
+
+    stored = column_type.process_bind_param({"name": "Rascal"}, dialect)
+
+    assert stored == '{"name":"Rascal"}'
+    assert column_type.process_result_value(stored, dialect) == {"name": "Rascal"}
+
+
+def test_jsonb_rejects_binary_codec() -> None:
+    class BinaryCodec(PayloadCodec):
+        binary = True
+
+        def encode(self, payload: dict[str, Any]) -> bytes:
+            return repr(payload).encode()
+
+    with pytest.raises(ValueError):
+        JSONB(BinaryCodec())
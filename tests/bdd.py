@@ -114,6 +114,11 @@ class BatchSubscription:
             DeepDiff(received, expected, exclude_types=[type(ANY)])
         )
 
+    def next_batch_is_not_decoded(self) -> list[Recorded]:
+        received = next(self._subscription)
+        assert not any(r.wrapped_event.is_decoded for r in received)  # type: ignore[attr-defined]
+        return received
+
     def next_batch_is_empty(self) -> None:
         received = next(self._subscription)
         assert received == [], f"Received {received}, instead of empty batch"
@@ -234,9 +239,10 @@ class Step:
         to_category: str | None = None,
         to_events: list[type[Event]] | None = None,
         timelimit: int | float = 0.1,
+        lazy: bool = False,
     ) -> BatchSubscription:
         builder = self._create_subscription_builder(to, to_category, to_events)
-        return BatchSubscription(builder.build_batch(of_size, timelimit))
+        return BatchSubscription(builder.build_batch(of_size, timelimit, lazy=lazy))
 
     def in_transaction_listener(
         self,
@@ -1,5 +1,8 @@
+import asyncio
 import pkgutil
+from collections.abc import Awaitable, Callable, Iterator
 from pathlib import Path
+from typing import Any, TypeAlias
 
 import pytest
 
@@ -22,6 +25,21 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+Run: TypeAlias = Callable[[Awaitable[Any]], Any]
+
+
+@pytest.fixture()
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def run(loop: asyncio.AbstractEventLoop) -> Run:
+    return loop.run_until_complete
+
+
 @pytest.fixture()
 def backend() -> Backend:
     return InMemoryBackend()
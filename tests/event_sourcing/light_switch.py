@@ -10,8 +10,13 @@ class TurnedOff(Event):
     pass
 
 
+class LightSwitchSnapshot(Event):
+    shines: bool
+
+
 class LightSwitch(Aggregate):
     category = "light_switch"
+    snapshot_type = LightSwitchSnapshot
 
     class AlreadyTurnedOn(Exception):
         pass
@@ -29,6 +34,13 @@ class LightSwitch(Aggregate):
             case TurnedOff():
                 self._shines = False
 
+    def __snapshot__(self) -> LightSwitchSnapshot:
+        return LightSwitchSnapshot(shines=self._shines)
+
+    def __restore__(self, snapshot: Event) -> None:
+        assert isinstance(snapshot, LightSwitchSnapshot)
+        self._shines = snapshot.shines
+
     def turn_on(self) -> None:
         if self._shines:
             raise LightSwitch.AlreadyTurnedOn
@@ -0,0 +1,88 @@
+from uuid import uuid4
+
+import pytest
+
+from event_sourcery import StreamUUID
+from event_sourcery.backend import Backend
+from event_sourcery.event_sourcing import AsyncRepository, SnapshotPolicy
+from event_sourcery.exceptions import ConcurrentStreamWriteError
+from tests.conftest import Run
+
+from .light_switch import LightSwitch
+
+
+@pytest.fixture()
+def async_repo(backend: Backend) -> AsyncRepository[LightSwitch]:
+    return AsyncRepository[LightSwitch](backend.async_event_store)
+
+
+def test_changes_are_preserved_by_async_repository(
+    async_repo: AsyncRepository[LightSwitch],
+    run: Run,
+) -> None:
+    uuid = StreamUUID(uuid4())
+
+    async def turn_on_and_load() -> LightSwitch:
+        async with async_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            wrapped.aggregate.turn_on()
+        async with async_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            return wrapped.aggregate
+
+    switch = run(turn_on_and_load())
+
+    assert switch.shines
+
+
+def test_async_repository_supports_optimistic_locking(
+    async_repo: AsyncRepository[LightSwitch],
+    run: Run,
+) -> None:
+    uuid = StreamUUID(uuid4())
+
+    async def turn_off_concurrently() -> None:
+        async with async_repo.aggregate(uuid, LightSwitch()) as first:
+            first.aggregate.turn_on()
+
+        async with async_repo.aggregate(uuid, LightSwitch()) as second:
+            async with async_repo.aggregate(uuid, LightSwitch()) as third:
+                second.aggregate.turn_off()
+                third.aggregate.turn_off()
+
+    with pytest.raises(ConcurrentStreamWriteError):
+        run(turn_off_concurrently())
+
+
+def test_async_repository_reuses_cached_aggregate(backend: Backend, run: Run) -> None:
+    cached_repo = AsyncRepository[LightSwitch](backend.async_event_store, cache_size=1)
+    uuid = StreamUUID(uuid4())
+
+    async def turn_on(switch: LightSwitch) -> None:
+        async with cached_repo.aggregate(uuid, switch) as wrapped:
+            wrapped.aggregate.turn_on()
+
+    async def load() -> LightSwitch:
+        async with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            return wrapped.aggregate
+
+    run(turn_on(switch := LightSwitch()))
+
+    assert run(load()) is switch
+
+
+def test_async_repository_restores_aggregate_from_snapshot(
+    backend: Backend,
+    run: Run,
+) -> None:
+    snapshotting_repo = AsyncRepository[LightSwitch](
+        backend.async_event_store,
+        snapshot_policy=SnapshotPolicy(every=1),
+    )
+    uuid = StreamUUID(uuid4())
+
+    async def turn_on_and_load() -> tuple[bool, int | None]:
+        async with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            wrapped.aggregate.turn_on()
+        async with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            return wrapped.aggregate.shines, wrapped.snapshot_version
+
+    assert run(turn_on_and_load()) == (True, 1)
@@ -0,0 +1,130 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from event_sourcery import EventStore, StreamId, StreamUUID
+from event_sourcery.event_sourcing import Repository
+from event_sourcery.exceptions import ConcurrentStreamWriteError
+from event_sourcery_sqlalchemy import SQLAlchemyBackend
+from tests.backend.sqlalchemy import sqlalchemy_sqlite_session
+
+from .light_switch import LightSwitch
+
+
+@pytest.fixture()
+def cached_repo(event_store: EventStore) -> Repository[LightSwitch]:
+    return Repository[LightSwitch](event_store, cache_size=1)
+
+
+def test_reuses_cached_aggregate(cached_repo: Repository[LightSwitch]) -> None:
+    uuid = StreamUUID(uuid4())
+    with cached_repo.aggregate(uuid, switch := LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        assert wrapped.aggregate is switch
+        assert wrapped.version == 1
+        wrapped.aggregate.turn_off()
+
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        assert wrapped.aggregate is switch
+        assert not wrapped.aggregate.shines
+        assert wrapped.version == 2
+
+
+def test_catches_up_cached_aggregate_with_newer_events(
+    cached_repo: Repository[LightSwitch],
+    repo: Repository[LightSwitch],
+) -> None:
+    uuid = StreamUUID(uuid4())
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+    with repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_off()
+
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        assert not wrapped.aggregate.shines
+        assert wrapped.version == 2
+
+
+def test_replays_stream_after_failed_command(
+    cached_repo: Repository[LightSwitch],
+) -> None:
+    uuid = StreamUUID(uuid4())
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+
+    with pytest.raises(LightSwitch.AlreadyTurnedOff):
+        with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            wrapped.aggregate.turn_off()
+            wrapped.aggregate.turn_off()
+
+    with cached_repo.aggregate(uuid, replayed := LightSwitch()) as wrapped:
+        assert wrapped.aggregate is replayed
+        assert wrapped.aggregate.shines
+        assert wrapped.version == 1
+
+
+def test_caches_only_aggregate_saved_without_conflict(
+    cached_repo: Repository[LightSwitch],
+) -> None:
+    uuid = StreamUUID(uuid4())
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+
+    with pytest.raises(ConcurrentStreamWriteError):
+        with cached_repo.aggregate(uuid, LightSwitch()) as second:
+            with cached_repo.aggregate(uuid, LightSwitch()) as third:
+                second.aggregate.turn_off()
+                third.aggregate.turn_off()
+
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        assert wrapped.aggregate is third.aggregate
+        assert wrapped.version == 2
+
+
+def test_evicts_least_recently_used_aggregate(
+    cached_repo: Repository[LightSwitch],
+) -> None:
+    first_uuid, second_uuid = StreamUUID(uuid4()), StreamUUID(uuid4())
+    with cached_repo.aggregate(first_uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+    with cached_repo.aggregate(second_uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+
+    with cached_repo.aggregate(first_uuid, reloaded := LightSwitch()) as wrapped:
+        assert wrapped.aggregate is reloaded
+        assert wrapped.aggregate.shines
+
+
+def test_replays_stream_after_rolled_back_save(tmp_path: Path) -> None:
+    with sqlalchemy_sqlite_session(tmp_path) as session:
+        event_store = SQLAlchemyBackend().configure(session).event_store
+        cached_repo = Repository[LightSwitch](event_store, cache_size=1)
+        uuid = StreamUUID(uuid4())
+        with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+            wrapped.aggregate.turn_on()
+        session.rollback()
+
+        with cached_repo.aggregate(uuid, replayed := LightSwitch()) as wrapped:
+            assert wrapped.aggregate is replayed
+            assert not wrapped.aggregate.shines
+            assert wrapped.version == 0
+
+
+def test_replays_stream_rewritten_behind_cache(
+    cached_repo: Repository[LightSwitch],
+    repo: Repository[LightSwitch],
+    event_store: EventStore,
+) -> None:
+    uuid = StreamUUID(uuid4())
+    with cached_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+    event_store.delete_stream(StreamId(uuid=uuid, category=LightSwitch.category))
+    with repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+
+    with cached_repo.aggregate(uuid, replayed := LightSwitch()) as wrapped:
+        assert wrapped.aggregate is replayed
+        assert wrapped.version == 1
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from event_sourcery import EventStore, StreamId, StreamUUID
+from event_sourcery.event_sourcing import Repository, SnapshotPolicy
+
+from .light_switch import LightSwitch, LightSwitchSnapshot
+
+
+@pytest.fixture()
+def snapshotting_repo(event_store: EventStore) -> Repository[LightSwitch]:
+    return Repository[LightSwitch](event_store, snapshot_policy=SnapshotPolicy(every=2))
+
+
+def test_saves_snapshot_every_given_number_of_events(
+    snapshotting_repo: Repository[LightSwitch],
+    event_store: EventStore,
+) -> None:
+    uuid = StreamUUID(uuid4())
+    stream_id = StreamId(uuid, category=LightSwitch.category)
+    with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+    first_info = event_store.stream_info(stream_id)
+
+    with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_off()
+    second_info = event_store.stream_info(stream_id)
+
+    assert first_info is not None and first_info.snapshot_version is None
+    assert second_info is not None and second_info.snapshot_version == 2
+    assert [e.event for e in event_store.load_stream(stream_id)] == [
+        LightSwitchSnapshot(shines=False)
+    ]
+
+
+def test_restores_aggregate_from_snapshot(
+    snapshotting_repo: Repository[LightSwitch],
+) -> None:
+    uuid = StreamUUID(uuid4())
+    with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+        wrapped.aggregate.turn_off()
+    with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+
+    with snapshotting_repo.aggregate(uuid, LightSwitch()) as wrapped:
+        assert wrapped.aggregate.shines
+        assert wrapped.snapshot_version == 2
+        assert wrapped.version == 3
+
+
+def test_does_not_snapshot_without_policy(
+    repo: Repository[LightSwitch],
+    event_store: EventStore,
+) -> None:
+    uuid = StreamUUID(uuid4())
+    with repo.aggregate(uuid, LightSwitch()) as wrapped:
+        wrapped.aggregate.turn_on()
+        wrapped.aggregate.turn_off()
+
+    info = event_store.stream_info(StreamId(uuid, category=LightSwitch.category))
+
+    assert info is not None and info.snapshot_version is None
+
+
+@pytest.mark.parametrize(
+    ("policy", "events_since_snapshot", "replay_time", "expected"),
+    [
+        (SnapshotPolicy(every=3), 2, timedelta(seconds=1), False),
+        (SnapshotPolicy(every=3), 3, timedelta(0), True),
+        (
+            SnapshotPolicy(replay_time_budget=timedelta(seconds=1)),
+            1,
+            timedelta(0),
+            False,
+        ),
+        (
+            SnapshotPolicy(replay_time_budget=timedelta(0)),
+            1,
+            timedelta(seconds=1),
+            True,
+        ),
+        (
+            SnapshotPolicy(replay_time_budget=timedelta(0)),
+            0,
+            timedelta(seconds=1),
+            False,
+        ),
+        (SnapshotPolicy(), 100, timedelta(seconds=1), False),
+    ],
+)
+def test_snapshot_policy_is_due(
+    policy: SnapshotPolicy,
+    events_since_snapshot: int,
+    replay_time: timedelta,
+    expected: bool,
+) -> None:
+    assert policy.is_due(events_since_snapshot, replay_time) is expected
@@ -2,13 +2,16 @@ from typing import cast
 
 import pytest
 
+from event_sourcery import AsyncEventStore
 from event_sourcery.backend import Backend
 from tests import mark
 from tests.backend.django import django_backend
 from tests.backend.in_memory import in_memory_backend
-from tests.backend.kurrentdb import kurrentdb_backend
+from tests.backend.kurrentdb import kurrentdb_async_backend, kurrentdb_backend
 from tests.backend.sqlalchemy import (
+    sqlalchemy_postgres_async_backend,
     sqlalchemy_postgres_backend,
+    sqlalchemy_sqlite_async_backend,
     sqlalchemy_sqlite_backend,
 )
 
@@ -19,6 +22,12 @@ _BACKEND_FIXTURES = [
     sqlalchemy_sqlite_backend,
     sqlalchemy_postgres_backend,
 ]
+_ASYNC_BACKEND_FIXTURES = [
+    kurrentdb_async_backend,
+    in_memory_backend,
+    sqlalchemy_sqlite_async_backend,
+    sqlalchemy_postgres_async_backend,
+]
 
 
 @pytest.fixture(scope="session")
@@ -26,7 +35,10 @@ def selected_backends(request: pytest.FixtureRequest) -> list[str]:
     backends: str | None = request.config.getoption("--backends")
     if backends:
         return backends.split(",")
-    return [f.__name__.rsplit("_backend", 1)[0] for f in _BACKEND_FIXTURES]
+    return [
+        f.__name__.rsplit("_backend", 1)[0]
+        for f in [*_BACKEND_FIXTURES, *_ASYNC_BACKEND_FIXTURES]
+    ]
 
 
 def skip_if_not_selected_backend(
@@ -56,3 +68,19 @@ def backend(request: pytest.FixtureRequest, selected_backends: list[str]) -> Bac
     mark.xfail_if_not_implemented_yet(request, fixture_name)
     mark.skip_backend(request, fixture_name)
     return cast(Backend, request.getfixturevalue(fixture_name))
+
+
+@pytest.fixture(params=_ASYNC_BACKEND_FIXTURES)
+def async_backend(
+    request: pytest.FixtureRequest,
+    selected_backends: list[str],
+) -> Backend:
+    fixture_name = request.param.__name__
+    skip_if_not_selected_backend(fixture_name, request)
+    mark.skip_backend(request, fixture_name)
+    return cast(Backend, request.getfixturevalue(fixture_name))
+
+
+@pytest.fixture()
+def async_event_store(async_backend: Backend) -> AsyncEventStore:
+    return async_backend.async_event_store
@@ -0,0 +1,137 @@
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import pytest
+
+from event_sourcery import StreamId
+from event_sourcery.backend import Backend, InMemoryKeyStorage
+from event_sourcery.encryption import AesGcmEncryptionStrategy
+from tests.bdd import Given, Then, When
+from tests.event_store.event.test_privacy import EncryptedEvent
+
+crypto_exceptions = pytest.importorskip("cryptography.exceptions")
+
+T = TypeVar("T")
+
+PRIMARY_KEY = b"p" * 32
+SECONDARY_KEY = b"s" * 16
+
+
+class CountingThreadPool(ThreadPoolExecutor):
+    batches = 0
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        self.batches += 1
+        return super().map(fn, *iterables, **kwargs)
+
+
+@pytest.fixture()
+def strategy() -> AesGcmEncryptionStrategy:
+    return AesGcmEncryptionStrategy()
+
+
+@pytest.fixture()
+def backend(backend: Backend, strategy: AesGcmEncryptionStrategy) -> Backend:
+    return backend.with_encryption(strategy, InMemoryKeyStorage())
+
+
+def test_encrypt_and_decrypt(given: Given, when: When, then: Then) -> None:
+    given.encryption.store(PRIMARY_KEY, for_subject="subject")
+    given.encryption.store(SECONDARY_KEY, for_subject="secondary")
+    given.stream(stream_id := StreamId())
+    when.appends(event := EncryptedEvent(encrypted_text="1234"), to=stream_id)
+    then.stream(stream_id).loads([event])
+
+
+def test_withdrawn_encrypted_data_when_key_shred(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.encryption.store(PRIMARY_KEY, for_subject="subject")
+    given.encryption.store(SECONDARY_KEY, for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(EncryptedEvent())
+
+    when.encryption.shred_key(for_subject="secondary")
+
+    then.stream(stream_id).loads([EncryptedEvent(custom_subject="[TEXT_REDACTED]")])
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["text", "null", "", 12, 1.5, True, None, [1, "2"], {"a": {"b": 1}}],
+)
+def test_decrypts_values_with_their_types(
+    strategy: AesGcmEncryptionStrategy,
+    value: Any,
+) -> None:
+    encrypted = strategy.encrypt(value, PRIMARY_KEY)
+
+    assert strategy.decrypt(encrypted, PRIMARY_KEY) == value
+    assert type(strategy.decrypt(encrypted, PRIMARY_KEY)) is type(value)
+
+
+def test_encrypts_same_value_differently(strategy: AesGcmEncryptionStrategy) -> None:
+    assert strategy.encrypt("text", PRIMARY_KEY) != strategy.encrypt(
+        "text", PRIMARY_KEY
+    )
+
+
+def test_fails_to_decrypt_with_other_key(strategy: AesGcmEncryptionStrategy) -> None:
+    encrypted = strategy.encrypt("text", PRIMARY_KEY)
+
+    with pytest.raises(crypto_exceptions.InvalidTag):
+        strategy.decrypt(encrypted, SECONDARY_KEY)
+
+
+def test_generates_256_bit_keys(strategy: AesGcmEncryptionStrategy) -> None:
+    key = strategy.generate_key()
+
+    assert len(key) == 32
+    assert strategy.decrypt(strategy.encrypt("text", key), key) == "text"
+
+
+def test_processes_big_batches_in_executor() -> None:
+    values = ["text", 1, [2]]
+    with CountingThreadPool(max_workers=2) as executor:
+        strategy = AesGcmEncryptionStrategy(executor=executor, min_batch_size=3)
+
+        encrypted = strategy.encrypt_many(values, PRIMARY_KEY)
+        small_batch = strategy.decrypt_many(encrypted[:2], PRIMARY_KEY)
+        decrypted = strategy.decrypt_many(encrypted, PRIMARY_KEY)
+
+    assert decrypted == values
+    assert small_batch == values[:2]
+    assert executor.batches == 2
+
+
+class CountingAesGcmEncryptionStrategy(AesGcmEncryptionStrategy):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    def decrypt_many(self, data: Sequence[str], key: bytes) -> list[Any]:
+        self.batches.append(len(data))
+        return super().decrypt_many(data, key)
+
+
+def test_decrypts_fields_of_subject_at_once(
+    backend: Backend,
+    given: Given,
+    then: Then,
+) -> None:
+    strategy = CountingAesGcmEncryptionStrategy()
+    backend.with_encryption(strategy, InMemoryKeyStorage())
+    given.encryption.store(PRIMARY_KEY, for_subject="subject")
+    given.encryption.store(SECONDARY_KEY, for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(event := EncryptedEvent())
+
+    then.stream(stream_id).loads([event])
+
+    assert sorted(strategy.batches) == [1, 18]
@@ -0,0 +1,46 @@
+from collections.abc import Callable
+
+import pytest
+
+from event_sourcery import Backend, EventStore, StreamId
+from event_sourcery.event import JsonCodec, MsgpackCodec, OrjsonCodec, PayloadCodec
+from tests.factories import AnEvent
+
+
+def msgpack_codec() -> PayloadCodec:
+    pytest.importorskip("msgpack")
+    return MsgpackCodec()
+
+
+def orjson_codec() -> PayloadCodec:
+    pytest.importorskip("orjson")
+    return OrjsonCodec()
+
+
+@pytest.fixture(params=[JsonCodec, orjson_codec, msgpack_codec])
+def codec(request: pytest.FixtureRequest) -> PayloadCodec:
+    factory: Callable[[], PayloadCodec] = request.param
+    return factory()
+
+
+def test_decodes_encoded_payload(codec: PayloadCodec) -> None:
+    payload = {"text": "zażółć", "number": 1, "ratio": 0.5, "list": [None, True]}
+
+    assert codec.decode(codec.encode(payload)) == payload
+
+
+def test_appends_and_loads_events_with_codec(
+    backend: Backend,
+    codec: PayloadCodec,
+) -> None:
+    backend[PayloadCodec] = codec
+    event_store = backend[EventStore]
+    event_store.append(
+        first := AnEvent(),
+        second := AnEvent(),
+        stream_id=(stream_id := StreamId()),
+    )
+
+    loaded = event_store.load_stream(stream_id)
+
+    assert [e.event for e in loaded] == [first, second]
@@ -0,0 +1,57 @@
+from uuid import uuid4
+
+from event_sourcery import Backend, StreamId
+from event_sourcery.event import Context
+from tests.bdd import Given
+from tests.factories import an_event
+
+
+def test_shares_equal_contexts_of_loaded_events_until_modified(
+    backend: Backend,
+    given: Given,
+) -> None:
+    context = Context(correlation_id=uuid4())
+    events = [an_event(version=i, context=context) for i in range(1, 4)]
+    given.events(*events, on=(stream_id := StreamId()))
+
+    first, second, third = backend.event_store.load_stream(stream_id)
+    first.context.causation_id = (causation_id := uuid4())
+    second.context.user = "user"
+
+    assert first.context == Context(
+        correlation_id=context.correlation_id,
+        causation_id=causation_id,
+    )
+    assert second.context.model_dump() == {**context.model_dump(), "user": "user"}
+    assert third.context == context
+    assert third.context.__dict__ is not first.context.__dict__
+    assert backend.event_store.load_stream(stream_id)[0].context == context
+
+
+def test_doesnt_share_contexts_differing_in_value_types(
+    backend: Backend,
+    given: Given,
+) -> None:
+    events = [
+        an_event(version=1, context=Context(flag=True)),  # type: ignore[call-arg]
+        an_event(version=2, context=Context(flag=1)),  # type: ignore[call-arg]
+        an_event(version=3, context=Context(flag=[1])),  # type: ignore[call-arg]
+    ]
+    given.events(*events, on=(stream_id := StreamId()))
+
+    loaded = backend.event_store.load_stream(stream_id)
+
+    assert [e.context.model_dump()["flag"] for e in loaded] == [True, 1, [1]]
+    assert type(loaded[0].context.model_dump()["flag"]) is bool
+
+
+def test_copies_modified_shared_context() -> None:
+    context = Context(correlation_id=uuid4())
+    shared = context._share()
+
+    shared.correlation_id = None
+    copied = shared.model_copy(update={"causation_id": (causation_id := uuid4())})
+
+    assert context.correlation_id is not None
+    assert context.model_fields_set == {"correlation_id"}
+    assert copied == Context(causation_id=causation_id)
@@ -1,7 +1,13 @@
+import json
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
 import pytest
 from pydantic import TypeAdapter, ValidationError
 
-from event_sourcery.event import Context, Event, WrappedEvent
+from event_sourcery import StreamId
+from event_sourcery.event import Context, Event, RawEvent, WrappedEvent
 
 
 def test_wrapped_event_doesnt_accept_extra_fields() -> None:
@@ -28,3 +34,37 @@ def test_extra_data_can_be_passed_to_wrapped_event_context() -> None:
         "causation_id": None,
         "extra": {"age": 2**5},
     }
+
+
+def raw_fields() -> dict[str, Any]:
+    return {
+        "uuid": uuid4(),
+        "stream_id": StreamId(),
+        "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "name": "AnEvent",
+        "context": {},
+        "version": 1,
+    }
+
+
+def test_undecoded_raw_event_decodes_data_once_on_first_access() -> None:
+    decoded = []
+
+    def decode(payload: bytes) -> dict[str, Any]:
+        decoded.append(payload)
+        return dict(json.loads(payload))
+
+    fields = raw_fields()
+    raw = RawEvent.undecoded(**fields, payload=b'{"number": 1}', decode=decode)
+
+    assert decoded == []
+    assert raw.data == {"number": 1}
+    assert raw == RawEvent.trusted(**fields, data={"number": 1})
+    assert raw.payload == b'{"number": 1}'
+    assert decoded == [b'{"number": 1}']
+
+
+def test_decoded_raw_event_has_no_payload() -> None:
+    raw = RawEvent(**raw_fields(), data={"number": 1})
+
+    assert raw.payload is None
@@ -0,0 +1,72 @@
+import pytest
+
+from event_sourcery import StreamId
+from event_sourcery.backend import Backend
+from tests.bdd import Given, Then, When
+from tests.event_store.event.test_key_caching import CountingKeyStorage
+from tests.event_store.event.test_privacy import EncryptedEvent, XorEncryptionStrategy
+from tests.factories import an_event
+
+
+@pytest.fixture()
+def key_storage() -> CountingKeyStorage:
+    return CountingKeyStorage()
+
+
+@pytest.fixture()
+def backend(backend: Backend, key_storage: CountingKeyStorage) -> Backend:
+    return backend.with_encryption(XorEncryptionStrategy(), key_storage)
+
+
+def test_fetches_keys_of_loaded_events_at_once(
+    given: Given,
+    then: Then,
+    key_storage: CountingKeyStorage,
+) -> None:
+    given.encryption.store(b"first-key", for_subject="first")
+    given.encryption.store(b"second-key", for_subject="second")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(
+        *(
+            events := [
+                EncryptedEvent(subject_id="first"),
+                an_event().event,
+                EncryptedEvent(subject_id="second"),
+                EncryptedEvent(subject_id="first", plain="again"),
+            ]
+        )
+    )
+    key_storage.lookups.clear()
+
+    then.stream(stream_id).loads(events)
+
+    assert key_storage.batches == [{"first", "second", "secondary"}]
+    assert key_storage.lookups == []
+
+
+def test_masks_data_of_subjects_missing_in_fetched_keys(
+    given: Given,
+    when: When,
+    then: Then,
+    key_storage: CountingKeyStorage,
+) -> None:
+    given.encryption.store(b"primary-key", for_subject="subject")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(EncryptedEvent())
+
+    when.encryption.shred_key(for_subject="secondary")
+
+    then.stream(stream_id).loads([EncryptedEvent(custom_subject="[TEXT_REDACTED]")])
+    assert key_storage.batches == [{"subject", "secondary"}]
+
+
+def test_doesnt_fetch_keys_for_events_without_encrypted_fields(
+    given: Given,
+    then: Then,
+    key_storage: CountingKeyStorage,
+) -> None:
+    given.stream(stream_id := StreamId()).with_events(event := an_event().event)
+
+    then.stream(stream_id).loads([event])
+
+    assert key_storage.batches == []
@@ -0,0 +1,158 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+import pytest
+
+from event_sourcery import StreamId, TenantId
+from event_sourcery.backend import Backend, InMemoryKeyStorage
+from event_sourcery.encryption import CachingKeyStorageStrategy
+from tests.bdd import Given, Then, When
+from tests.event_store.event.test_privacy import EncryptedEvent, XorEncryptionStrategy
+
+
+@dataclass
+class CountingKeyStorage(InMemoryKeyStorage):
+    lookups: list[str] = field(default_factory=list)
+    batches: list[set[str]] = field(default_factory=list)
+
+    def get(self, subject_id: str) -> bytes | None:
+        self.lookups.append(subject_id)
+        return super().get(subject_id)
+
+    def get_many(self, subject_ids: Iterable[str]) -> dict[str, bytes]:
+        self.batches.append(batch := set(subject_ids))
+        keys = {}
+        for subject_id in batch:
+            if (key := super().get(subject_id)) is not None:
+                keys[subject_id] = key
+        return keys
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> "CountingKeyStorage":
+        return CountingKeyStorage(self._keys, tenant_id, self.lookups, self.batches)
+
+
+@pytest.fixture()
+def key_storage() -> CountingKeyStorage:
+    return CountingKeyStorage()
+
+
+@pytest.fixture()
+def caching(key_storage: CountingKeyStorage) -> CachingKeyStorageStrategy:
+    return CachingKeyStorageStrategy(key_storage)
+
+
+@pytest.fixture()
+def backend(backend: Backend, caching: CachingKeyStorageStrategy) -> Backend:
+    return backend.with_encryption(XorEncryptionStrategy(), caching)
+
+
+def test_looks_up_key_of_subject_once(
+    given: Given,
+    then: Then,
+    key_storage: CountingKeyStorage,
+) -> None:
+    given.encryption.store(b"primary-key", for_subject="subject")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(
+        *(events := [EncryptedEvent(plain=str(i)) for i in range(3)])
+    )
+
+    then.stream(stream_id).loads(events)
+    then.stream(stream_id).loads(events)
+    assert key_storage.lookups == []
+
+
+def test_caches_missing_key_of_shredded_subject(
+    given: Given,
+    when: When,
+    then: Then,
+    key_storage: CountingKeyStorage,
+) -> None:
+    given.encryption.store(b"primary-key", for_subject="subject")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(EncryptedEvent())
+
+    when.encryption.shred_key(for_subject="secondary")
+
+    then.stream(stream_id).loads([EncryptedEvent(custom_subject="[TEXT_REDACTED]")])
+    assert key_storage.get("secondary") is None
+    assert key_storage.lookups == ["secondary"]
+
+
+def test_looks_up_missing_key_once(
+    caching: CachingKeyStorageStrategy,
+    key_storage: CountingKeyStorage,
+) -> None:
+    assert caching.get("subject") is None
+    assert caching.get("subject") is None
+    assert key_storage.lookups == ["subject"]
+
+
+def test_looks_up_key_again_once_expired(key_storage: CountingKeyStorage) -> None:
+    caching = CachingKeyStorageStrategy(key_storage, ttl=timedelta(0))
+    key_storage.store("subject", b"key")
+
+    assert caching.get("subject") == b"key"
+    assert caching.get("subject") == b"key"
+    assert key_storage.lookups == ["subject", "subject"]
+
+
+def test_evicts_least_recently_used_keys(key_storage: CountingKeyStorage) -> None:
+    caching = CachingKeyStorageStrategy(key_storage, max_size=2)
+    caching.store("first", b"first")
+    caching.store("second", b"second")
+
+    caching.get("first")
+    caching.store("third", b"third")
+
+    assert caching.get("first") == b"first"
+    assert caching.get("third") == b"third"
+    assert caching.get("second") == b"second"
+    assert key_storage.lookups == ["second"]
+
+
+def test_caches_keys_per_tenant(
+    caching: CachingKeyStorageStrategy,
+    key_storage: CountingKeyStorage,
+) -> None:
+    first = caching.scoped_for_tenant("first")
+    second = caching.scoped_for_tenant("second")
+    first.store("subject", b"first")
+    second.store("subject", b"second")
+
+    second.delete("subject")
+
+    assert first.get("subject") == b"first"
+    assert second.get("subject") is None
+    assert caching.scoped_for_tenant("first").get("subject") == b"first"
+    assert key_storage.lookups == []
+
+
+def test_fetches_only_missing_keys_at_once(
+    caching: CachingKeyStorageStrategy,
+    key_storage: CountingKeyStorage,
+) -> None:
+    key_storage.store("stored", b"stored")
+    caching.store("cached", b"cached")
+
+    keys = caching.get_many(["cached", "stored", "missing"])
+
+    assert keys == {"cached": b"cached", "stored": b"stored"}
+    assert key_storage.batches == [{"stored", "missing"}]
+    assert caching.get_many(["stored", "missing"]) == {"stored": b"stored"}
+    assert key_storage.batches == [{"stored", "missing"}]
+
+
+def test_caches_missing_keys_of_subjects_deleted_at_once(
+    caching: CachingKeyStorageStrategy,
+    key_storage: CountingKeyStorage,
+) -> None:
+    caching.store("first", b"first")
+    caching.store("second", b"second")
+
+    caching.delete_many(["first", "second"])
+
+    assert caching.get_many(["first", "second"]) == {}
+    assert key_storage.get_many(["first", "second"]) == {}
+    assert key_storage.batches == [{"first", "second"}]
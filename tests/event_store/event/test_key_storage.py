@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from event_sourcery import StreamId
+from event_sourcery.backend import Backend, InMemoryBackend, InMemoryKeyStorage
+from event_sourcery.encryption import Encryption
+from event_sourcery.interfaces import EncryptionKeyStorageStrategy
+from event_sourcery_django import DjangoBackend
+from event_sourcery_sqlalchemy import SQLAlchemyBackend, SqlAlchemyKeyStorage
+from tests.bdd import Given, Then, When
+from tests.event_store.event.test_privacy import EncryptedEvent, XorEncryptionStrategy
+
+
+@pytest.fixture()
+def key_storage(backend: Backend) -> EncryptionKeyStorageStrategy:
+    match backend:
+        case InMemoryBackend():
+            return InMemoryKeyStorage()
+        case SQLAlchemyBackend():
+            return SqlAlchemyKeyStorage(backend[Session])
+        case DjangoBackend():
+            from event_sourcery_django.key_storage import (  # noqa: PLC0415
+                DjangoKeyStorage,
+            )
+
+            return DjangoKeyStorage()
+    pytest.skip(f"No key storage for {type(backend).__name__}")
+
+
+@pytest.fixture()
+def backend(backend: Backend, key_storage: EncryptionKeyStorageStrategy) -> Backend:
+    return backend.with_encryption(XorEncryptionStrategy(), key_storage)
+
+
+def test_stores_replaces_and_deletes_keys(backend: Backend) -> None:
+    key_storage = backend[Encryption].key_storage
+
+    key_storage.store("subject", b"first")
+    key_storage.store("subject", b"second")
+    stored = key_storage.get("subject")
+    key_storage.delete("subject")
+
+    assert stored == b"second"
+    assert key_storage.get("subject") is None
+
+
+def test_gets_and_deletes_many_keys(backend: Backend) -> None:
+    key_storage = backend[Encryption].key_storage
+    for subject_id in ("first", "second", "third"):
+        key_storage.store(subject_id, subject_id.encode())
+
+    keys = key_storage.get_many(["first", "second", "missing"])
+    key_storage.delete_many(["first", "third", "missing"])
+
+    assert keys == {"first": b"first", "second": b"second"}
+    assert key_storage.get_many(["first", "second", "third"]) == {"second": b"second"}
+
+
+def test_keeps_keys_per_tenant(backend: Backend) -> None:
+    first = backend.in_tenant_mode("first")[Encryption].key_storage
+    second = backend.in_tenant_mode("second")[Encryption].key_storage
+    first.store("subject", b"first")
+    second.store("subject", b"second")
+
+    second.delete_many(["subject"])
+
+    assert first.get("subject") == b"first"
+    assert second.get_many(["subject"]) == {}
+
+
+def test_decrypts_events_with_stored_keys(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.encryption.store(b"primary-key", for_subject="subject")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    given.stream(stream_id := StreamId()).with_events(event := EncryptedEvent())
+    then.stream(stream_id).loads([event])
+
+    when.encryption.shred_key(for_subject="secondary")
+
+    then.stream(stream_id).loads([EncryptedEvent(custom_subject="[TEXT_REDACTED]")])
@@ -0,0 +1,104 @@
+import dataclasses
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from event_sourcery import DEFAULT_TENANT, Backend, Event, StreamId
+from event_sourcery.event import (
+    EventRegistry,
+    LazyWrappedEvent,
+    RawEvent,
+    RecordedRaw,
+    Serde,
+)
+from event_sourcery.in_transaction import Dispatcher, Listeners
+from tests.bdd import InTransactionListener
+
+
+class Numbered(Event):
+    number: int
+
+
+def a_raw(data: dict[str, Any], stream_id: StreamId | None = None) -> RawEvent:
+    return RawEvent(
+        uuid=uuid4(),
+        stream_id=stream_id or StreamId(),
+        created_at=datetime(2025, 1, 1),
+        name=EventRegistry().name_for_type(Numbered),
+        data=data,
+        context={"correlation_id": None},
+        version=1,
+    )
+
+
+def test_decodes_event_on_first_access(backend: Backend) -> None:
+    raw = a_raw({"number": 1})
+
+    lazy = backend[Serde].deserialize_lazy(raw)
+
+    assert isinstance(lazy, LazyWrappedEvent)
+    assert (lazy.name, lazy.version, lazy.uuid) == (raw.name, 1, raw.uuid)
+    assert not lazy.is_decoded
+    assert lazy.event == Numbered(number=1)
+    assert lazy.is_decoded
+    assert lazy == backend[Serde].deserialize(raw)
+
+
+def test_keeps_dataclass_contract_of_wrapped_event(backend: Backend) -> None:
+    raw = a_raw({"number": 1})
+    lazy = backend[Serde].deserialize_lazy(raw)
+    loaded = backend[Serde].deserialize(raw)
+
+    assert "<not decoded>" in repr(lazy)
+    replaced = dataclasses.replace(lazy, version=2)
+
+    assert loaded == lazy
+    assert lazy == loaded
+    assert replaced == dataclasses.replace(loaded, version=2)
+    assert replaced.name == lazy.name
+    assert [f.name for f in dataclasses.fields(lazy)] == [
+        "event",
+        "version",
+        "uuid",
+        "created_at",
+        "context",
+        "name",
+    ]
+    assert repr(loaded.event) in repr(lazy)
+
+
+def test_raises_decoding_error_on_access(backend: Backend) -> None:
+    lazy = backend[Serde].deserialize_lazy(a_raw({"number": "not a number"}))
+
+    with pytest.raises(ValidationError):
+        _ = lazy.event
+
+
+def test_dispatcher_skips_decoding_events_without_listeners(backend: Backend) -> None:
+    listeners = Listeners()
+    listeners.register(listener := InTransactionListener(), to="matching")
+    dispatcher = Dispatcher(backend[Serde], listeners)
+    invalid = {"number": "not a number"}
+
+    dispatcher.dispatch(
+        RecordedRaw(
+            entry=a_raw(invalid, StreamId(category="other")),
+            position=1,
+            tenant_id=DEFAULT_TENANT,
+        ),
+        RecordedRaw(
+            entry=a_raw(invalid, StreamId(category="matching")),
+            position=2,
+            tenant_id=DEFAULT_TENANT,
+        ),
+    )
+
+    record = next(listener)
+    assert record is not None
+    assert record.position == 2
+    assert next(listener) is None
+    with pytest.raises(ValidationError):
+        _ = record.wrapped_event.event
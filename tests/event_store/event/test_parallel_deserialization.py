@@ -0,0 +1,116 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
+
+import pytest
+
+from event_sourcery import Backend, Event, StreamId
+from event_sourcery.backend import InMemoryKeyStorage
+from tests.bdd import Given, Then, When
+from tests.event_store.event.test_privacy import EncryptedEvent, XorEncryptionStrategy
+from tests.factories import an_event
+from tests.matchers import any_record
+
+T = TypeVar("T")
+
+
+class Shipped(Event):
+    reference: UUID
+    shipped_at: datetime
+    parcels: list[int]
+
+
+class CountingProcessPool(ProcessPoolExecutor):
+    chunks = 0
+
+    def map(
+        self,
+        fn: Callable[..., T],
+        *iterables: Iterable[Any],
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        chunks = list(iterables[0])
+        self.chunks += len(chunks)
+        return super().map(fn, chunks, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def process_pool() -> Iterator[CountingProcessPool]:
+    with CountingProcessPool(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.fixture()
+def pool(process_pool: CountingProcessPool) -> CountingProcessPool:
+    process_pool.chunks = 0
+    return process_pool
+
+
+@pytest.fixture()
+def backend(backend: Backend, pool: CountingProcessPool) -> Backend:
+    return backend.with_parallel_deserialization(pool, min_batch_size=3, chunk_size=2)
+
+
+def shipped(version: int | None = None) -> Any:
+    return an_event(
+        Shipped(reference=uuid4(), shipped_at=datetime(2025, 1, 1), parcels=[1, 2]),
+        version=version,
+    )
+
+
+def test_loads_stream_deserialized_in_workers(
+    given: Given,
+    then: Then,
+    pool: CountingProcessPool,
+) -> None:
+    events = [shipped(1), an_event(version=2), shipped(3), shipped(4), shipped(5)]
+    given.events(*events, on=(stream_id := StreamId()))
+
+    then.stream(stream_id).loads_only(events)
+    assert pool.chunks == 3
+
+
+def test_deserializes_small_batches_sequentially(
+    given: Given,
+    then: Then,
+    pool: CountingProcessPool,
+) -> None:
+    events = [shipped(1), shipped(2)]
+    given.events(*events, on=(stream_id := StreamId()))
+
+    then.stream(stream_id).loads_only(events)
+    assert pool.chunks == 0
+
+
+def test_deserializes_subscription_batches_in_workers(
+    given: Given,
+    when: When,
+    then: Then,
+    pool: CountingProcessPool,
+) -> None:
+    subscription = given.batch_subscription(of_size=3)
+    when.stream().receives(first := shipped(), second := shipped(), third := an_event())
+
+    then(subscription).next_batch_is(
+        [any_record(first), any_record(second), any_record(third)]
+    )
+    assert pool.chunks == 2
+
+
+def test_decrypts_events_in_calling_process(
+    backend: Backend,
+    given: Given,
+    then: Then,
+    pool: CountingProcessPool,
+) -> None:
+    backend.with_encryption(XorEncryptionStrategy(), InMemoryKeyStorage())
+    given.encryption.store(b"primary-key", for_subject="subject")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    encrypted = an_event(EncryptedEvent(subject_id="subject"), version=2)
+    events = [shipped(1), encrypted, shipped(3), shipped(4)]
+    given.events(*events, on=(stream_id := StreamId()))
+
+    then.stream(stream_id).loads_only(events)
+    assert pool.chunks == 2
@@ -85,6 +85,19 @@ def test_encrypt_and_decrypt(given: Given, when: When, then: Then) -> None:
     then.stream(stream_id).loads([event])
 
 
+def test_decrypts_same_stored_event_many_times(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.encryption.store(b"primary-key", for_subject="subject")
+    given.encryption.store(b"secondary-key", for_subject="secondary")
+    given.stream(stream_id := StreamId())
+    when.appends(event := EncryptedEvent(subject_id="subject"), to=stream_id)
+    then.stream(stream_id).loads([event])
+    then.stream(stream_id).loads([event])
+
+
 def test_multi_tenant_encrypt_and_decrypt_isolation(
     given: Given,
     when: When,
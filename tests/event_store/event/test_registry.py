@@ -1,10 +1,13 @@
-from typing import ClassVar, cast
+import json
+from typing import Annotated, ClassVar, cast
 from uuid import uuid4
 
 import pytest
 from pydantic import BaseModel
 
 from event_sourcery import Backend, EventStore, StreamId
+from event_sourcery._event_store.event import registry as registry_module
+from event_sourcery.encryption import DataSubject, Encrypted
 from event_sourcery.event import (
     Event,
     EventRegistry,
@@ -13,6 +16,24 @@ from event_sourcery.event import (
 from event_sourcery.exceptions import DuplicatedEvent
 
 
+class Manifested(Event):
+    __event_name__: ClassVar[str] = "Manifested"
+    owner: Annotated[str, DataSubject]
+    secret: Annotated[str, Encrypted(mask_value="")]
+
+
+class TenantAddress(BaseModel):
+    street: Annotated[str, Encrypted(mask_value="", subject_field="tenant")]
+
+
+class ManifestedWithAddress(Event):
+    __event_name__: ClassVar[str] = "ManifestedWithAddress"
+    tenant: str
+    owner: Annotated[str, DataSubject]
+    secret: Annotated[str, Encrypted(mask_value="***")]
+    address: TenantAddress
+
+
 @pytest.fixture()
 def registry() -> EventRegistry:
     return EventRegistry()
@@ -85,3 +106,121 @@ def test_auto_register_new_defined_event_when_accessing_by_name(
 
     assert registry.type_for_name("AnotherCategoryName") == CategoryBaseEvent
     assert registry.type_for_name("SpecificAnotherCategoryEvent") == SpecificEvent
+
+
+def test_loads_event_types_from_manifest(registry: EventRegistry) -> None:
+    manifest = json.loads(json.dumps(registry.manifest()))
+
+    from_manifest = EventRegistry(manifest=manifest)
+
+    assert manifest["Manifested"] == {
+        "type": f"{__name__}:Manifested",
+        "encrypted": ["secret"],
+        "subject": "owner",
+    }
+    assert from_manifest.type_for_name("Manifested") is Manifested
+    assert from_manifest.name_for_type(Manifested) == "Manifested"
+    assert list(from_manifest.encrypted_fields(of=Manifested)) == ["secret"]
+    assert from_manifest.subject_filed("secret", of=Manifested) == "owner"
+
+
+def test_seeds_encryption_plan_from_manifest(
+    registry: EventRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manifest = json.loads(json.dumps(registry.manifest()))
+    expected_plan = registry.encryption_plan(of=ManifestedWithAddress)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("type hints resolved")
+
+    monkeypatch.setattr(registry_module, "get_type_hints", fail)
+    from_manifest = EventRegistry(manifest=manifest)
+    from_manifest.type_for_name("ManifestedWithAddress")
+
+    assert manifest["ManifestedWithAddress"]["encrypted"] == [
+        "secret",
+        "address.street",
+    ]
+    assert from_manifest.encryption_plan(of=ManifestedWithAddress) == expected_plan
+    assert [field.subject for field in expected_plan] == [("owner",), ("tenant",)]
+
+
+def test_imports_event_types_from_manifest_on_first_use() -> None:
+    registry = EventRegistry(
+        manifest={
+            "Missing": {
+                "type": "not_imported.module:Event",
+                "encrypted": [],
+                "subject": None,
+            }
+        }
+    )
+
+    with pytest.raises(ModuleNotFoundError):
+        registry.type_for_name("Missing")
+
+
+def test_doesnt_scan_events_again_for_unknown_name_until_event_defined(
+    registry: EventRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scans = []
+    scan = registry._register_defined_events
+
+    def counting_scan(for_base: type[Event]) -> None:
+        if for_base is Event:
+            scans.append(for_base)
+        scan(for_base)
+
+    monkeypatch.setattr(registry, "_register_defined_events", counting_scan)
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            registry.type_for_name("NotDefinedYet")
+    assert len(scans) == 1
+
+    class NotDefinedYet(Event):
+        __event_name__: ClassVar[str] = "NotDefinedYet"
+
+    assert registry.type_for_name("NotDefinedYet") is NotDefinedYet
+    assert len(scans) == 2
+
+
+class Address(BaseModel):
+    street: Annotated[str, Encrypted(mask_value="")]
+
+
+class Relocated(Event):
+    owner: Annotated[str, DataSubject]
+    previous: Address
+    current: Annotated[Address, Encrypted(mask_value=None, subject_field="mover")]
+    mover: str
+
+
+def test_compiles_encryption_plan_once_per_event_type(
+    registry: EventRegistry,
+) -> None:
+    plan = registry.encryption_plan(of=Relocated)
+
+    assert [
+        (field.name, field.parents, field.key, field.subject) for field in plan
+    ] == [
+        ("previous.street", ("previous",), "street", ("owner",)),
+        ("current", (), "current", ("mover",)),
+    ]
+    assert registry.encryption_plan(of=Relocated) is plan
+
+
+def test_sets_encrypted_fields_without_modifying_nested_data(
+    registry: EventRegistry,
+) -> None:
+    street, current = registry.encryption_plan(of=Relocated)
+    raw = {"previous": {"street": "old"}, "current": "new", "mover": "mover"}
+    data = dict(raw)
+
+    street.set(data, "decrypted")
+
+    assert street.get(data) == "decrypted"
+    assert street.get(raw) == "old"
+    assert current.subject_in(data) == "mover"
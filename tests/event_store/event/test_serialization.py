@@ -0,0 +1,64 @@
+from typing import Any, ClassVar
+
+from pydantic import BaseModel
+
+from event_sourcery import Backend, StreamId
+from event_sourcery.encryption import Encrypted
+from event_sourcery.event import Context, EventRegistry, Serde
+from tests.factories import an_event
+
+
+class CountingContext(Context):
+    dumps: ClassVar[int] = 0
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        CountingContext.dumps += 1
+        return super().model_dump(**kwargs)
+
+
+class CountingRegistry(EventRegistry):
+    compiled = 0
+
+    def encrypted_fields(self, of: type[BaseModel]) -> dict[str, Encrypted]:
+        self.compiled += 1
+        return super().encrypted_fields(of)
+
+
+def test_dumps_context_shared_by_events_once(backend: Backend) -> None:
+    CountingContext.dumps = 0
+    context = CountingContext(extra="value")  # type: ignore[call-arg]
+    events = [an_event(version=i, context=context) for i in range(1, 4)]
+
+    raws = backend[Serde].serialize_many(events, StreamId())
+
+    assert CountingContext.dumps == 1
+    assert [raw.context for raw in raws] == [context.model_dump(mode="json")] * 3
+    assert raws[0].context is not raws[1].context
+
+
+def test_serializes_events_with_distinct_contexts(backend: Backend) -> None:
+    events = [
+        an_event(version=1, context=Context(extra=1)),  # type: ignore[call-arg]
+        an_event(version=2, context=Context(extra=2)),  # type: ignore[call-arg]
+    ]
+
+    raws = backend[Serde].serialize_many(events, StreamId())
+
+    assert [raw.context["extra"] for raw in raws] == [1, 2]
+
+
+def test_shares_plans_and_contexts_between_event_stores(backend: Backend) -> None:
+    backend[EventRegistry] = registry = CountingRegistry()
+    context = Context(extra="value")  # type: ignore[call-arg]
+    backend.event_store.append(
+        an_event(version=1, context=context),
+        stream_id=(stream_id := StreamId()),
+    )
+    backend.event_store.append(an_event(version=1), stream_id=StreamId())
+
+    [first] = backend.event_store.load_stream(stream_id)
+    [second] = backend.event_store.load_stream(stream_id)
+    backend.in_tenant_mode("other").event_store.load_stream(stream_id)
+
+    assert registry.compiled == 2  # serializer and deserializer
+    assert first.context.__dict__ is second.context.__dict__
@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Annotated, ClassVar
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import Field, field_validator
+
+from event_sourcery import Backend, Event, EventStore, StreamId
+from event_sourcery.encryption import DataSubject
+from event_sourcery.event import EventRegistry, RawEvent, Serde
+
+
+class PlainEvent(Event):
+    subject: Annotated[str, DataSubject]
+    number: int
+    ratio: float | None = None
+    tags: list[str] = Field(default_factory=list)
+    extra: dict[str, int | str] = Field(default_factory=dict)
+
+
+class EventWithUUID(Event):
+    reference: UUID
+
+
+class EventWithValidator(Event):
+    number: int
+
+    @field_validator("number")
+    @classmethod
+    def positive(cls, value: int) -> int:
+        return abs(value)
+
+
+class OptedInEvent(Event):
+    __trusted_read__: ClassVar[bool] = True
+    reference: UUID
+
+
+class OptedOutEvent(Event):
+    __trusted_read__: ClassVar[bool] = False
+    number: int
+
+
+@pytest.fixture()
+def trusted_registry() -> EventRegistry:
+    return EventRegistry(trusted_reads=True)
+
+
+def test_trusts_only_events_with_json_native_fields(
+    trusted_registry: EventRegistry,
+) -> None:
+    assert trusted_registry.is_trusted(PlainEvent)
+    assert not trusted_registry.is_trusted(EventWithUUID)
+    assert not trusted_registry.is_trusted(EventWithValidator)
+    assert not trusted_registry.is_trusted(OptedOutEvent)
+
+
+def test_trusts_only_opted_in_events_by_default() -> None:
+    registry = EventRegistry()
+
+    assert registry.is_trusted(OptedInEvent)
+    assert not registry.is_trusted(PlainEvent)
+
+
+def test_loads_same_events_with_trusted_reads(
+    backend: Backend,
+    trusted_registry: EventRegistry,
+) -> None:
+    backend[EventRegistry] = trusted_registry
+    event_store = backend[EventStore]
+    events = [
+        PlainEvent(subject="s", number=1, ratio=0.5, tags=["a"], extra={"b": 2}),
+        EventWithUUID(reference=uuid4()),
+    ]
+    event_store.append(*events, stream_id=(stream_id := StreamId()))
+
+    loaded = event_store.load_stream(stream_id)
+
+    assert [e.event for e in loaded] == events
+
+
+def test_fills_defaults_of_fields_missing_in_stored_data(
+    backend: Backend,
+    trusted_registry: EventRegistry,
+) -> None:
+    backend[EventRegistry] = trusted_registry
+    raw = RawEvent(
+        uuid=uuid4(),
+        stream_id=StreamId(),
+        created_at=datetime(2025, 1, 1),
+        name=trusted_registry.name_for_type(PlainEvent),
+        data={"subject": "s", "number": 1},
+        context={},
+        version=1,
+    )
+
+    wrapped = backend[Serde].deserialize(raw)
+
+    assert wrapped.event == PlainEvent(subject="s", number=1)
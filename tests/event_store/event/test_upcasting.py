@@ -0,0 +1,171 @@
+from datetime import datetime
+from typing import Annotated, Any, ClassVar
+from uuid import uuid4
+
+import pytest
+
+from event_sourcery import Backend, Event, EventStore, StreamId
+from event_sourcery._event_store.versioning import ExplicitVersioning
+from event_sourcery.backend import InMemoryKeyStorage
+from event_sourcery.encryption import DataSubject, Encrypted
+from event_sourcery.event import RawEvent, Serde, Upcaster, Upcasters
+from event_sourcery.exceptions import DuplicatedUpcaster, MissingUpcaster
+from event_sourcery.interfaces import StorageStrategy
+from tests.bdd import Given
+from tests.event_store.event.test_privacy import XorEncryptionStrategy
+from tests.factories import an_event
+
+
+class Renamed(Event):
+    __schema_version__: ClassVar[int] = 3
+    full_name: str
+    currency: str
+
+
+def split_name(data: dict[str, Any]) -> dict[str, Any]:
+    return {"full_name": data["name"]}
+
+
+def add_currency(data: dict[str, Any]) -> dict[str, Any]:
+    return {**data, "currency": "EUR"}
+
+
+class Registered(Event):
+    __schema_version__: ClassVar[int] = 2
+    user_id: Annotated[str, DataSubject]
+    email: Annotated[str, Encrypted(mask_value="")]
+
+
+def rename_owner_and_contact(data: dict[str, Any]) -> dict[str, Any]:
+    return {"user_id": data["owner"], "email": data["contact"]}
+
+
+class CountingUpcasters(Upcasters):
+    chains = 0
+
+    def chain(self, name: str, from_version: int, to_version: int) -> Upcaster:
+        self.chains += 1
+        return super().chain(name, from_version, to_version)
+
+
+def stored(
+    backend: Backend,
+    data: dict[str, Any],
+    context: dict[str, Any],
+    of: type[Event] = Renamed,
+    count: int = 1,
+) -> StreamId:
+    stream_id = StreamId()
+    backend[StorageStrategy].insert_events(
+        stream_id,
+        ExplicitVersioning(expected_version=0, initial_version=count),
+        [
+            RawEvent(
+                uuid=uuid4(),
+                stream_id=stream_id,
+                created_at=datetime(2025, 1, 1),
+                name=backend[Serde].registry.name_for_type(of),
+                data=data,
+                context=context,
+                version=version,
+            )
+            for version in range(1, count + 1)
+        ],
+    )
+    return stream_id
+
+
+def test_upcasts_events_stored_with_older_schema(
+    backend: Backend,
+    event_store: EventStore,
+) -> None:
+    backend[Upcasters].add(Renamed, from_version=1, upcaster=split_name)
+    backend[Upcasters].add(Renamed, from_version=2, upcaster=add_currency)
+    stream_id = stored(backend, {"name": "John"}, {})
+
+    [loaded] = event_store.load_stream(stream_id)
+
+    assert loaded.event == Renamed(full_name="John", currency="EUR")
+
+
+def test_upcasts_from_stored_schema_version(
+    backend: Backend,
+    event_store: EventStore,
+) -> None:
+    backend[Upcasters].register(Renamed, from_version=2)(add_currency)
+    stream_id = stored(backend, {"full_name": "John"}, {"__schema_version__": 2})
+
+    [loaded] = event_store.load_stream(stream_id)
+
+    assert loaded.event == Renamed(full_name="John", currency="EUR")
+    assert "__schema_version__" not in loaded.context.model_dump()
+
+
+def test_stores_current_schema_version(event_store: EventStore) -> None:
+    event = an_event(Renamed(full_name="John", currency="PLN"), version=1)
+    event_store.append(event, stream_id=(stream_id := StreamId()))
+
+    assert event_store.load_stream(stream_id) == [event]
+
+
+def test_fails_loading_without_upcaster_for_stored_version(
+    backend: Backend,
+    event_store: EventStore,
+) -> None:
+    backend[Upcasters].add(Renamed, from_version=2, upcaster=add_currency)
+    stream_id = stored(backend, {"name": "John"}, {})
+
+    with pytest.raises(MissingUpcaster) as error:
+        event_store.load_stream(stream_id)
+
+    assert error.value.from_version == 1
+
+
+def test_resolves_upcaster_chain_once_per_batch(backend: Backend) -> None:
+    backend[Upcasters] = upcasters = CountingUpcasters()
+    upcasters.add(Renamed, from_version=1, upcaster=split_name)
+    upcasters.add(Renamed, from_version=2, upcaster=add_currency)
+    stream_id = stored(backend, {"name": "John"}, {}, count=3)
+
+    loaded = backend.event_store.load_stream(stream_id)
+
+    assert [e.event for e in loaded] == [Renamed(full_name="John", currency="EUR")] * 3
+    assert upcasters.chains == 1
+
+
+def test_decrypts_upcasted_encrypted_fields(backend: Backend, given: Given) -> None:
+    strategy = XorEncryptionStrategy()
+    backend.with_encryption(strategy, InMemoryKeyStorage())
+    backend[Upcasters].add(Registered, 1, rename_owner_and_contact)
+    given.encryption.store(b"key", for_subject="user")
+    stream_id = stored(
+        backend,
+        {"owner": "user", "contact": strategy.encrypt("john@example.com", b"key")},
+        {},
+        of=Registered,
+    )
+
+    [loaded] = backend.event_store.load_stream(stream_id)
+    [lazy] = backend.event_store.iter_stream(stream_id)
+
+    assert loaded.event == Registered(user_id="user", email="john@example.com")
+    assert lazy.event == loaded.event
+
+
+def test_composes_chain_once() -> None:
+    upcasters = Upcasters()
+    upcasters.add("Renamed", from_version=1, upcaster=split_name)
+    upcasters.add("Renamed", from_version=2, upcaster=add_currency)
+
+    chain = upcasters.chain("Renamed", from_version=1, to_version=3)
+
+    assert upcasters.chain("Renamed", from_version=1, to_version=3) is chain
+    assert chain({"name": "John"}) == {"full_name": "John", "currency": "EUR"}
+
+
+def test_rejects_duplicated_upcaster() -> None:
+    upcasters = Upcasters()
+    upcasters.add("Renamed", from_version=1, upcaster=split_name)
+
+    with pytest.raises(DuplicatedUpcaster):
+        upcasters.add("Renamed", from_version=1, upcaster=add_currency)
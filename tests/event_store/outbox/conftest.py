@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Callable, Generator, Iterator
 from pathlib import Path
 from unittest.mock import Mock
@@ -15,6 +16,7 @@ from event_sourcery_kurrentdb import KurrentDBBackend, KurrentDBConfig
 from event_sourcery_sqlalchemy import SQLAlchemyBackend, SQLAlchemyConfig
 from tests.backend.kurrentdb import kurrentdb_client
 from tests.backend.sqlalchemy import (
+    sqlalchemy_async_session,
     sqlalchemy_postgres_session,
     sqlalchemy_sqlite_session,
 )
@@ -69,11 +71,53 @@ def sqlalchemy_postgres_backend(max_attempts: int) -> Iterator[SQLAlchemyBackend
         )
 
 
+@pytest.fixture()
+def sqlalchemy_sqlite_async_backend(
+    tmp_path: Path,
+    loop: asyncio.AbstractEventLoop,
+    max_attempts: int,
+) -> Iterator[SQLAlchemyBackend]:
+    pytest.importorskip("aiosqlite")
+    with (
+        sqlalchemy_sqlite_session(tmp_path),
+        sqlalchemy_async_session(
+            f"sqlite+aiosqlite:///{tmp_path / 'sqlite.db'}",
+            loop,
+        ) as session,
+    ):
+        yield SQLAlchemyBackend().configure(
+            session, SQLAlchemyConfig(outbox_attempts=max_attempts)
+        )
+
+
+@pytest.fixture()
+def sqlalchemy_postgres_async_backend(
+    loop: asyncio.AbstractEventLoop,
+    max_attempts: int,
+) -> Iterator[SQLAlchemyBackend]:
+    pytest.importorskip("asyncpg")
+    with (
+        sqlalchemy_postgres_session(),
+        sqlalchemy_async_session(
+            "postgresql+asyncpg://es:es@localhost:5432/es",
+            loop,
+        ) as session,
+    ):
+        yield SQLAlchemyBackend().configure(
+            session, SQLAlchemyConfig(outbox_attempts=max_attempts)
+        )
+
+
 @pytest.fixture()
 def backend(backend: Backend) -> Backend:
     return backend.with_outbox()
 
 
+@pytest.fixture()
+def async_backend(async_backend: Backend) -> Backend:
+    return async_backend.with_outbox()
+
+
 class PublisherMock(Mock):
     __call__: Callable[[WrappedEvent, StreamId], None]
 
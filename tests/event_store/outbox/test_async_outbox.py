@@ -0,0 +1,79 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from event_sourcery import Backend, StreamId
+from event_sourcery.event import RecordedRaw
+from tests.conftest import Run
+from tests.factories import an_event
+from tests.matchers import any_record
+
+pytestmark = pytest.mark.skip_backend(
+    backend="kurrentdb_async_backend",
+    reason="KurrentDB outbox relies on a synchronous persistent subscription",
+)
+
+
+def test_no_calls_when_outbox_is_empty(async_backend: Backend, run: Run) -> None:
+    publisher = AsyncMock()
+
+    run(async_backend.async_outbox.run(publisher))
+
+    publisher.assert_not_awaited()
+
+
+def test_publishes_appended_events(async_backend: Backend, run: Run) -> None:
+    publisher = AsyncMock()
+    stream_id = StreamId(uuid4())
+    run(
+        async_backend.async_event_store.append(
+            first := an_event(version=1),
+            second := an_event(version=2),
+            stream_id=stream_id,
+        )
+    )
+
+    for _ in range(2):
+        run(async_backend.async_outbox.run(publisher))
+
+    assert publisher.await_args_list == [
+        ((any_record(first, stream_id),),),
+        ((any_record(second, stream_id),),),
+    ]
+
+
+def test_tries_to_publish_up_to_max_attempts(
+    async_backend: Backend,
+    run: Run,
+    max_attempts: int,
+) -> None:
+    publisher = AsyncMock(side_effect=ValueError)
+    run(
+        async_backend.async_event_store.append(
+            an_event(version=1),
+            stream_id=StreamId(uuid4()),
+        )
+    )
+
+    for _ in range(max_attempts + 1):
+        run(async_backend.async_outbox.run(publisher))
+
+    assert publisher.await_count == max_attempts
+
+
+def test_publishes_raw_records(async_backend: Backend, run: Run) -> None:
+    publisher = AsyncMock()
+    stream_id = StreamId(uuid4())
+    run(
+        async_backend.async_event_store.append(
+            event := an_event(version=1),
+            stream_id=stream_id,
+        )
+    )
+
+    run(async_backend.async_outbox.run_raw(publisher))
+
+    (record,) = publisher.await_args_list[0].args
+    assert isinstance(record, RecordedRaw)
+    assert (record.entry.uuid, record.entry.stream_id) == (event.uuid, stream_id)
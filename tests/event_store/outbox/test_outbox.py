@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 from event_sourcery import Backend, StreamId
+from event_sourcery.event import RecordedRaw
 from tests.event_store.outbox.conftest import PublisherMock
 from tests.factories import an_event
 from tests.matchers import any_record
@@ -73,3 +74,15 @@ def test_tries_to_send_up_to_three_times(
         backend.outbox.run(publisher)
 
     assert len(publisher.mock_calls) == max_attempts
+
+
+def test_publishes_raw_records(publisher: PublisherMock, backend: Backend) -> None:
+    stream_id = StreamId(uuid4())
+    backend.event_store.append(event := an_event(version=1), stream_id=stream_id)
+
+    backend.outbox.run_raw(publisher)
+
+    (record,) = publisher.call_args.args
+    assert isinstance(record, RecordedRaw)
+    assert (record.entry.uuid, record.entry.stream_id) == (event.uuid, stream_id)
+    assert record.entry.data == event.event.model_dump(mode="json")
@@ -66,3 +66,16 @@ def test_receives_events_from_all_tenants(given: Given, when: When, then: Then)
             any_record(third, for_tenant="third"),
         ]
     )
+
+
+def test_receives_lazily_decoded_batch(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    subscription = given.batch_subscription(of_size=2, lazy=True)
+    when.stream().receives(first := an_event(), second := an_event())
+
+    batch = then(subscription).next_batch_is_not_decoded()
+
+    assert batch == [any_record(first), any_record(second)]
@@ -0,0 +1,71 @@
+import pytest
+
+from event_sourcery import StreamId
+from event_sourcery.exceptions import ConcurrentStreamWriteError
+from tests.bdd import Given, Then, When
+from tests.factories import AnEvent, an_event
+
+
+def test_appends_to_many_streams_at_once(given: Given, when: When, then: Then) -> None:
+    given.stream(first_id := StreamId())
+    given.stream(second_id := StreamId(name="second"))
+
+    when.store.append_many(
+        {
+            first_id: ([first := an_event(version=1)], 0),
+            second_id: (
+                [second := an_event(version=1), third := an_event(version=2)],
+                0,
+            ),
+        }
+    )
+
+    then.stream(first_id).loads_only([first])
+    then.stream(second_id).loads_only([second, third])
+
+
+def test_appends_bare_events_to_many_streams(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(first_id := StreamId())
+    given.stream(second_id := StreamId())
+    given.event(an_event(version=1), on=second_id)
+
+    when.store.append_many(
+        {
+            first_id: ([first := AnEvent()], 0),
+            second_id: ([second := AnEvent()], 1),
+        }
+    )
+
+    then.stream(first_id).loads([first])
+    assert [e.version for e in then.stream(second_id).events] == [1, 2]
+    assert then.stream(second_id).events[-1].event == second
+
+
+def test_appends_nothing_when_any_stream_version_does_not_match(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(up_to_date_id := StreamId())
+    given.stream(outdated_id := StreamId())
+    given.event(first := an_event(version=1), on=up_to_date_id)
+    given.events(
+        second := an_event(version=1),
+        third := an_event(version=2),
+        on=outdated_id,
+    )
+
+    with pytest.raises(ConcurrentStreamWriteError):
+        when.store.append_many(
+            {
+                up_to_date_id: ([an_event(version=2)], 1),
+                outdated_id: ([an_event(version=2)], 1),
+            }
+        )
+
+    then.stream(up_to_date_id).loads_only([first])
+    then.stream(outdated_id).loads_only([second, third])
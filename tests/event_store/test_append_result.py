@@ -0,0 +1,61 @@
+from event_sourcery import NO_VERSIONING, StreamId
+from tests.bdd import Given, Then, When
+from tests.factories import AnEvent, an_event
+
+
+def test_returns_version_and_position_of_last_event(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(stream_id := StreamId(category="appended"))
+    given.event(an_event(version=1), on=stream_id)
+
+    result = when.store.append(
+        an_event(version=2),
+        an_event(version=3),
+        stream_id=stream_id,
+        expected_version=1,
+    )
+
+    last_record = list(then.store.scan_category("appended"))[-1]
+    assert result.version == 3
+    assert result.position == last_record.position
+    assert result.position == then.store.position
+
+
+def test_returns_increasing_positions(when: When) -> None:
+    first = when.store.append(an_event(version=1), stream_id=StreamId())
+    second = when.store.append(an_event(version=1), stream_id=StreamId())
+
+    assert first.position is not None
+    assert second.position is not None
+    assert first.position < second.position
+
+
+def test_returns_no_version_for_versionless_stream(when: When) -> None:
+    result = when.store.append(
+        AnEvent(),
+        stream_id=StreamId(),
+        expected_version=NO_VERSIONING,
+    )
+
+    assert result.version is None
+    assert result.position is not None
+
+
+def test_returns_result_for_each_of_many_streams(given: Given, when: When) -> None:
+    given.stream(first_id := StreamId())
+    given.event(an_event(version=1), on=first_id)
+
+    results = when.store.append_many(
+        {
+            first_id: ([an_event(version=2)], 1),
+            (second_id := StreamId()): ([AnEvent(), AnEvent()], 0),
+            StreamId(): ([], 0),
+        }
+    )
+
+    assert list(results) == [first_id, second_id]
+    assert results[first_id].version == 2
+    assert results[second_id].version == 2
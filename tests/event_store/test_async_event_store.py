@@ -0,0 +1,174 @@
+from collections.abc import AsyncIterator
+from typing import TypeVar
+
+import pytest
+
+from event_sourcery import NO_VERSIONING, AsyncEventStore, StreamId
+from event_sourcery.exceptions import ConcurrentStreamWriteError
+from tests.conftest import Run
+from tests.factories import AnEvent, a_snapshot, an_event
+
+T = TypeVar("T")
+
+
+async def collect(iterator: AsyncIterator[T]) -> list[T]:
+    return [item async for item in iterator]
+
+
+def test_appends_and_loads_stream(async_event_store: AsyncEventStore, run: Run) -> None:
+    events = [an_event(version=1), an_event(version=2)]
+
+    run(async_event_store.append(*events, stream_id=(stream_id := StreamId())))
+
+    assert run(async_event_store.load_stream(stream_id)) == events
+
+
+def test_appends_bare_events(async_event_store: AsyncEventStore, run: Run) -> None:
+    run(
+        async_event_store.append(
+            first := AnEvent(), stream_id=(stream_id := StreamId())
+        )
+    )
+    run(
+        async_event_store.append(
+            second := AnEvent(), stream_id=stream_id, expected_version=1
+        )
+    )
+
+    loaded = run(async_event_store.load_stream(stream_id))
+
+    assert [(e.event, e.version) for e in loaded] == [(first, 1), (second, 2)]
+
+
+def test_appends_to_versionless_stream(
+    async_event_store: AsyncEventStore,
+    run: Run,
+) -> None:
+    stream_id = StreamId()
+    for event in (first := AnEvent(), second := AnEvent()):
+        run(
+            async_event_store.append(
+                event,
+                stream_id=stream_id,
+                expected_version=NO_VERSIONING,
+            )
+        )
+
+    loaded = run(async_event_store.load_stream(stream_id))
+
+    assert [e.event for e in loaded] == [first, second]
+
+
+def test_raises_on_concurrent_write(
+    async_event_store: AsyncEventStore,
+    run: Run,
+) -> None:
+    run(
+        async_event_store.append(
+            an_event(version=1), stream_id=(stream_id := StreamId())
+        )
+    )
+
+    with pytest.raises(ConcurrentStreamWriteError):
+        run(
+            async_event_store.append(
+                an_event(version=2),
+                stream_id=stream_id,
+                expected_version=2,
+            )
+        )
+
+
+def test_iterates_from_latest_snapshot(
+    async_event_store: AsyncEventStore,
+    run: Run,
+) -> None:
+    stream_id = StreamId()
+    run(
+        async_event_store.append(
+            an_event(version=1), an_event(version=2), stream_id=stream_id
+        )
+    )
+    run(async_event_store.save_snapshot(stream_id, snapshot := a_snapshot(version=2)))
+    after_snapshot = [an_event(version=3), an_event(version=4), an_event(version=5)]
+    run(
+        async_event_store.append(
+            *after_snapshot, stream_id=stream_id, expected_version=2
+        )
+    )
+
+    iterated = run(collect(async_event_store.iter_stream(stream_id, page_size=2)))
+
+    assert iterated == [snapshot, *after_snapshot]
+
+
+def test_appends_and_loads_many_streams(
+    async_event_store: AsyncEventStore,
+    run: Run,
+) -> None:
+    run(
+        async_event_store.append_many(
+            {
+                (first_id := StreamId()): ([first := an_event(version=1)], 0),
+                (second_id := StreamId()): ([second := an_event(version=1)], 0),
+            }
+        )
+    )
+
+    loaded = run(async_event_store.load_streams([first_id, second_id]))
+
+    assert loaded == {first_id: [first], second_id: [second]}
+
+
+def test_deletes_stream(async_event_store: AsyncEventStore, run: Run) -> None:
+    run(
+        async_event_store.append(
+            an_event(version=1), stream_id=(stream_id := StreamId())
+        )
+    )
+
+    run(async_event_store.delete_stream(stream_id))
+
+    assert run(async_event_store.load_stream(stream_id)) == []
+
+
+def test_describes_stream(async_event_store: AsyncEventStore, run: Run) -> None:
+    run(
+        async_event_store.append(
+            an_event(version=1),
+            an_event(version=2),
+            stream_id=(stream_id := StreamId()),
+        )
+    )
+
+    info = run(async_event_store.stream_info(stream_id))
+
+    assert info is not None
+    assert (info.version, info.event_count) == (2, 2)
+
+
+def test_scans_category(async_event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId(category="scanned")
+    run(async_event_store.append(first := an_event(version=1), stream_id=stream_id))
+    run(
+        async_event_store.append(
+            second := an_event(version=2), stream_id=stream_id, expected_version=1
+        )
+    )
+
+    records = run(collect(async_event_store.scan_category("scanned", page_size=1)))
+
+    assert [r.wrapped_event for r in records] == [first, second]
+
+
+def test_returns_append_result(async_event_store: AsyncEventStore, run: Run) -> None:
+    result = run(
+        async_event_store.append(
+            an_event(version=1),
+            an_event(version=2),
+            stream_id=StreamId(),
+        )
+    )
+
+    assert result.version == 2
+    assert result.position == run(async_event_store.position())
@@ -0,0 +1,169 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session
+
+from event_sourcery import Backend, EventStore, GroupCommitEventStore, StreamId
+from event_sourcery.exceptions import ConcurrentStreamWriteError
+from event_sourcery_sqlalchemy import SQLAlchemyBackend
+from tests.bdd import Given, Then
+from tests.factories import an_event
+
+pytestmark = pytest.mark.skip_backend(
+    backend="django_backend",
+    reason="Django connections are per thread",
+)
+
+
+@pytest.fixture()
+def transaction(backend: Backend) -> Callable[[], AbstractContextManager[Any]]:
+    if isinstance(backend, SQLAlchemyBackend):
+        return backend[Session].begin_nested
+    return nullcontext
+
+
+@pytest.fixture()
+def group_commit(
+    event_store: EventStore,
+    transaction: Callable[[], AbstractContextManager[Any]],
+) -> Iterator[GroupCommitEventStore]:
+    with GroupCommitEventStore(
+        event_store,
+        transaction,
+        window=timedelta(seconds=0.2),
+    ) as store:
+        yield store
+
+
+def test_appends_from_many_threads(
+    group_commit: GroupCommitEventStore,
+    then: Then,
+) -> None:
+    streams = {StreamId(): an_event(version=1) for _ in range(10)}
+
+    with ThreadPoolExecutor(max_workers=len(streams)) as executor:
+        for stream_id, event in streams.items():
+            executor.submit(group_commit.append, event, stream_id=stream_id)
+
+    for stream_id, event in streams.items():
+        then.stream(stream_id).loads_only([event])
+
+
+def test_fails_only_appends_with_mismatched_version(
+    given: Given,
+    group_commit: GroupCommitEventStore,
+    then: Then,
+) -> None:
+    given.stream(valid_id := StreamId())
+    given.stream(outdated_id := StreamId())
+    given.event(first := an_event(version=1), on=valid_id)
+    given.event(second := an_event(version=1), on=outdated_id)
+
+    valid = group_commit.submit(
+        third := an_event(version=2), stream_id=valid_id, expected_version=1
+    )
+    outdated = group_commit.submit(
+        an_event(version=3), stream_id=outdated_id, expected_version=2
+    )
+
+    assert valid.result().version == 2
+    with pytest.raises(ConcurrentStreamWriteError):
+        outdated.result()
+    then.stream(valid_id).loads_only([first, third])
+    then.stream(outdated_id).loads_only([second])
+
+
+def test_appends_to_same_stream_in_order(
+    group_commit: GroupCommitEventStore,
+    then: Then,
+) -> None:
+    futures = [
+        group_commit.submit(
+            first := an_event(version=1), stream_id=(stream_id := StreamId())
+        ),
+        group_commit.submit(
+            second := an_event(version=2), stream_id=stream_id, expected_version=1
+        ),
+    ]
+
+    for future in futures:
+        future.result()
+    then.stream(stream_id).loads_only([first, second])
+
+
+def test_writes_group_in_single_transaction(event_store: EventStore) -> None:
+    transactions = []
+
+    @contextmanager
+    def transaction() -> Iterator[None]:
+        transactions.append(True)
+        yield
+
+    with GroupCommitEventStore(
+        event_store,
+        transaction,
+        window=timedelta(seconds=10),
+        max_events=3,
+    ) as group_commit:
+        futures = [
+            group_commit.submit(an_event(version=1), stream_id=StreamId())
+            for _ in range(3)
+        ]
+        for future in futures:
+            future.result()
+
+    assert len(transactions) == 1
+
+
+def test_rejects_appends_once_closed(event_store: EventStore) -> None:
+    group_commit = GroupCommitEventStore(event_store)
+    group_commit.close()
+
+    with pytest.raises(RuntimeError):
+        group_commit.append(an_event(), stream_id=StreamId())
+
+
+class WriterStopped(BaseException):
+    pass
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_fails_pending_appends_when_writer_stops(event_store: EventStore) -> None:
+    @contextmanager
+    def stopping_transaction() -> Iterator[None]:
+        raise WriterStopped
+        yield
+
+    group_commit = GroupCommitEventStore(
+        event_store,
+        stopping_transaction,
+        window=timedelta(seconds=0.2),
+    )
+    futures = [
+        group_commit.submit(an_event(version=1), stream_id=StreamId()) for _ in range(2)
+    ]
+
+    for future in futures:
+        with pytest.raises(WriterStopped):
+            future.result(timeout=5)
+    group_commit.close()
+    with pytest.raises(RuntimeError):
+        group_commit.submit(an_event(), stream_id=StreamId())
+
+
+def test_skips_cancelled_appends(
+    group_commit: GroupCommitEventStore,
+    then: Then,
+) -> None:
+    cancelled = group_commit.submit(an_event(version=1), stream_id=StreamId())
+    assert cancelled.cancel()
+    written = group_commit.submit(
+        event := an_event(version=1), stream_id=(stream_id := StreamId())
+    )
+
+    assert written.result(timeout=5).version == 1
+    then.stream(stream_id).loads_only([event])
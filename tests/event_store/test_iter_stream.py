@@ -0,0 +1,64 @@
+import pytest
+
+from event_sourcery import NO_VERSIONING, StreamId
+from tests.bdd import Given, Then, When
+from tests.factories import AnEvent, a_snapshot, an_event
+
+
+def test_iterates_over_stream_in_pages(given: Given, then: Then) -> None:
+    given.stream(stream_id := StreamId())
+    events = [an_event(version=version) for version in range(1, 8)]
+    given.events(*events, on=stream_id)
+
+    iterated = list(then.store.iter_stream(stream_id, page_size=3))
+
+    assert iterated == events
+
+
+def test_iterates_over_given_range(given: Given, then: Then) -> None:
+    given.stream(stream_id := StreamId())
+    events = [an_event(version=version) for version in range(1, 8)]
+    given.events(*events, on=stream_id)
+
+    iterated = list(then.store.iter_stream(stream_id, start=2, stop=6, page_size=2))
+
+    assert iterated == events[1:5]
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 100])
+def test_iterates_from_latest_snapshot(
+    given: Given,
+    then: Then,
+    page_size: int,
+) -> None:
+    given.stream(stream_id := StreamId())
+    given.events(an_event(version=1), an_event(version=2), on=stream_id)
+    given.snapshot(snapshot := a_snapshot(version=2), on=stream_id)
+    given.events(
+        third := an_event(version=3),
+        fourth := an_event(version=4),
+        on=stream_id,
+    )
+
+    iterated = list(then.store.iter_stream(stream_id, page_size=page_size))
+
+    assert iterated == [snapshot, third, fourth]
+
+
+def test_iterates_over_versionless_stream(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(stream_id := StreamId())
+    events = [AnEvent() for _ in range(5)]
+    for event in events:
+        when.store.append(event, stream_id=stream_id, expected_version=NO_VERSIONING)
+
+    iterated = then.store.iter_stream(stream_id, page_size=2)
+
+    assert [wrapped.event for wrapped in iterated] == events
+
+
+def test_iterates_over_nothing_for_not_existing_stream(then: Then) -> None:
+    assert list(then.store.iter_stream(StreamId())) == []
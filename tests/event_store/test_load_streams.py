@@ -0,0 +1,73 @@
+from event_sourcery import NO_VERSIONING, StreamId
+from tests.bdd import Given, Then, When
+from tests.factories import AnEvent, a_snapshot, an_event
+
+
+def test_loads_many_streams_at_once(given: Given, then: Then) -> None:
+    given.stream(first_id := StreamId())
+    given.stream(second_id := StreamId(name="second"))
+    given.events(first := an_event(), second := an_event(), on=first_id)
+    given.event(third := an_event(), on=second_id)
+
+    loaded = then.store.load_streams([first_id, second_id])
+
+    assert loaded == {first_id: [first, second], second_id: [third]}
+
+
+def test_loads_streams_with_same_id_in_other_categories_apart(
+    given: Given,
+    then: Then,
+) -> None:
+    given.stream(shop_id := StreamId(category="shop"))
+    given.stream(warehouse_id := StreamId(uuid=shop_id, category="warehouse"))
+    given.event(shop := an_event(), on=shop_id)
+    given.event(warehouse := an_event(), on=warehouse_id)
+
+    loaded = then.store.load_streams([shop_id, warehouse_id])
+
+    assert loaded == {shop_id: [shop], warehouse_id: [warehouse]}
+
+
+def test_loads_not_existing_streams_as_empty(given: Given, then: Then) -> None:
+    given.stream(existing_id := StreamId())
+    given.event(event := an_event(), on=existing_id)
+
+    loaded = then.store.load_streams([existing_id, not_existing_id := StreamId()])
+
+    assert loaded == {existing_id: [event], not_existing_id: []}
+
+
+def test_loads_each_stream_from_its_latest_snapshot(given: Given, then: Then) -> None:
+    given.stream(snapshotted_id := StreamId())
+    given.stream(plain_id := StreamId())
+    given.events(an_event(), an_event(), on=snapshotted_id)
+    given.snapshot(a_snapshot(), on=snapshotted_id)
+    given.snapshot(snapshot := a_snapshot(), on=snapshotted_id)
+    given.event(after_snapshot := an_event(), on=snapshotted_id)
+    given.events(first := an_event(), second := an_event(), on=plain_id)
+
+    loaded = then.store.load_streams([snapshotted_id, plain_id])
+
+    assert loaded == {
+        snapshotted_id: [snapshot, after_snapshot],
+        plain_id: [first, second],
+    }
+
+
+def test_loads_versionless_streams(given: Given, when: When, then: Then) -> None:
+    given.stream(stream_id := StreamId())
+    events = [AnEvent(), AnEvent()]
+    for event in events:
+        when.store.append(event, stream_id=stream_id, expected_version=NO_VERSIONING)
+
+    loaded = then.store.load_streams([stream_id])
+
+    assert [wrapped.event for wrapped in loaded[stream_id]] == events
+
+
+def test_loads_only_streams_of_current_tenant(given: Given, then: Then) -> None:
+    given.in_tenant_mode("tenant").event(an_event(), on=(stream_id := StreamId()))
+
+    loaded = then.without_tenant().store.load_streams([stream_id])
+
+    assert loaded == {stream_id: []}
@@ -0,0 +1,77 @@
+import pytest
+
+from event_sourcery import DEFAULT_TENANT, StreamId
+from tests.bdd import Given, Then, When
+from tests.factories import an_event
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 100])
+def test_scans_events_of_category_in_position_order(
+    given: Given,
+    then: Then,
+    page_size: int,
+) -> None:
+    given.stream(first_id := StreamId(category="scanned"))
+    given.stream(second_id := StreamId(category="scanned"))
+    given.stream(other_id := StreamId(category="other"))
+    given.event(first := an_event(version=1), on=first_id)
+    given.event(an_event(version=1), on=other_id)
+    given.event(second := an_event(version=1), on=second_id)
+    given.event(third := an_event(version=2), on=first_id)
+
+    records = list(then.store.scan_category("scanned", page_size=page_size))
+
+    assert [r.wrapped_event for r in records] == [first, second, third]
+    assert [r.stream_id for r in records] == [first_id, second_id, first_id]
+    assert [r.position for r in records] == sorted(r.position for r in records)
+
+
+def test_resumes_scan_after_position(given: Given, then: Then) -> None:
+    given.stream(stream_id := StreamId(category="scanned"))
+    given.events(
+        an_event(version=1),
+        an_event(version=2),
+        third := an_event(version=3),
+        on=stream_id,
+    )
+    second_record = list(then.store.scan_category("scanned"))[1]
+
+    records = then.store.scan_category("scanned", after_position=second_record.position)
+
+    assert [r.wrapped_event for r in records] == [third]
+
+
+def test_scans_events_of_all_tenants_or_given_one(given: Given, then: Then) -> None:
+    given.in_tenant_mode("tenant").event(
+        in_tenant := an_event(), on=StreamId(category="scanned")
+    )
+    given.event(without_tenant := an_event(), on=StreamId(category="scanned"))
+
+    all_records = list(then.store.scan_category("scanned"))
+    tenant_records = list(then.store.scan_category("scanned", tenant_id="tenant"))
+
+    assert [(r.wrapped_event, r.tenant_id) for r in all_records] == [
+        (in_tenant, "tenant"),
+        (without_tenant, DEFAULT_TENANT),
+    ]
+    assert [r.wrapped_event for r in tenant_records] == [in_tenant]
+
+
+def test_doesnt_scan_events_of_deleted_streams(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(deleted_id := StreamId(category="scanned"))
+    given.stream(kept_id := StreamId(category="scanned"))
+    given.event(an_event(), on=deleted_id)
+    given.event(kept := an_event(), on=kept_id)
+
+    when.deletes(deleted_id)
+
+    records = then.store.scan_category("scanned")
+    assert [r.wrapped_event for r in records] == [kept]
+
+
+def test_scans_nothing_for_empty_category(then: Then) -> None:
+    assert list(then.store.scan_category("empty")) == []
@@ -0,0 +1,57 @@
+from event_sourcery import NO_VERSIONING, StreamId
+from tests.bdd import Given, Then, When
+from tests.factories import AnEvent, a_snapshot, an_event
+
+
+def test_describes_stream_without_loading_events(given: Given, then: Then) -> None:
+    given.stream(stream_id := StreamId(name="described"))
+    given.events(
+        first := an_event(version=1),
+        an_event(version=2),
+        last := an_event(version=3),
+        on=stream_id,
+    )
+
+    info = then.store.stream_info(stream_id)
+
+    assert info is not None
+    assert info.stream_id == stream_id
+    assert info.version == 3
+    assert info.event_count == 3
+    assert info.created_at == first.created_at
+    assert info.updated_at == last.created_at
+    assert info.snapshot_version is None
+
+
+def test_describes_latest_snapshot(given: Given, then: Then) -> None:
+    given.stream(stream_id := StreamId())
+    given.events(an_event(version=1), an_event(version=2), on=stream_id)
+    given.snapshot(a_snapshot(version=1), on=stream_id)
+    given.snapshot(a_snapshot(version=2), on=stream_id)
+    given.event(an_event(version=3), on=stream_id)
+
+    info = then.store.stream_info(stream_id)
+
+    assert info is not None
+    assert (info.version, info.event_count, info.snapshot_version) == (3, 3, 2)
+
+
+def test_describes_versionless_stream(given: Given, when: When, then: Then) -> None:
+    given.stream(stream_id := StreamId())
+    for event in (AnEvent(), AnEvent()):
+        when.store.append(event, stream_id=stream_id, expected_version=NO_VERSIONING)
+
+    info = then.store.stream_info(stream_id)
+
+    assert info is not None
+    assert info.event_count == 2
+
+
+def test_describes_not_existing_stream_as_none(then: Then) -> None:
+    assert then.store.stream_info(StreamId()) is None
+
+
+def test_describes_only_streams_of_current_tenant(given: Given, then: Then) -> None:
+    given.in_tenant_mode("tenant").event(an_event(), on=(stream_id := StreamId()))
+
+    assert then.without_tenant().store.stream_info(stream_id) is None